@@ -0,0 +1,19 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Benchmarks of humanreadable: ``python -m benchmarks --help``
+"""
+
+from ._runner import Benchmark, Regression, compare_results, load_results, run, save_results
+from .cases import make_benchmarks
+
+
+__all__ = (
+    "Benchmark",
+    "Regression",
+    "compare_results",
+    "load_results",
+    "make_benchmarks",
+    "run",
+    "save_results",
+)
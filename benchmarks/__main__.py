@@ -0,0 +1,95 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import argparse
+import sys
+from typing import Optional
+
+from ._runner import compare_results, load_results, run, save_results
+from .cases import make_benchmarks
+
+
+def parse_option(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the benchmarks of humanreadable and report nanoseconds per operation.",
+    )
+    parser.add_argument(
+        "-k", "--filter", metavar="PATTERN", help="regex pattern to select benchmarks by name"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="minimum timings per benchmark (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="minimum seconds to repeat timings per benchmark (default: %(default)s)",
+    )
+    parser.add_argument("--save", metavar="PATH", help="save the results to a JSON file")
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="compare the results with a JSON baseline, and exit with 1 if any regressed",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown ratio to report as a regression (default: %(default)s)",
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    options = parse_option(args)
+    benchmarks = make_benchmarks()
+
+    if options.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    baseline = None if options.compare is None else load_results(options.compare)
+
+    def print_result(name: str, ns: float) -> None:
+        line = f"{name:<56s} {ns:12.1f} ns/op"
+        if baseline is not None and name in baseline:
+            line += f" {ns / baseline[name] - 1:+8.1%}"
+        print(line, flush=True)
+
+    results = run(
+        benchmarks,
+        repeat=options.repeat,
+        min_time=options.min_time,
+        pattern=options.filter,
+        progress=print_result,
+    )
+
+    if options.save:
+        save_results(options.save, results)
+        print(f"saved {len(results)} results to {options.save}")
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_results(baseline, results, options.threshold)
+    if not regressions:
+        print(f"no regressions beyond {options.threshold:.0%} of {options.compare}")
+        return 0
+
+    print(f"\n{len(regressions)} regressions beyond {options.threshold:.0%} of {options.compare}:")
+    for regression in regressions:
+        print(
+            f"  {regression.name:<56s} {regression.baseline_ns:10.1f} -> "
+            f"{regression.current_ns:10.1f} ns/op ({regression.ratio - 1:+.1%})"
+        )
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
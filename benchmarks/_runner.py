@@ -0,0 +1,150 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Final, NamedTuple, Optional, Union
+
+
+RESULTS_FORMAT_VERSION: Final[int] = 1
+
+
+class Benchmark(NamedTuple):
+    """
+    A benchmark case.
+
+    ``setup`` is called before each timing to prepare fresh inputs,
+    so that caches of values do not carry over between timings,
+    and returns a function that performs ``ops`` operations.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    ops: int
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.1,
+    pattern: Optional[str] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+) -> dict[str, float]:
+    """
+    Run benchmarks.
+
+    Args:
+        benchmarks (Iterable[Benchmark]):
+            Benchmarks to run.
+        repeat (int):
+            Minimum number of timings per benchmark. The fastest timing is reported.
+        min_time (float):
+            Minimum seconds to repeat timings of a benchmark,
+            which makes the fastest timing less sensitive to noise.
+        pattern (Optional[str]):
+            Regex pattern to select benchmarks by name.
+        progress (Optional[Callable[[str, float], None]]):
+            Called with the name and the result of each benchmark.
+
+    Returns:
+        Nanoseconds per operation of each benchmark.
+    """
+
+    regexp = None if pattern is None else re.compile(pattern)
+    results: dict[str, float] = {}
+
+    for benchmark in benchmarks:
+        if regexp is not None and regexp.search(benchmark.name) is None:
+            continue
+
+        best = float("inf")
+        count = 0
+        deadline = time.perf_counter() + min_time
+        while count < repeat or time.perf_counter() < deadline:
+            count += 1
+            func = benchmark.setup()
+
+            # start each timing from the same state of the garbage collector,
+            # and exclude collections from the timing as timeit does
+            gc.collect()
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                func()
+                best = min(best, time.perf_counter_ns() - start)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+        results[benchmark.name] = best / benchmark.ops
+        if progress is not None:
+            progress(benchmark.name, results[benchmark.name])
+
+    return results
+
+
+def save_results(path: Union[str, "os.PathLike[str]"], results: Mapping[str, float]) -> None:
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "version": RESULTS_FORMAT_VERSION,
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": sys.platform,
+                "unit": "ns/op",
+                "results": dict(sorted(results.items())),
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def load_results(path: Union[str, "os.PathLike[str]"]) -> dict[str, float]:
+    with open(path, encoding="utf8") as f:
+        data = json.load(f)
+
+    if data.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"unsupported baseline version: {data.get('version')}")
+
+    return {name: float(ns) for name, ns in data["results"].items()}
+
+
+def compare_results(
+    baseline: Mapping[str, float], current: Mapping[str, float], threshold: float
+) -> list[Regression]:
+    """
+    Returns:
+        Benchmarks that are slower than the baseline by more than ``threshold``
+        (e.g. ``0.1`` for 10%), in descending order of the slowdown.
+    """
+
+    regressions = [
+        Regression(name, baseline[name], current_ns)
+        for name, current_ns in current.items()
+        if name in baseline and baseline[name] > 0 and current_ns > baseline[name] * (1 + threshold)
+    ]
+
+    return sorted(regressions, key=lambda regression: regression.ratio, reverse=True)
@@ -0,0 +1,265 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import functools
+import operator
+from collections.abc import Callable
+from typing import Any, Final
+
+from humanreadable import BitsPerSecond, ParameterError, Time
+from humanreadable._base import HumanReadableValue
+from humanreadable._common import expand_unit_specifier
+
+from ._runner import Benchmark
+
+
+_BATCH_SIZE: Final[int] = 1000
+_ADD_CHAIN_SIZE: Final[int] = 100
+
+_VALUE_CLASSES: Final[tuple[type[HumanReadableValue], ...]] = (Time, BitsPerSecond)
+
+_COMPOUND_TIMES: Final[dict[str, str]] = {
+    "hms": "1h 30m 15s",
+    "full": "2d 3h 4m 5s 6ms 7us",
+    "negative": "-1h 30m",
+    "fraction": "1.5h 0.25m",
+}
+
+_INVALID_VALUES: Final[dict[str, str]] = {
+    "no_number": "abc",
+    "unknown_unit": "10 parsecs",
+    "empty": "",
+}
+
+_COMPARISON_OPERATORS: Final[dict[str, Callable[[Any, Any], Any]]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+
+
+def _iter_aliases(cls: type[HumanReadableValue]) -> list[tuple[str, str]]:
+    # (unit name, alias) of the literal aliases of each unit
+    aliases = []
+    for unit, specifiers in cls.get_text_units().items():
+        seen: set[str] = set()
+        for specifier in specifiers:
+            for alias in expand_unit_specifier(specifier):
+                if alias not in seen:
+                    seen.add(alias)
+                    aliases.append((unit.name, alias))
+
+    return aliases
+
+
+def _make_values(cls: type[HumanReadableValue], unit: Any, count: int) -> list[Any]:
+    return [cls.from_value(i % 97 + 1.5, unit) for i in range(count)]
+
+
+def _make_parse_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+
+    for cls in _VALUE_CLASSES:
+        for unit_name, alias in _iter_aliases(cls):
+            values = [f"{i % 97 + 1.5} {alias}" for i in range(_BATCH_SIZE)]
+
+            def setup(cls=cls, values=values) -> Callable[[], Any]:
+                return lambda: [cls(value) for value in values]
+
+            benchmarks.append(
+                Benchmark(f"parse/{cls.__name__}/{unit_name}/{alias}", setup, _BATCH_SIZE)
+            )
+
+    for name, value in _COMPOUND_TIMES.items():
+        values = [value] * _BATCH_SIZE
+
+        def setup(values=values) -> Callable[[], Any]:
+            return lambda: [Time(value) for value in values]
+
+        benchmarks.append(Benchmark(f"parse/Time/compound/{name}", setup, _BATCH_SIZE))
+
+    return benchmarks
+
+
+def _make_error_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+
+    for cls in _VALUE_CLASSES:
+        for name, value in _INVALID_VALUES.items():
+
+            def setup(cls=cls, value=value) -> Callable[[], Any]:
+                def func() -> None:
+                    for _ in range(_BATCH_SIZE):
+                        try:
+                            cls(value)
+                        except (ParameterError, ValueError):
+                            pass
+
+                return func
+
+            benchmarks.append(Benchmark(f"error/{cls.__name__}/{name}", setup, _BATCH_SIZE))
+
+    return benchmarks
+
+
+def _make_convert_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+
+    for cls in _VALUE_CLASSES:
+        units = list(cls.get_text_units())
+        for from_unit in units:
+            for to_unit in units:
+
+                def setup(cls=cls, from_unit=from_unit, to_unit=to_unit) -> Callable[[], Any]:
+                    # fresh values: comparison keys are cached per instance
+                    values = _make_values(cls, from_unit, _BATCH_SIZE)
+                    return lambda: [value.get_as(to_unit) for value in values]
+
+                benchmarks.append(
+                    Benchmark(
+                        f"get_as/{cls.__name__}/{from_unit.name}/{to_unit.name}",
+                        setup,
+                        _BATCH_SIZE,
+                    )
+                )
+
+    return benchmarks
+
+
+def _make_compare_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+    pairs = {
+        "same_unit": (Time.Unit.SECOND, Time.Unit.SECOND),
+        "mixed_unit": (Time.Unit.MILLISECOND, Time.Unit.MINUTE),
+    }
+
+    for pair_name, (lhs_unit, rhs_unit) in pairs.items():
+        for op_name, op in _COMPARISON_OPERATORS.items():
+
+            def setup(lhs_unit=lhs_unit, rhs_unit=rhs_unit, op=op) -> Callable[[], Any]:
+                # fresh values: comparison keys are cached per instance
+                pairs = list(
+                    zip(
+                        _make_values(Time, lhs_unit, _BATCH_SIZE),
+                        reversed(_make_values(Time, rhs_unit, _BATCH_SIZE)),
+                    )
+                )
+                return lambda: [op(lhs, rhs) for lhs, rhs in pairs]
+
+            benchmarks.append(Benchmark(f"compare/Time/{pair_name}/{op_name}", setup, _BATCH_SIZE))
+
+    def setup_sort() -> Callable[[], Any]:
+        values = [
+            Time.from_value(i * 7919 % _BATCH_SIZE + 1, unit)
+            for i, unit in enumerate(list(Time.get_text_units()) * (_BATCH_SIZE // 6 + 1))
+        ][:_BATCH_SIZE]
+        return lambda: sorted(values)
+
+    benchmarks.append(Benchmark("compare/Time/sort", setup_sort, _BATCH_SIZE))
+
+    return benchmarks
+
+
+def _make_add_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+    chains = {
+        "same_unit": (Time, [Time.Unit.SECOND]),
+        "mixed_unit": (Time, [Time.Unit.SECOND, Time.Unit.MILLISECOND, Time.Unit.MINUTE]),
+        "bps": (BitsPerSecond, [BitsPerSecond.Unit.MBPS, BitsPerSecond.Unit.GBPS]),
+    }
+
+    for name, (cls, units) in chains.items():
+
+        def setup_chain(cls=cls, units=units) -> Callable[[], Any]:
+            values = [cls.from_value(i + 1, units[i % len(units)]) for i in range(_ADD_CHAIN_SIZE)]
+            return lambda: functools.reduce(operator.add, values)
+
+        def setup_sum(cls=cls, units=units) -> Callable[[], Any]:
+            values = [cls.from_value(i + 1, units[i % len(units)]) for i in range(_ADD_CHAIN_SIZE)]
+            return lambda: cls.sum(values)
+
+        benchmarks.append(Benchmark(f"add/{cls.__name__}/{name}", setup_chain, _ADD_CHAIN_SIZE))
+        benchmarks.append(Benchmark(f"sum/{cls.__name__}/{name}", setup_sum, _ADD_CHAIN_SIZE))
+
+    return benchmarks
+
+
+def _make_format_benchmarks() -> list[Benchmark]:
+    benchmarks = []
+    numbers = [(i * 7919 % 100_000) * 1.25 + 0.5 for i in range(_BATCH_SIZE)]
+
+    for style in ("full", "short", "abbr"):
+
+        def setup_time(style=style) -> Callable[[], Any]:
+            values = [Time.from_value(number, Time.Unit.SECOND) for number in numbers]
+            return lambda: [value.to_humanreadable(style=style) for value in values]
+
+        def setup_time_many(style=style) -> Callable[[], Any]:
+            values = [Time.from_value(number, Time.Unit.SECOND) for number in numbers]
+            return lambda: Time.format_many(values, style=style)
+
+        def setup_bps(style=style) -> Callable[[], Any]:
+            values = [BitsPerSecond.from_value(number**2, "bps") for number in numbers]
+            return lambda: [value.to_humanreadable(style=style) for value in values]
+
+        def setup_bps_many(style=style) -> Callable[[], Any]:
+            values = [number**2 for number in numbers]
+            return lambda: BitsPerSecond.format_many(values, style=style)
+
+        benchmarks.extend(
+            [
+                Benchmark(f"format/Time/{style}", setup_time, _BATCH_SIZE),
+                Benchmark(f"format_many/Time/{style}", setup_time_many, _BATCH_SIZE),
+                Benchmark(f"format/BitsPerSecond/{style}", setup_bps, _BATCH_SIZE),
+                Benchmark(f"format_many/BitsPerSecond/{style}", setup_bps_many, _BATCH_SIZE),
+            ]
+        )
+
+    return benchmarks
+
+
+def _make_validate_benchmarks() -> list[Benchmark]:
+    numbers = [(i * 7919 % 100_000) * 0.125 for i in range(_BATCH_SIZE)]
+
+    def setup_validate() -> Callable[[], Any]:
+        values = [Time.from_value(number, Time.Unit.MILLISECOND) for number in numbers]
+
+        def run() -> None:
+            for value in values:
+                try:
+                    value.validate("10ms", "5s")
+                except ParameterError:
+                    pass
+
+        return run
+
+    def setup_range() -> Callable[[], Any]:
+        value_range = Time.range("10ms", "5s")
+        values = [Time.from_value(number, Time.Unit.MILLISECOND) for number in numbers]
+        return lambda: value_range.mask(values)
+
+    def setup_range_numbers() -> Callable[[], Any]:
+        value_range = Time.range("10ms", "5s")
+        return lambda: value_range.mask(numbers, unit=Time.Unit.MILLISECOND)
+
+    return [
+        Benchmark("validate/Time/validate", setup_validate, _BATCH_SIZE),
+        Benchmark("validate/Time/range", setup_range, _BATCH_SIZE),
+        Benchmark("validate/Time/range_numbers", setup_range_numbers, _BATCH_SIZE),
+    ]
+
+
+def make_benchmarks() -> list[Benchmark]:
+    return (
+        _make_parse_benchmarks()
+        + _make_error_benchmarks()
+        + _make_convert_benchmarks()
+        + _make_compare_benchmarks()
+        + _make_add_benchmarks()
+        + _make_format_benchmarks()
+        + _make_validate_benchmarks()
+    )
@@ -0,0 +1,131 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Multi-thread scaling of parsing: ``python -m benchmarks.scaling --help``
+
+Scaling is close to linear on free-threaded builds of CPython (3.13t or later),
+while threads share a single interpreter lock on the other builds.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple, Optional
+
+from humanreadable import BitsPerSecond, Time
+
+
+class ScalingResult(NamedTuple):
+    threads: int
+    values_per_sec: float
+    speedup: float
+
+    @property
+    def efficiency(self) -> float:
+        return self.speedup / self.threads
+
+
+def _make_workloads(values_per_thread: int) -> dict[str, Callable[[], Any]]:
+    time_units = ["ms", "s", "m", "h", "us"]
+    bps_units = ["Kbps", "Mbps", "Gibps", "bps"]
+    times = [f"{i % 997}.{i % 10}{time_units[i % 5]}" for i in range(values_per_thread)]
+    bitrates = [f"{i % 997} {bps_units[i % 4]}" for i in range(values_per_thread)]
+
+    return {
+        # distinct values: parse_many parses each distinct value once
+        "parse_many/Time": lambda: Time.parse_many(times, "s"),
+        "parse_many/BitsPerSecond": lambda: BitsPerSecond.parse_many(bitrates, "Mbps"),
+        "init/Time": lambda: [Time(value).seconds for value in times],
+    }
+
+
+def _run_threads(workload: Callable[[], Any], num_threads: int) -> float:
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        workload()
+
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+
+    return time.perf_counter() - start
+
+
+def measure_scaling(
+    workload: Callable[[], Any],
+    values_per_thread: int,
+    thread_counts: Sequence[int],
+    repeat: int = 3,
+) -> list[ScalingResult]:
+    """
+    Run a workload in each of ``N`` threads at once for each ``N`` of ``thread_counts``.
+
+    Returns:
+        Throughput of each thread count and the speedup relative to the first thread count.
+    """
+
+    workload()  # warm up lazily built regexes and tables
+
+    results: list[ScalingResult] = []
+    for num_threads in thread_counts:
+        elapsed = min(_run_threads(workload, num_threads) for _ in range(repeat))
+        values_per_sec = values_per_thread * num_threads / elapsed
+        base = (
+            results[0].values_per_sec / results[0].threads
+            if results
+            else values_per_sec / num_threads
+        )
+        results.append(ScalingResult(num_threads, values_per_sec, values_per_sec / base))
+
+    return results
+
+
+def _is_gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scaling",
+        description="Measure the throughput of parsing in multiple threads.",
+    )
+    parser.add_argument(
+        "--threads",
+        default="1,2,4,8",
+        help="comma-separated numbers of threads (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--values", type=int, default=20_000, help="values per thread (default: %(default)s)"
+    )
+    parser.add_argument("-k", "--filter", metavar="SUBSTRING", help="select workloads by name")
+    options = parser.parse_args(args)
+
+    thread_counts = [int(count) for count in options.threads.split(",")]
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {_is_gil_enabled()}")
+
+    for name, workload in _make_workloads(options.values).items():
+        if options.filter and options.filter not in name:
+            continue
+
+        for result in measure_scaling(workload, options.values, thread_counts):
+            print(
+                f"{name:<28s} threads={result.threads:<3d} {result.values_per_sec:12.0f} values/s"
+                f"  speedup={result.speedup:5.2f}  efficiency={result.efficiency:6.1%}",
+                flush=True,
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,14 @@
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
+from ._cache import CacheInfo, ParseCache, disable_parse_cache, enable_parse_cache, get_parse_cache
+from ._instrument import (
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+)
+from ._pandas import register_pandas_accessor
 from ._persec import BitPerSecond, BitsPerSecond
+from ._range import ValueRange
 from ._time import Time
 from .error import ParameterError, UnitNotFoundError
 
@@ -12,7 +21,18 @@ __all__ = (
     "__version__",
     "BitPerSecond",
     "BitsPerSecond",
+    "CacheInfo",
+    "Instrumentation",
+    "ParseCache",
+    "disable_instrumentation",
+    "disable_parse_cache",
+    "enable_instrumentation",
+    "enable_parse_cache",
+    "get_instrumentation",
+    "get_parse_cache",
+    "register_pandas_accessor",
     "Time",
+    "ValueRange",
     "ParameterError",
     "UnitNotFoundError",
 )
@@ -3,25 +3,269 @@
 """
 
 import abc
+import math
+import numbers
+import os
 import re
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from decimal import Decimal
+from fractions import Fraction
 from re import Pattern
-from typing import Final, Optional, Union, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Optional, TypeVar, Union, cast
 
-from typepy import RealNumber, String
-
-from ._types import SupportsUnit, TextUnitsMap
+from . import _cache, _instrument
+from ._common import UnitResolver, expand_unit_specifier, get_decimal_context
+from ._types import ErrorHandler, ErrorPolicy, SupportsUnit, TextUnitsMap
 from .error import ParameterError, UnitNotFoundError
 
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import numpy as np
+
+    from ._range import ValueRange
+
+
+_T = TypeVar("_T", bound="HumanReadableValue")
+
 _RE_NUMBER: Final[Pattern] = re.compile(r"^[-\+]?[0-9\.]+$")
+_ITER_PARSE_MEMO_SIZE: Final[int] = 1024
+_ERROR_POLICIES: Final[tuple[ErrorPolicy, ...]] = ("raise", "skip", "nan")
+
+
+def _is_real_number(value: str) -> bool:
+    try:
+        return math.isfinite(float(value))
+    except ValueError:
+        return False
+
+
+def _to_decimal(number: Union[int, float, Decimal]) -> Decimal:
+    number_type = type(number)
+    if number_type is int:
+        return Decimal(number)
+
+    if number_type is float:
+        value = Decimal(repr(number))
+    elif isinstance(number, Decimal):
+        value = number
+    elif isinstance(number, bool):
+        raise TypeError("number must be an int, float, or Decimal: actual=bool")
+    elif isinstance(number, numbers.Integral):
+        value = Decimal(int(number))
+    elif isinstance(number, numbers.Real):
+        # the shortest representation, as a parsed string of the number would be
+        value = Decimal(repr(float(number)))
+    else:
+        raise TypeError(f"number must be an int, float, or Decimal: actual={type(number)}")
+
+    if not value.is_finite():
+        raise ParameterError("number must be finite", value=number)
+
+    return value
+
+
+def _to_exact_fraction(number: Any) -> Fraction:
+    # the exact value of a number, as Python compares numbers of different types:
+    # numbers that compare equal to a value hash equal to the value as well
+    if isinstance(number, bool):
+        raise TypeError("number must be an int, float, or Decimal: actual=bool")
+
+    if isinstance(number, (int, Decimal, Fraction)):
+        return Fraction(number)
+
+    if isinstance(number, numbers.Real):
+        return Fraction(float(number))
+
+    raise TypeError(f"number must be an int, float, or Decimal: actual={type(number)}")
+
+
+def _is_decimal_fraction(number: Fraction) -> bool:
+    denominator = number.denominator
+    for factor in (2, 5):
+        while denominator % factor == 0:
+            denominator //= factor
+
+    return denominator == 1
+
+
+def _normalize_key(key: Fraction) -> Union[int, Fraction]:
+    # integers compare and hash faster than fractions
+    if key.denominator == 1:
+        return key.numerator
+
+    return key
+
+
+def _strip_zeros(number: Decimal) -> Decimal:
+    # remove trailing zeros that arithmetic with coefficients adds, such as 1.500
+    if cast(int, number.as_tuple().exponent) >= 0:
+        return number
+
+    context = get_decimal_context()
+    normalized = number.normalize(context)
+    if cast(int, normalized.as_tuple().exponent) > 0:
+        # keep integers in plain notation (1000 instead of 1E+3)
+        return number.quantize(Decimal(1), context=context)
+
+    return normalized
+
+
+def _divide_to_float(dividend: Union[int, Fraction], divisor: Union[int, Fraction]) -> float:
+    # true division of integers is correctly rounded: exact up to the rounding to a float
+    return (dividend.numerator * divisor.denominator) / (dividend.denominator * divisor.numerator)
+
+
+def _split_decimal(number: Decimal) -> tuple[int, int]:
+    """
+    Returns:
+        The integer coefficient and the exponent of a finite decimal:
+        ``number == coefficient * 10 ** exponent``.
+    """
+
+    exponent = cast(int, number.as_tuple().exponent)
+    if exponent >= 0:
+        return (int(number) // 10**exponent, exponent)
+
+    # the denominator of the reduced ratio divides 10 ** -exponent
+    numerator, denominator = number.as_integer_ratio()
+    return (numerator * (10**-exponent // denominator), exponent)
+
+
+def _join_decimal(coefficient: int, exponent: int) -> Decimal:
+    # a string conversion is exact regardless of the decimal context
+    return Decimal(f"{coefficient:d}E{exponent:d}")
+
+
+def _restore_value(
+    cls: type["HumanReadableValue"],
+    coefficient: int,
+    exponent: int,
+    unit_code: int,
+    default_unit_code: Optional[int],
+) -> "HumanReadableValue":
+    # called by pickle with the arguments of __reduce__
+    code_units = cls._CODE_UNITS
+    value = cls._new(_join_decimal(coefficient, exponent), code_units[unit_code])
+    value._default_unit = None if default_unit_code is None else code_units[default_unit_code]
+
+    return value
 
 
 def _get_unit_msg(text_units: TextUnitsMap) -> str:
     return ", ".join([", ".join(values) for values in text_units.values()])
 
 
+def _validate_error_policy(on_error: str) -> None:
+    if on_error not in _ERROR_POLICIES:
+        raise ParameterError(
+            "invalid error policy",
+            expected=" or ".join(_ERROR_POLICIES),
+            value=on_error,
+        )
+
+
 class HumanReadableValue(metaclass=abc.ABCMeta):
+    """
+    Base class of human-readable values.
+
+    Instances keep their state in ``__slots__`` instead of a ``__dict__``:
+    an instance takes 64 bytes on 64-bit CPython (``sys.getsizeof``), in addition to the number,
+    which is shared with the parse cache, and the units, which are shared by all instances.
+    Subclasses must define ``__slots__`` as well.
+
+    Conversion coefficients between every pair of units are computed once
+    when a subclass is created.
+
+    Values are hashable and ordered by an exact comparison key: the number in the finest unit
+    of the class, which is computed once per instance and is an ``int`` for most values.
+    Values can also be compared with numbers in the base unit, and ordered against
+    human-readable strings. Strings never compare equal to values, as their hashes differ.
+    """
+
+    __slots__ = ("_number", "_from_unit", "_default_unit", "_key")
+
+    _TEXT_UNITS: ClassVar[TextUnitsMap]
+    _UNIT_RESOLVER: ClassVar[UnitResolver]
+    _BASE_UNIT: ClassVar[SupportsUnit]
+    _COEF_TABLE: ClassVar[Mapping[SupportsUnit, Mapping[SupportsUnit, Decimal]]]
+    _KEY_COEFS: ClassVar[Mapping[SupportsUnit, Fraction]]
+    _KEY_SCALE: ClassVar[Fraction]
+    _KEY_HASH_INVERSE: ClassVar[int]
+    _UNIT_CODES: ClassVar[Mapping[SupportsUnit, int]]
+    _CODE_UNITS: ClassVar[tuple[SupportsUnit, ...]]
+    _UNIT_ALIASES: ClassVar[Optional[Mapping[Any, SupportsUnit]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "_TEXT_UNITS" not in vars(cls):
+            return
+
+        units = list(cls._TEXT_UNITS)
+        cls._COEF_TABLE = MappingProxyType(
+            {
+                from_unit: MappingProxyType(
+                    {to_unit: cls._compute_coef(from_unit, to_unit) for to_unit in units}
+                )
+                for from_unit in units
+            }
+        )
+
+        # comparison keys are numbers in the finest unit, which are integers for most values
+        base_coefs = {unit: Fraction(cls._COEF_TABLE[unit][cls._BASE_UNIT]) for unit in units}
+        key_unit = min(units, key=base_coefs.__getitem__)
+        cls._KEY_COEFS = MappingProxyType(
+            {unit: base_coef / base_coefs[key_unit] for unit, base_coef in base_coefs.items()}
+        )
+        cls._KEY_SCALE = 1 / base_coefs[key_unit]
+        modulus = sys.hash_info.modulus
+        cls._KEY_HASH_INVERSE = (
+            cls._KEY_SCALE.denominator * pow(cls._KEY_SCALE.numerator, -1, modulus) % modulus
+        )
+
+        # small integer codes of units for pickles and binary encoding
+        cls._UNIT_CODES = MappingProxyType({unit: code for code, unit in enumerate(units)})
+        cls._CODE_UNITS = tuple(units)
+
+        # built on first use: building the index compiles the unit regexes
+        cls._UNIT_ALIASES = None
+
+    @classmethod
+    def __make_unit_aliases(cls) -> dict[Any, SupportsUnit]:
+        """
+        Returns:
+            Exact-match index of unit objects, unit names, and literal unit specifiers.
+            Keys are lower-cased if units are case-insensitive.
+        """
+
+        ignore_case = bool(cls._UNIT_RESOLVER.flags & re.IGNORECASE)
+        aliases: dict[Any, SupportsUnit] = {}
+
+        for unit, specifiers in cls._TEXT_UNITS.items():
+            aliases[unit] = unit
+
+            for alias in [unit.name] + [a for s in specifiers for a in expand_unit_specifier(s)]:
+                # only index aliases that the regex of the unit resolves to the same unit
+                if cls.__match_unit(alias) is not unit:
+                    continue
+
+                aliases.setdefault(alias.lower() if ignore_case else alias, unit)
+
+        return aliases
+
+    @classmethod
+    def __match_unit(cls, unit: str) -> Optional[SupportsUnit]:
+        for u in cls._TEXT_UNITS:
+            if u.regexp.match(unit):
+                return u
+
+        return None
+
     @property
     @abc.abstractmethod
     def _text_units(self) -> TextUnitsMap:  # pragma: no cover
@@ -36,11 +280,132 @@ class HumanReadableValue(metaclass=abc.ABCMeta):
     def get_as(self, unit: Union[str, SupportsUnit]) -> float:  # pragma: no cover
         pass
 
+    @classmethod
+    @abc.abstractmethod
+    def _compute_coef(
+        cls, from_unit: SupportsUnit, to_unit: SupportsUnit
+    ) -> Decimal:  # pragma: no cover
+        pass
+
+    @classmethod
+    def _calc_coef(cls, from_unit: SupportsUnit, to_unit: SupportsUnit) -> Decimal:
+        try:
+            return cls._COEF_TABLE[from_unit][to_unit]
+        except KeyError:
+            # units that are not defined by the class
+            return cls._compute_coef(from_unit, to_unit)
+
+    def _convert_to(self, unit: SupportsUnit) -> float:
+        # a single division of the cached comparison key: converted numbers are not cached,
+        # which would cost more memory per instance than the division costs time
+        key = self._key
+        if key is None:
+            key = self._get_key()
+
+        return _divide_to_float(key, self._get_key_coef(unit))
+
+    def __new__(
+        cls,
+        readable_value: Optional[str] = None,
+        default_unit: Union[str, SupportsUnit, None] = None,
+    ) -> "HumanReadableValue":
+        # readable_value is optional so that copy and pickle can create an instance
+        # and restore the slots without calling __init__
+        cache = _cache.get_parse_cache()
+        if cache is not None and cache.intern and isinstance(readable_value, str):
+            instance = cache.get((cls, readable_value, default_unit))
+            if instance is not None:
+                return instance
+
+        instance = super().__new__(cls)
+        instance._key = None
+
+        return instance
+
     def __init__(
         self, readable_value: str, default_unit: Union[str, SupportsUnit, None] = None
     ) -> None:
+        if hasattr(self, "_number"):
+            # an interned instance that is returned from the parse cache by __new__
+            return
+
+        cache = _cache.get_parse_cache()
+        key = None
+        if cache is not None and isinstance(readable_value, str):
+            key = (type(self), readable_value, default_unit)
+
+            if not cache.intern:
+                cached = cache.get(key)
+                if cached is not None:
+                    self._default_unit = cached._default_unit
+                    self._number = cached._number
+                    self._from_unit = cached._from_unit
+                    return
+
         self._default_unit = self._normalize_unit(default_unit)
-        self._number, self._from_unit = self.__preprocess(readable_value)
+        self._number, self._from_unit = self._parse(readable_value, self._default_unit)
+
+        if cache is not None and key is not None:
+            cache.put(key, self)
+
+    @classmethod
+    def from_value(
+        cls: type[_T], number: Union[int, float, Decimal], unit: Union[str, SupportsUnit]
+    ) -> _T:
+        """
+        Create an instance from a number and a unit without parsing a string.
+
+        Args:
+            number (Union[int, float, Decimal]):
+                Number in the unit.
+            unit (Union[str, SupportsUnit]):
+                Unit of the number.
+
+        Returns:
+            An instance of the class.
+        """
+
+        norm_unit = cls._normalize_unit(unit)
+        if norm_unit is None:
+            raise ParameterError("unit must be specified")
+
+        return cls._new(_to_decimal(number), norm_unit)
+
+    @classmethod
+    def _new(
+        cls: type[_T],
+        number: Decimal,
+        unit: SupportsUnit,
+        default_unit: Optional[SupportsUnit] = None,
+        key: Union[int, Fraction, None] = None,
+    ) -> _T:
+        # create an instance from normalized attributes:
+        # bypass the parse cache lookup of __new__ and validation of from_value
+        value = object.__new__(cls)
+        value._key = key
+        value._number = number
+        value._from_unit = unit
+        value._default_unit = unit if default_unit is None else default_unit
+
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a scaled integer of the number and codes of the units,
+        # instead of a Decimal and unit objects that include regexes
+        coefficient, exponent = _split_decimal(self._number)
+        unit_codes = self._UNIT_CODES
+        default_unit = self._default_unit
+
+        return (
+            _restore_value,
+            (
+                type(self),
+                coefficient,
+                exponent,
+                unit_codes[self._from_unit],
+                None if default_unit is None else unit_codes[default_unit],
+            ),
+        )
 
     def __repr__(self) -> str:
         items = [str(self._number)]
@@ -49,64 +414,728 @@ class HumanReadableValue(metaclass=abc.ABCMeta):
 
         return " ".join(items)
 
-    def _normalize_unit(self, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
+    def __is_same_kind(self, other: Any) -> bool:
+        # subclasses of a value class share the conversion table of the value class
+        return isinstance(other, HumanReadableValue) and other._COEF_TABLE is self._COEF_TABLE
+
+    def _get_key(self) -> Union[int, Fraction]:
+        """
+        Returns:
+            The exact number in the finest unit of the class, which is used for
+            hashing and comparisons.
+        """
+
+        key = self._key
+        if key is None:
+            coef = self._get_key_coef(self._from_unit)
+            numerator, denominator = self._number.as_integer_ratio()
+            numerator *= coef.numerator
+            denominator *= coef.denominator
+
+            if numerator % denominator == 0:
+                key = self._key = numerator // denominator
+            else:
+                key = self._key = Fraction(numerator, denominator)
+
+        return key
+
+    @classmethod
+    def _get_key_coef(cls, unit: SupportsUnit) -> Fraction:
+        try:
+            return cls._KEY_COEFS[unit]
+        except KeyError:
+            # units that are not defined by the class
+            return Fraction(cls._calc_coef(unit, cls._BASE_UNIT)) * cls._KEY_SCALE
+
+    @classmethod
+    def _from_key(cls: type[_T], key: Union[int, Fraction], units: Iterable[SupportsUnit]) -> _T:
+        """
+        Create an instance from a comparison key in the first of the units
+        that can represent the key exactly as a decimal, or in the last unit with rounding.
+        """
+
+        for unit in units:
+            number = Fraction(key) / cls._get_key_coef(unit)
+            if _is_decimal_fraction(number):
+                break
+
+        return cls.from_value(
+            _strip_zeros(
+                get_decimal_context().divide(Decimal(number.numerator), Decimal(number.denominator))
+            ),
+            unit,
+        )
+
+    def __to_key(self, other: Any) -> Union[int, Fraction, None]:
+        if type(other) is type(self) or self.__is_same_kind(other):
+            key = other._key
+            return other._get_key() if key is None else key
+
+        if isinstance(other, str):
+            try:
+                return type(self)(other)._get_key()
+            except (ValueError, TypeError):
+                return None
+
+        try:
+            # numbers in the base unit
+            return _normalize_key(_to_exact_fraction(other) * self._KEY_SCALE)
+        except (ValueError, TypeError, OverflowError):
+            # including NaN and infinities
+            return None
+
+    def __hash__(self) -> int:
+        # equal to the hash of the number in the base unit, which compares equal to the value
+        key = self._key
+        if key is None:
+            key = self._get_key()
+
+        if type(key) is not int:
+            return hash(key / self._KEY_SCALE)
+
+        # the hash of the fraction key / _KEY_SCALE, as Python computes the hashes of rational
+        # numbers, without creating the fraction: the inverse of the scale is computed once
+        hash_value = hash(hash(abs(key)) * self._KEY_HASH_INVERSE)
+        if key < 0:
+            hash_value = -hash_value
+
+        return -2 if hash_value == -1 else hash_value
+
+    def __eq__(self, other: Any) -> bool:
+        # strings are not equal to values: equal objects must have equal hashes
+        key = None if isinstance(other, str) else self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() == key
+
+    def __ne__(self, other: Any) -> bool:
+        key = None if isinstance(other, str) else self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() != key
+
+    def __lt__(self, other: Any) -> bool:
+        key = self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() < key
+
+    def __le__(self, other: Any) -> bool:
+        key = self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() <= key
+
+    def __gt__(self, other: Any) -> bool:
+        key = self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() > key
+
+    def __ge__(self, other: Any) -> bool:
+        key = self.__to_key(other)
+        if key is None:
+            return NotImplemented
+
+        return self._get_key() >= key
+
+    def __combine(self: _T, other: _T, key: Union[int, Fraction]) -> _T:
+        # keep the unit of the left operand if the result is exact in the unit,
+        # otherwise use the finer unit of the operands
+        finer_unit = min(self._from_unit, other._from_unit, key=self._get_key_coef)
+        return self._from_key(key, (self._from_unit, finer_unit))
+
+    def __from_number(self: _T, number: Decimal) -> _T:
+        return self.from_value(_strip_zeros(number), self._from_unit)
+
+    def __add__(self: _T, other: _T) -> _T:
+        if not self.__is_same_kind(other):
+            return NotImplemented
+
+        return self.__combine(other, self._get_key() + other._get_key())
+
+    def __radd__(self: _T, other: Union[int, _T]) -> _T:
+        # the start value of the built-in sum()
+        if isinstance(other, int) and not isinstance(other, bool) and other == 0:
+            return self
+
+        return NotImplemented
+
+    def __sub__(self: _T, other: _T) -> _T:
+        if not self.__is_same_kind(other):
+            return NotImplemented
+
+        return self.__combine(other, self._get_key() - other._get_key())
+
+    def __mul__(self: _T, other: Union[int, float, Decimal]) -> _T:
+        try:
+            factor = _to_decimal(other)
+        except TypeError:
+            return NotImplemented
+
+        return self.__from_number(get_decimal_context().multiply(self._number, factor))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self: _T, other: Union[int, float, Decimal, _T]) -> Any:
+        """
+        Divide by a number, or by a value of the same kind to get the ratio as a float.
+        """
+
+        if self.__is_same_kind(other):
+            return _divide_to_float(self._get_key(), other._get_key())
+
+        try:
+            divisor = _to_decimal(other)
+        except TypeError:
+            return NotImplemented
+
+        return self.__from_number(get_decimal_context().divide(self._number, divisor))
+
+    def __neg__(self: _T) -> _T:
+        return self.__from_number(get_decimal_context().minus(self._number))
+
+    def __abs__(self: _T) -> _T:
+        return self.__from_number(get_decimal_context().abs(self._number))
+
+    @classmethod
+    def sum(cls: type[_T], values: Iterable[_T], unit: Union[str, SupportsUnit, None] = None) -> _T:
+        """
+        Add up values in a single pass without creating intermediate instances.
+
+        Args:
+            values (Iterable):
+                Values to add up.
+            unit (Union[str, SupportsUnit, None]):
+                Unit of the result. Defaults to the unit of the first value,
+                or the base unit of the class if ``values`` is empty.
+
+        Returns:
+            The total of the values.
+        """
+
+        # sum numbers per unit and convert each subtotal once
+        subtotals: dict[SupportsUnit, Decimal] = {}
+        value_types: set[type] = set()
+        context = get_decimal_context()
+
+        for value in values:
+            value_type = type(value)
+            if value_type not in value_types:
+                if not (
+                    issubclass(value_type, HumanReadableValue)
+                    and value_type._COEF_TABLE is cls._COEF_TABLE
+                ):
+                    raise TypeError(f"unsupported value for {cls.__name__}.sum: {value!r}")
+
+                value_types.add(value_type)
+
+            from_unit = value._from_unit
+            try:
+                subtotals[from_unit] = context.add(subtotals[from_unit], value._number)
+            except KeyError:
+                subtotals[from_unit] = value._number
+
+        total = sum(
+            (
+                Fraction(number) * cls._get_key_coef(from_unit)
+                for from_unit, number in subtotals.items()
+            ),
+            Fraction(0),
+        )
+
+        norm_unit = cls._normalize_unit(unit)
+        if norm_unit is not None:
+            return cls._from_key(total, (norm_unit,))
+
+        if not subtotals:
+            return cls.from_value(0, cls._BASE_UNIT)
+
+        # the unit of the first value, or the finest unit of the values if not exact
+        first_unit = next(iter(subtotals))
+        finest_unit = min(subtotals, key=cls._get_key_coef)
+
+        return cls._from_key(total, (first_unit, finest_unit))
+
+    @classmethod
+    def encode_many(cls, values: Iterable["HumanReadableValue"]) -> bytes:
+        """
+        Encode values to fixed-width binary records without pickling each value.
+
+        A record consists of the number of the value in the finest unit of the class
+        (e.g. nanoseconds for ``Time``) as a signed 64-bit integer and the code of the unit
+        of the value (the index in ``get_text_units()``) as an unsigned 8-bit integer,
+        in little-endian (``struct`` format ``<qB``, 9 bytes).
+
+        Args:
+            values (Iterable):
+                Values to encode.
+
+        Returns:
+            bytes: Concatenated records of the values.
+
+        Raises:
+            ParameterError:
+                If a value is not an integral number of the finest unit,
+                or is out of the range of a 64-bit integer.
+        """
+
+        from ._codec import encode_many
+
+        return encode_many(cls, values)
+
+    @classmethod
+    def decode_many(cls: type[_T], data: Union[bytes, bytearray, memoryview]) -> list[_T]:
+        """
+        Decode values from binary records that ``encode_many`` created.
+        Values are restored in their units.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]):
+                Concatenated records.
+
+        Returns:
+            Decoded values in the order of the records.
+        """
+
+        from ._codec import decode_many
+
+        return decode_many(cls, data)
+
+    @classmethod
+    def range(
+        cls: type[_T],
+        min_value: Union[str, _T, None] = None,
+        max_value: Union[str, _T, None] = None,
+    ) -> "ValueRange[_T]":
+        """
+        Create a reusable validator of a closed range of values.
+        The bounds are parsed once, instead of at each validation.
+
+        Args:
+            min_value (Union[str, HumanReadableValue, None]):
+                Minimum value of the range. ``None`` for no lower bound.
+            max_value (Union[str, HumanReadableValue, None]):
+                Maximum value of the range. ``None`` for no upper bound.
+
+        Returns:
+            ValueRange: A validator that checks single values, batches, and streams.
+        """
+
+        from ._range import ValueRange
+
+        return ValueRange(cls, min_value, max_value)
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[str],
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+        workers: Optional[int] = None,
+        executor: Optional["Executor"] = None,
+        chunksize: Optional[int] = None,
+    ) -> "array[float]":
+        """
+        Convert human-readable values to numbers in a unit without creating
+        an instance for each value. Each distinct value is parsed only once.
+
+        Args:
+            values (Iterable[str]):
+                Human-readable values to convert.
+            unit (Union[str, SupportsUnit]):
+                Unit of the converted numbers.
+            default_unit (Union[str, SupportsUnit, None]):
+                Unit of values that do not include a unit.
+            on_error (str):
+                How to handle values that failed to parse:
+                ``"raise"`` raises the exception,
+                ``"skip"`` excludes the values from the result, and
+                ``"nan"`` converts the values to NaN.
+            workers (Optional[int]):
+                Number of worker processes to parse chunks of the values in parallel.
+                Defaults to parsing in the current process.
+            executor (Optional[concurrent.futures.Executor]):
+                Executor to parse chunks of the values instead of a process pool
+                created for the call. The executor is not shut down.
+            chunksize (Optional[int]):
+                Number of values per chunk for ``workers`` or ``executor``.
+                Defaults to splitting the values into four chunks per worker.
+
+        Returns:
+            array[float]: Converted numbers in the order of the values.
+        """
+
+        _validate_error_policy(on_error)
+
+        if workers is not None or executor is not None:
+            from ._parallel import parse_many_parallel
+
+            return parse_many_parallel(
+                cls, values, unit, default_unit, on_error, workers, executor, chunksize
+            )
+
+        convert = cls._make_converter(unit, default_unit)
+        converted: dict[str, Optional[float]] = {}
+        results: array[float] = array("d")
+
+        def try_convert(value: str) -> Optional[float]:
+            try:
+                return convert(value)
+            except (ParameterError, TypeError):
+                if on_error == "raise":
+                    raise
+
+                return None
+
+        for value in values:
+            try:
+                result = converted[value]
+            except KeyError:
+                result = converted[value] = try_convert(value)
+            except TypeError:
+                # unhashable values
+                result = try_convert(value)
+
+            if result is not None:
+                results.append(result)
+            elif on_error == "nan":
+                results.append(math.nan)
+
+        return results
+
+    @classmethod
+    def iter_parse(
+        cls,
+        lines: Iterable[str],
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: Union[ErrorPolicy, ErrorHandler] = "raise",
+        with_index: bool = False,
+    ) -> Iterator[Union[float, tuple[int, float]]]:
+        """
+        Lazily convert human-readable values, such as lines of a file, to numbers in a unit.
+        Memory usage is bounded regardless of the length of the input.
+        Leading and trailing whitespaces of each value are ignored.
+
+        Args:
+            lines (Iterable[str]):
+                Human-readable values to convert.
+            unit (Union[str, SupportsUnit]):
+                Unit of the converted numbers.
+            default_unit (Union[str, SupportsUnit, None]):
+                Unit of values that do not include a unit.
+            on_error (Union[str, Callable[[int, Any, Exception], None]]):
+                How to handle values that failed to parse:
+                ``"raise"`` raises the exception,
+                ``"skip"`` skips the values, and
+                ``"nan"`` converts the values to NaN.
+                A callable is called with the index, the value, and the exception,
+                and the value is skipped.
+            with_index (bool):
+                If ``True``, yield pairs of the index of a value and the converted number.
+
+        Yields:
+            Union[float, tuple[int, float]]: Converted numbers.
+        """
+
+        if not callable(on_error):
+            _validate_error_policy(on_error)
+
+        convert = cls._make_converter(unit, default_unit)
+        converted: dict[str, Union[float, Exception]] = {}
+
+        def try_convert(value: str) -> Union[float, Exception]:
+            try:
+                return convert(value)
+            except (ParameterError, TypeError) as e:
+                return e
+
+        for index, value in enumerate(lines):
+            if isinstance(value, str):
+                value = value.strip()
+
+            # repeated values, including invalid ones, are resolved without re-parsing
+            try:
+                result = converted[value]
+            except KeyError:
+                if len(converted) >= _ITER_PARSE_MEMO_SIZE:
+                    converted.clear()
+
+                result = converted[value] = try_convert(value)
+            except TypeError:
+                # unhashable values
+                result = try_convert(value)
+
+            if isinstance(result, Exception):
+                if on_error == "raise":
+                    raise result
+
+                if on_error == "nan":
+                    result = math.nan
+                else:
+                    if callable(on_error):
+                        on_error(index, value, result)
+
+                    continue
+
+            if with_index:
+                yield (index, result)
+            else:
+                yield result
+
+    @classmethod
+    def parse_file(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+        column: Optional[int] = None,
+        delimiter: Union[str, bytes] = ",",
+        pattern: Union[str, bytes, Pattern, None] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> "array[float]":
+        """
+        Convert a field of each line of a file to numbers in a unit.
+        The file is memory-mapped and scanned in chunks, and fields are matched
+        in place without decoding each line.
+
+        Args:
+            path:
+                Path to the file.
+            unit (Union[str, SupportsUnit]):
+                Unit of the converted numbers.
+            default_unit (Union[str, SupportsUnit, None]):
+                Unit of values that do not include a unit.
+            on_error (str):
+                How to handle values that failed to parse:
+                ``"raise"``, ``"skip"``, or ``"nan"``.
+                Lines that lack the ``column`` or have an empty ``column`` are handled
+                in the same way. Blank lines are ignored.
+            column (Optional[int]):
+                Zero-based index of a ``delimiter``-separated column to convert.
+                If both ``column`` and ``pattern`` are ``None``, whole lines are converted.
+            delimiter (Union[str, bytes]):
+                Column delimiter. Defaults to ``,``.
+            pattern (Union[str, bytes, Pattern, None]):
+                Regular expression to extract a field from lines:
+                the group named ``value``, the first group, or the whole match is converted.
+                Lines that do not match are ignored.
+            start (int):
+                Byte offset where the range to convert starts.
+                Lines that start within ``[start, end)`` are converted,
+                so that workers can split a file into byte ranges.
+            end (Optional[int]):
+                Byte offset where the range to convert ends. Defaults to the end of the file.
+            chunk_size (Optional[int]):
+                Number of bytes to scan at once. Defaults to 16 MiB.
+
+        Returns:
+            array[float]: Converted numbers in the order of the lines.
+        """
+
+        from ._file import DEFAULT_CHUNK_SIZE, parse_file
+
+        _validate_error_policy(on_error)
+
+        to_unit = cls._normalize_unit(unit)
+        assert to_unit
+
+        return parse_file(
+            cls,
+            path,
+            to_unit,
+            cls._normalize_unit(default_unit),
+            on_error,
+            column=column,
+            delimiter=delimiter,
+            pattern=pattern,
+            start=start,
+            end=end,
+            chunk_size=DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size,
+        )
+
+    @classmethod
+    def _make_converter(
+        cls,
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+    ) -> Callable[[str], float]:
+        """
+        Returns:
+            A function that converts a human-readable value to a number in the unit.
+            Conversion coefficients are computed once for each unit of the values.
+        """
+
+        to_unit = cls._normalize_unit(unit)
+        assert to_unit
+        norm_default_unit = cls._normalize_unit(default_unit)
+        coefs: dict[SupportsUnit, tuple[int, int]] = {}
+
+        def convert(value: str) -> float:
+            number, from_unit = cls._parse(value, norm_default_unit)
+
+            coef = coefs.get(from_unit)
+            if coef is None:
+                coef = coefs[from_unit] = (
+                    cls._get_key_coef(from_unit) / cls._get_key_coef(to_unit)
+                ).as_integer_ratio()
+
+            numerator, denominator = number.as_integer_ratio()
+
+            return _divide_to_float(numerator * coef[0], denominator * coef[1])
+
+        return convert
+
+    @classmethod
+    def parse_array(
+        cls,
+        values: Any,
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+    ) -> "np.ndarray":
+        """
+        Convert an array of human-readable values to a ``float64`` array of numbers in a unit.
+        Numbers and unit suffixes are split and converted with vectorized NumPy operations.
+        Requires NumPy.
+
+        Args:
+            values (array_like):
+                Human-readable values to convert.
+            unit (Union[str, SupportsUnit]):
+                Unit of the converted numbers.
+            default_unit (Union[str, SupportsUnit, None]):
+                Unit of values that do not include a unit.
+            on_error (str):
+                How to handle values that failed to parse:
+                ``"raise"`` raises the exception,
+                ``"skip"`` excludes the values from the result (the result is flattened), and
+                ``"nan"`` converts the values to NaN.
+
+        Returns:
+            numpy.ndarray: Converted numbers with the same shape as the values.
+        """
+
+        from ._numpy import parse_array
+
+        _validate_error_policy(on_error)
+
+        to_unit = cls._normalize_unit(unit)
+        assert to_unit
+
+        return parse_array(cls, values, to_unit, cls._normalize_unit(default_unit), on_error)
+
+    @classmethod
+    def _normalize_unit(cls, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
         if unit is None:
             return None
 
-        for u in self._text_units:
-            if u.regexp.search(cast(str, unit)):
-                return u
+        aliases = cls._UNIT_ALIASES
+        if aliases is None:
+            aliases = cls._UNIT_ALIASES = MappingProxyType(cls.__make_unit_aliases())
+
+        try:
+            return aliases[unit]
+        except (KeyError, TypeError):
+            pass
+
+        if isinstance(unit, str) and cls._UNIT_RESOLVER.flags & re.IGNORECASE:
+            norm_unit = aliases.get(unit.lower())
+            if norm_unit is not None:
+                return norm_unit
+
+        if isinstance(unit, str):
+            # unusual spellings, such as unit specifiers that include whitespaces
+            norm_unit = cls.__match_unit(unit)
+            if norm_unit is not None:
+                return norm_unit
 
         raise ValueError(f"unit not found: {unit}")
 
-    def __split_unit(self, readable_value: str) -> tuple[str, SupportsUnit]:
-        if RealNumber(readable_value).is_type():
-            if self._default_unit is None:
+    @classmethod
+    def __split_unit(
+        cls, readable_value: str, default_unit: Optional[SupportsUnit]
+    ) -> Optional[tuple[str, SupportsUnit]]:
+        if not isinstance(readable_value, str):
+            raise TypeError("readable_value must be a string")
+
+        split_value = cls._UNIT_RESOLVER.split(readable_value)
+
+        instrumentation = _instrument.instrumentation
+        if instrumentation is not None:
+            instrumentation.add_regex_attempts(cls, 1)
+
+        if split_value is not None:
+            return split_value
+
+        if _is_real_number(readable_value):
+            if default_unit is None:
                 raise UnitNotFoundError(
                     "unit not found",
                     value=readable_value,
-                    available_units=_get_unit_msg(self._text_units),
+                    available_units=_get_unit_msg(cls._TEXT_UNITS),
                 )
 
-            return (readable_value, self._default_unit)
+            return (readable_value, default_unit)
 
-        if not String(readable_value).is_type():
-            raise TypeError("readable_value must be a string")
+        return None
 
-        for unit in self._units:
-            try:
-                if unit.regexp.search(readable_value):
-                    number = unit.regexp.split(readable_value)[0]
-                    if not RealNumber(number).is_type():
-                        continue
+    @classmethod
+    def _parse(
+        cls, readable_value: str, default_unit: Optional[SupportsUnit] = None
+    ) -> tuple[Decimal, SupportsUnit]:
+        instrumentation = _instrument.instrumentation
+        if instrumentation is None:
+            return cls.__parse(readable_value, default_unit)
 
-                    return (number, unit)
-            except TypeError:
-                continue
+        return instrumentation.measure_parse(cls, cls.__parse, readable_value, default_unit)
 
-        raise UnitNotFoundError(
-            "unit not found",
-            value=readable_value,
-            available_units=_get_unit_msg(self._text_units),
-        )
-
-    def __preprocess(self, readable_value: str) -> tuple[Decimal, SupportsUnit]:
-        if readable_value is None:
-            raise TypeError("readable_value must be a string")
+    @classmethod
+    def __parse(
+        cls, readable_value: str, default_unit: Optional[SupportsUnit]
+    ) -> tuple[Decimal, SupportsUnit]:
+        split_value = cls.__split_unit(readable_value, default_unit)
 
-        number_str, from_unit = self.__split_unit(readable_value)
-        number = self.__to_number(number_str)
+        if split_value is None:
+            compound_value = cls._parse_compound(readable_value)
+            if compound_value is not None:
+                return compound_value
 
-        if from_unit is None:
             raise UnitNotFoundError(
                 "unit not found",
                 value=readable_value,
-                available_units=_get_unit_msg(self._text_units),
+                available_units=_get_unit_msg(cls._TEXT_UNITS),
             )
 
-        return (number, from_unit)
+        number_str, from_unit = split_value
+
+        return (cls.__to_number(number_str), from_unit)
+
+    @classmethod
+    def _parse_compound(cls, readable_value: str) -> Optional[tuple[Decimal, SupportsUnit]]:
+        """
+        Parse a value that consists of multiple number-unit pairs.
+        Called only if the value does not match a single unit.
+
+        Returns:
+            The parsed number and unit, or ``None`` if compound values are not supported
+            or the value is not a compound value.
+        """
+
+        return None
 
-    def __to_number(self, number_str: str) -> Decimal:
+    @staticmethod
+    def __to_number(number_str: str) -> Decimal:
         match = _RE_NUMBER.search(number_str)
         if not match:
             raise ParameterError(
@@ -0,0 +1,154 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple, Optional
+
+from .error import ParameterError
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    Size-bounded LRU cache of parsed human-readable values.
+
+    Entries are keyed by ``(class, readable_value, default_unit)``.
+
+    Args:
+        maxsize (int):
+            Maximum number of entries. The least recently used entry is evicted
+            when the cache is full.
+        intern (bool):
+            If ``True``, constructing a value from the same arguments returns
+            the same shared instance instead of a new one.
+    """
+
+    @property
+    def intern(self) -> bool:
+        return self.__intern
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def __init__(self, maxsize: int = 1024, intern: bool = False) -> None:
+        self.__validate_maxsize(maxsize)
+
+        self.__maxsize = maxsize
+        self.__intern = intern
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            self.__evict(self.__maxsize)
+
+    def clear(self) -> None:
+        """
+        Remove all of the entries and reset the statistics.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of entries.
+        Least recently used entries are evicted if the cache exceeds the new size.
+        """
+
+        self.__validate_maxsize(maxsize)
+
+        with self.__lock:
+            self.__maxsize = maxsize
+            self.__evict(maxsize)
+
+    def info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                maxsize=self.__maxsize,
+                currsize=len(self.__entries),
+            )
+
+    def __evict(self, maxsize: int) -> None:
+        while len(self.__entries) > maxsize:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+    @staticmethod
+    def __validate_maxsize(maxsize: int) -> None:
+        if maxsize < 1:
+            raise ParameterError(
+                "invalid cache size", expected="greater than or equal to 1", value=maxsize
+            )
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def enable_parse_cache(maxsize: int = 1024, intern: bool = False) -> ParseCache:
+    """
+    Enable the parse cache for ``Time`` and ``BitsPerSecond``.
+    Replaces the current cache if it is already enabled.
+
+    Returns:
+        ParseCache: The enabled cache.
+    """
+
+    global _parse_cache
+
+    _parse_cache = ParseCache(maxsize=maxsize, intern=intern)
+
+    return _parse_cache
+
+
+def disable_parse_cache() -> None:
+    global _parse_cache
+
+    _parse_cache = None
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """
+    Returns:
+        Optional[ParseCache]: The enabled cache, or ``None`` if the cache is disabled.
+    """
+
+    return _parse_cache
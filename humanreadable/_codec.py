@@ -0,0 +1,97 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import struct
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import TYPE_CHECKING, Final, Optional, TypeVar, Union
+
+from .error import ParameterError
+
+
+if TYPE_CHECKING:
+    from ._base import HumanReadableValue
+
+
+_T = TypeVar("_T", bound="HumanReadableValue")
+
+# a record: the comparison key (a number in the finest unit of the class) as a signed 64-bit
+# integer, and the code of the unit of the value as an unsigned 8-bit integer, in little-endian
+RECORD: Final[struct.Struct] = struct.Struct("<qB")
+
+_INT64_MIN: Final[int] = -(2**63)
+_INT64_MAX: Final[int] = 2**63 - 1
+
+
+def encode_many(cls: type["HumanReadableValue"], values: Iterable["HumanReadableValue"]) -> bytes:
+    keys: list[int] = []
+    codes: list[int] = []
+    unit_codes = cls._UNIT_CODES
+    value_types: set[type] = set()
+
+    for value in values:
+        value_type = type(value)
+        if value_type not in value_types:
+            # values of the same kind share the conversion table
+            if getattr(value_type, "_COEF_TABLE", None) is not cls._COEF_TABLE:
+                raise TypeError(f"unsupported value for {cls.__name__}.encode_many: {value!r}")
+
+            value_types.add(value_type)
+
+        key = value._key
+        if key is None:
+            key = value._get_key()
+
+        if type(key) is not int:
+            raise ParameterError(
+                "value cannot be encoded exactly",
+                expected=f"an integral number of {min(unit_codes, key=cls._get_key_coef).name}",
+                value=value,
+            )
+
+        if not _INT64_MIN <= key <= _INT64_MAX:
+            raise ParameterError("value is out of the range of a 64-bit integer", value=value)
+
+        keys.append(key)
+        codes.append(unit_codes[value._from_unit])
+
+    return b"".join(map(RECORD.pack, keys, codes))
+
+
+def decode_many(cls: type[_T], data: Union[bytes, bytearray, memoryview]) -> list[_T]:
+    if len(data) % RECORD.size != 0:
+        raise ParameterError(
+            "invalid data length", expected=f"a multiple of {RECORD.size:d}", value=len(data)
+        )
+
+    code_units = cls._CODE_UNITS
+    num_units = len(code_units)
+    # integer coefficients from the finest unit to each unit: the keys of values in the unit
+    # are divisible by the coefficient unless the numbers have finer fractions than the key
+    key_coefs: list[Optional[int]] = []
+    for unit in code_units:
+        key_coef = cls._get_key_coef(unit)
+        key_coefs.append(key_coef.numerator if key_coef.denominator == 1 else None)
+
+    new = cls._new
+    values: list[_T] = []
+
+    for key, code in RECORD.iter_unpack(data):
+        if code >= num_units:
+            raise ParameterError(
+                "invalid unit code", expected=f"less than {num_units:d}", value=code
+            )
+
+        unit = code_units[code]
+        key_coef = key_coefs[code]
+        if key_coef is not None:
+            quotient, remainder = divmod(key, key_coef)
+            if remainder == 0:
+                values.append(new(Decimal(quotient), unit, key=key))
+                continue
+
+        number = cls._from_key(key, (unit,))._number
+        values.append(new(number, unit, key=key))
+
+    return values
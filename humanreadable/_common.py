@@ -1,9 +1,273 @@
 import re
+import threading
+from decimal import ROUND_HALF_EVEN, Context, DivisionByZero, InvalidOperation, Overflow
+from mmap import mmap
 from re import Pattern
+from typing import Any, AnyStr, Final, Generic, Optional, Union, cast
 
-from ._const import PATTERN_TEMPLETE
-from ._types import Units
+from ._const import (
+    BYTES_SPLIT_PATTERN_TEMPLATE,
+    COMPOUND_ITEM_PATTERN_TEMPLATE,
+    NUMBER_PATTERN,
+    PATTERN_TEMPLETE,
+    SIGN_PATTERN,
+    SPLIT_PATTERN_TEMPLATE,
+    UNIT_PATTERN_TEMPLATE,
+    UNSIGNED_NUMBER_PATTERN,
+)
+from ._types import SupportsUnit, TextUnitsMap, Units
+
+
+_CHAR_CLASS_PREFIX_PATTERN: Final[str] = r"^\[(?P<chars>\w+)\](?P<body>.*)$"
+
+# the same settings as decimal.DefaultContext
+_DECIMAL_CONTEXT: Final[Context] = Context(
+    prec=28, rounding=ROUND_HALF_EVEN, traps=[InvalidOperation, DivisionByZero, Overflow]
+)
+_decimal_local = threading.local()
+
+# serializes the first compilation of lazily compiled regexes
+_compile_lock = threading.Lock()
+
+
+def get_decimal_context() -> Context:
+    """
+    Returns:
+        The decimal context for arithmetic of values in the current thread.
+        Results do not depend on ``decimal.getcontext()`` of the caller,
+        and threads do not share the flags of a context.
+    """
+
+    try:
+        return _decimal_local.context
+    except AttributeError:
+        context = _decimal_local.context = _DECIMAL_CONTEXT.copy()
+        return context
+
+
+class LazyPattern(Generic[AnyStr]):
+    """
+    A regular expression that is compiled on first use.
+    Behaves like a compiled ``re.Pattern``.
+    """
+
+    __slots__ = ("pattern", "flags", "_compiled")
+
+    def __init__(self, pattern: AnyStr, flags: int = 0) -> None:
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled: Optional[Pattern[AnyStr]] = None
+
+    def compile(self) -> Pattern[AnyStr]:
+        compiled = self._compiled
+        if compiled is None:
+            with _compile_lock:
+                compiled = self._compiled
+                if compiled is None:
+                    compiled = self._compiled = re.compile(self.pattern, self.flags)
+
+        return compiled
+
+    def match(self, string: AnyStr, *args: Any) -> Optional["re.Match[AnyStr]"]:
+        return self.compile().match(string, *args)
+
+    def search(self, string: AnyStr, *args: Any) -> Optional["re.Match[AnyStr]"]:
+        return self.compile().search(string, *args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compile(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyPattern):
+            return (self.pattern, self.flags) == (other.pattern, other.flags)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.pattern, self.flags))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (LazyPattern, (self.pattern, self.flags))
+
+    def __repr__(self) -> str:
+        return repr(self.compile())
 
 
 def compile_units_regex_pattern(units: Units, flags: int = 0) -> Pattern[str]:
-    return re.compile("|".join([PATTERN_TEMPLETE.format(unit) for unit in units]), flags)
+    return cast(
+        Pattern[str],
+        LazyPattern("|".join([PATTERN_TEMPLETE.format(unit) for unit in units]), flags),
+    )
+
+
+def expand_unit_specifier(specifier: str) -> list[str]:
+    """
+    Expand a unit specifier to the literal strings that the specifier matches.
+    A leading character class (e.g. ``[kK]bps``) is expanded to each character.
+
+    Returns:
+        The literal strings, or an empty list if the specifier includes other regex syntax.
+    """
+
+    match = re.match(_CHAR_CLASS_PREFIX_PATTERN, specifier)
+    if match is None:
+        prefixes = [""]
+        body = specifier
+    else:
+        prefixes = list(match.group("chars"))
+        body = match.group("body")
+
+    if re.escape(body) != body:
+        return []
+
+    return [prefix + body for prefix in prefixes]
+
+
+class UnitResolver:
+    """
+    Split a human-readable value into a numeric part and a unit with a single regex match.
+
+    The regex is built once from a units map: each unit becomes a named group
+    of its unit specifiers, so the matched group identifies the unit.
+    Regexes are compiled on first use.
+    """
+
+    def __init__(self, text_units: TextUnitsMap, flags: int = 0) -> None:
+        self.__group_units: dict[str, SupportsUnit] = {}
+        unit_patterns: list[str] = []
+
+        for i, (unit, specifiers) in enumerate(text_units.items()):
+            group_name = f"unit{i:d}"
+            self.__group_units[group_name] = unit
+            unit_patterns.append(f"(?P<{group_name}>{'|'.join(specifiers)})")
+
+        units_pattern = "|".join(unit_patterns)
+        self.__units_pattern = units_pattern
+        self.__flags = flags
+        self.__compiled = False
+
+    def __compile(self) -> None:
+        # compile on first use rather than when the value classes are imported.
+        # the flag is set after all of the regexes are assigned, so that other threads
+        # that see the flag can use the regexes without the lock.
+        with _compile_lock:
+            if not self.__compiled:
+                self.__compile_regexes()
+
+    def __compile_regexes(self) -> None:
+        units_pattern = self.__units_pattern
+        flags = self.__flags
+
+        self.__regexp = re.compile(
+            SPLIT_PATTERN_TEMPLATE.format(number=NUMBER_PATTERN, units=units_pattern), flags
+        )
+        self.__bytes_regexp = re.compile(
+            BYTES_SPLIT_PATTERN_TEMPLATE.format(number=NUMBER_PATTERN, units=units_pattern).encode(
+                "ascii"
+            ),
+            flags,
+        )
+        self.__unit_regexp = re.compile(UNIT_PATTERN_TEMPLATE.format(units=units_pattern), flags)
+        self.__sign_regexp = re.compile(SIGN_PATTERN)
+        self.__item_regexp = re.compile(
+            COMPOUND_ITEM_PATTERN_TEMPLATE.format(
+                number=UNSIGNED_NUMBER_PATTERN, units=units_pattern
+            ),
+            flags,
+        )
+        self.__compiled = True
+
+    @property
+    def units_pattern(self) -> str:
+        """
+        Regex pattern of the unit specifiers: a unit matches the named group ``unit<index>``,
+        which can be resolved to the unit by ``group_unit``.
+        """
+
+        return self.__units_pattern
+
+    @property
+    def flags(self) -> int:
+        return self.__flags
+
+    def group_unit(self, group_name: str) -> SupportsUnit:
+        return self.__group_units[group_name]
+
+    def split(self, readable_value: str) -> Optional[tuple[str, SupportsUnit]]:
+        if not self.__compiled:
+            self.__compile()
+
+        match = self.__regexp.match(readable_value)
+        if match is None:
+            return None
+
+        # unit groups enclose any inner groups of the specifiers, so a unit group closes last
+        return (match.group("number"), self.__group_units[cast(str, match.lastgroup)])
+
+    def split_bytes(
+        self, buffer: Union[bytes, bytearray, memoryview, mmap], pos: int, endpos: int
+    ) -> Optional[tuple[int, int, str]]:
+        """
+        Split ``buffer[pos:endpos]`` in place without creating a string.
+
+        Returns:
+            The start and end positions of the numeric part and the name of the unit group,
+            which can be resolved to the unit by ``group_unit``,
+            or ``None`` if the value does not match a single unit.
+        """
+
+        if not self.__compiled:
+            self.__compile()
+
+        match = self.__bytes_regexp.match(buffer, pos, endpos)
+        if match is None:
+            return None
+
+        return (*match.span("number"), cast(str, match.lastgroup))
+
+    def find_unit(self, unit_str: str) -> Optional[SupportsUnit]:
+        """
+        Returns:
+            The unit that the whole of a unit specifier matches, or ``None`` if not found.
+        """
+
+        if not self.__compiled:
+            self.__compile()
+
+        match = self.__unit_regexp.match(unit_str)
+        if match is None:
+            return None
+
+        return self.__group_units[cast(str, match.lastgroup)]
+
+    def split_compound(self, readable_value: str) -> Optional[list[tuple[str, SupportsUnit]]]:
+        """
+        Split a value that consists of number-unit pairs (e.g. ``1h 30m 15s``) in a single pass.
+        A leading sign applies to the whole value and is prepended to each number.
+
+        Returns:
+            Pairs of a numeric part and a unit, or ``None`` if the value includes
+            anything other than number-unit pairs.
+        """
+
+        if not self.__compiled:
+            self.__compile()
+
+        sign_match = self.__sign_regexp.match(readable_value)
+        assert sign_match
+        sign = sign_match.group("sign")
+        pos = sign_match.end()
+        end = len(readable_value)
+        items: list[tuple[str, SupportsUnit]] = []
+
+        while pos < end:
+            match = self.__item_regexp.match(readable_value, pos)
+            if match is None:
+                return None
+
+            items.append(
+                (sign + match.group("number"), self.__group_units[cast(str, match.lastgroup)])
+            )
+            pos = match.end()
+
+        return items
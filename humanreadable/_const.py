@@ -2,3 +2,10 @@ from typing import Final
 
 
 PATTERN_TEMPLETE: Final[str] = r"\s?{}$"
+UNSIGNED_NUMBER_PATTERN: Final[str] = r"(?:[0-9]+\.?[0-9]*|\.[0-9]+)"
+NUMBER_PATTERN: Final[str] = r"[-\+]?" + UNSIGNED_NUMBER_PATTERN
+SIGN_PATTERN: Final[str] = r"\s*(?P<sign>[-\+]?)"
+UNIT_PATTERN_TEMPLATE: Final[str] = r"^(?:{units})$"
+SPLIT_PATTERN_TEMPLATE: Final[str] = r"^(?P<number>{number})\s?(?:{units})$"
+BYTES_SPLIT_PATTERN_TEMPLATE: Final[str] = r"(?P<number>{number})\s?(?:{units})$"
+COMPOUND_ITEM_PATTERN_TEMPLATE: Final[str] = r"\s*(?P<number>{number})\s*(?:{units})(?![a-zA-Z])\s*"
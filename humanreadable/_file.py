@@ -0,0 +1,276 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import math
+import mmap
+import os
+import re
+from array import array
+from re import Pattern
+from typing import TYPE_CHECKING, Final, Optional, Union, cast
+
+from ._base import _divide_to_float
+from ._common import UnitResolver
+from ._const import NUMBER_PATTERN
+from ._types import ErrorPolicy, SupportsUnit
+from .error import ParameterError
+
+
+if TYPE_CHECKING:
+    from ._base import HumanReadableValue
+
+
+DEFAULT_CHUNK_SIZE: Final[int] = 16 * 1024**2
+
+_VALUE_GROUP: Final[str] = "value"
+_MISSING_GROUP: Final[str] = "missing"
+
+
+def _compile_field_regexp(
+    resolver: UnitResolver,
+    column: Optional[int],
+    delimiter: Union[str, bytes],
+    pattern: Union[str, bytes, Pattern, None],
+) -> Pattern[bytes]:
+    if pattern is not None:
+        if column is not None:
+            raise ParameterError("column and pattern are mutually exclusive")
+
+        flags = 0
+        if isinstance(pattern, re.Pattern):
+            # keep the flags of a compiled pattern except for UNICODE, which bytes patterns reject
+            flags = pattern.flags & ~re.UNICODE
+            pattern = pattern.pattern
+
+        if isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+
+        return re.compile(pattern, flags | re.MULTILINE)
+
+    if column is None:
+        prefix = r"^[ \t]*"
+        field_end = r"\r?$"
+        field_chars = r"[^\r\n]"
+        missing_pattern = ""
+    else:
+        if column < 0:
+            raise ParameterError(
+                "invalid column", expected="greater than or equal to 0", value=column
+            )
+
+        if isinstance(delimiter, bytes):
+            delimiter = delimiter.decode("utf-8")
+
+        if not delimiter:
+            raise ParameterError("delimiter must not be empty")
+
+        escaped = re.escape(delimiter)
+        if len(delimiter.encode("utf-8")) == 1:
+            line_chars = rf"[^\n{escaped}]"
+            field_chars = rf"[^\r\n{escaped}]"
+        else:
+            # a delimiter of several bytes is not a set of characters:
+            # match any character that does not start the delimiter
+            line_chars = rf"(?:(?!{escaped})[^\n])"
+            field_chars = rf"(?:(?!{escaped})[^\r\n])"
+
+        # skip the preceding columns
+        prefix = rf"^(?:{line_chars}*{escaped}){{{column:d}}}[ \t]*"
+        field_end = rf"(?:{escaped}|\r?$)"
+        # non-blank lines that have fewer columns are captured to apply the error policy
+        missing_pattern = rf"|^(?P<{_MISSING_GROUP}>[^\r\n]+?)\r?$"
+
+    # a field is either a number with a unit, which is split by the same match,
+    # or any other value, which is captured by the value group
+    field_pattern = "".join(
+        [
+            "(?:",
+            prefix,
+            rf"(?:(?P<number>{NUMBER_PATTERN})\s?(?:{resolver.units_pattern})[ \t]*{field_end}",
+            rf"|(?P<{_VALUE_GROUP}>{field_chars}*?)[ \t]*{field_end})",
+            missing_pattern,
+            ")",
+        ]
+    )
+
+    return re.compile(field_pattern.encode("utf-8"), resolver.flags | re.MULTILINE)
+
+
+def _find_value_group(regexp: Pattern[bytes]) -> Union[int, str]:
+    if _VALUE_GROUP in regexp.groupindex:
+        return _VALUE_GROUP
+
+    return 1 if regexp.groups >= 1 else 0
+
+
+def _align_to_line_start(buffer: mmap.mmap, pos: int) -> int:
+    """
+    Returns:
+        ``pos`` if it is the start of a line, otherwise the start of the next line.
+    """
+
+    if pos <= 0:
+        return 0
+
+    if buffer[pos - 1] == ord("\n"):
+        return pos
+
+    newline_pos = buffer.find(b"\n", pos)
+    if newline_pos < 0:
+        return len(buffer)
+
+    return newline_pos + 1
+
+
+def _find_chunk_end(buffer: mmap.mmap, pos: int, chunk_size: int, range_end: int) -> int:
+    """
+    Returns:
+        The end of the last line that starts in ``[pos, min(pos + chunk_size, range_end))``.
+    """
+
+    if pos + chunk_size >= range_end:
+        return range_end
+
+    return _align_to_line_start(buffer, pos + chunk_size)
+
+
+def _to_integer_ratio(number: bytes) -> tuple[int, int]:
+    """
+    Returns:
+        The exact numerator and denominator of a decimal number without an exponent.
+    """
+
+    dot_pos = number.find(b".")
+    if dot_pos < 0:
+        return (int(number), 1)
+
+    return (int(number[:dot_pos] + number[dot_pos + 1 :]), 10 ** (len(number) - dot_pos - 1))
+
+
+def _count_lines(buffer: mmap.mmap, pos: int, end: int, chunk_size: int) -> int:
+    count = 0
+    while pos < end:
+        chunk_end = min(pos + chunk_size, end)
+        count += buffer[pos:chunk_end].count(b"\n")
+        pos = chunk_end
+
+    return count + 1
+
+
+def parse_file(
+    cls: type["HumanReadableValue"],
+    path: Union[str, "os.PathLike[str]"],
+    to_unit: SupportsUnit,
+    default_unit: Optional[SupportsUnit],
+    on_error: ErrorPolicy,
+    column: Optional[int],
+    delimiter: Union[str, bytes],
+    pattern: Union[str, bytes, Pattern, None],
+    start: int,
+    end: Optional[int],
+    chunk_size: int,
+) -> "array[float]":
+    if chunk_size < 1:
+        raise ParameterError(
+            "invalid chunk size", expected="greater than or equal to 1", value=chunk_size
+        )
+
+    resolver = cls._UNIT_RESOLVER
+    field_regexp = _compile_field_regexp(resolver, column, delimiter, pattern)
+    value_group = _find_value_group(field_regexp)
+    is_split = pattern is None
+    is_column = is_split and column is not None
+    convert = cls._make_converter(to_unit, default_unit)
+    coefs: dict[str, tuple[int, int]] = {}
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return array("d")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            file_size = len(buffer)
+            end = file_size if end is None else min(end, file_size)
+            pos = _align_to_line_start(buffer, start)
+            if pos >= end:
+                return array("d")
+
+            # a line belongs to the byte range if the line starts within the range
+            range_end = _align_to_line_start(buffer, end)
+
+            # fields are written into an array preallocated for the number of lines
+            results = array("d", bytes(8 * _count_lines(buffer, pos, range_end, chunk_size)))
+            num_results = 0
+
+            while pos < range_end:
+                chunk_end = _find_chunk_end(buffer, pos, chunk_size, range_end)
+
+                for match in field_regexp.finditer(buffer, pos, chunk_end):
+                    group_name = cast(str, match.lastgroup)
+                    number_span: Optional[tuple[int, int]] = None
+
+                    if is_split:
+                        if group_name != _VALUE_GROUP and group_name != _MISSING_GROUP:
+                            # the last group of a matched number with a unit is the unit group
+                            number_span = match.span("number")
+                    else:
+                        value_start, value_end = match.span(value_group)
+                        split_value = resolver.split_bytes(buffer, value_start, value_end)
+                        if split_value is not None:
+                            number_span = split_value[:2]
+                            group_name = split_value[2]
+
+                    if number_span is not None:
+                        coef = coefs.get(group_name)
+                        if coef is None:
+                            coef = coefs[group_name] = (
+                                cls._get_key_coef(resolver.group_unit(group_name))
+                                / cls._get_key_coef(to_unit)
+                            ).as_integer_ratio()
+
+                        # converted as exactly as parse_many converts values
+                        number_start, number_end = number_span
+                        numerator, denominator = _to_integer_ratio(buffer[number_start:number_end])
+                        results[num_results] = _divide_to_float(
+                            numerator * coef[0], denominator * coef[1]
+                        )
+                        num_results += 1
+                        continue
+
+                    try:
+                        if group_name == _MISSING_GROUP:
+                            raise ParameterError(
+                                "column not found",
+                                expected=f"at least {column + 1:d} columns",
+                                value=match.group(_MISSING_GROUP).decode("utf-8", errors="replace"),
+                            )
+
+                        value_start, value_end = match.span(value_group)
+                        if value_start == value_end:
+                            # blank lines are not records, but an empty column is a missing value
+                            if not is_column or not match.group(0).strip():
+                                continue
+
+                            raise ParameterError(
+                                "empty field",
+                                value=match.group(0).decode("utf-8", errors="replace"),
+                            )
+
+                        # compound values, values without a unit, and invalid values
+                        value = buffer[value_start:value_end].decode("utf-8", errors="replace")
+                        results[num_results] = convert(value)
+                    except (ParameterError, TypeError):
+                        if on_error == "raise":
+                            raise
+                        if on_error == "skip":
+                            continue
+
+                        results[num_results] = math.nan
+
+                    num_results += 1
+
+                pos = chunk_end
+
+    del results[num_results:]
+
+    return results
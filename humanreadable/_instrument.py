@@ -0,0 +1,265 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from typing import Any, Final, Optional, TypeVar
+
+from . import _cache
+from .error import ParameterError, UnitNotFoundError
+
+
+_T = TypeVar("_T")
+
+ENV_INSTRUMENT: Final[str] = "HUMANREADABLE_INSTRUMENT"
+_ENV_TRUE_VALUES: Final[tuple[str, ...]] = ("1", "true", "yes", "on")
+
+_METRIC_PREFIX: Final[str] = "humanreadable"
+
+# exceptions that parsing raises for invalid values
+_PARSE_ERRORS: Final[tuple[type[Exception], ...]] = (UnitNotFoundError, ParameterError, TypeError)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+
+
+class Instrumentation:
+    """
+    Counters and timings of parsing and formatting of human-readable values.
+
+    - parses: number of parsed values per class and unit
+    - regex attempts: number of regex matches that parsing tried per class
+    - errors: number of exceptions that parsing raised per class and exception type
+    - timings: number of calls and cumulative time per operation (``parse`` or ``format``)
+      and class
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__parses: Counter[tuple[str, str]] = Counter()
+        self.__regex_attempts: Counter[str] = Counter()
+        self.__errors: Counter[tuple[str, str]] = Counter()
+        self.__calls: Counter[tuple[str, str]] = Counter()
+        self.__elapsed_ns: Counter[tuple[str, str]] = Counter()
+
+    def measure_parse(
+        self, cls: type, parse: Callable[..., tuple[Any, Any]], *args: Any
+    ) -> tuple[Any, Any]:
+        start = time.perf_counter_ns()
+        try:
+            number, unit = parse(*args)
+        except _PARSE_ERRORS as e:
+            with self.__lock:
+                self.__errors[(cls.__name__, type(e).__name__)] += 1
+            raise
+        finally:
+            self.__add_elapsed("parse", cls, time.perf_counter_ns() - start)
+
+        with self.__lock:
+            self.__parses[(cls.__name__, unit.name)] += 1
+
+        return (number, unit)
+
+    def measure(self, operation: str, cls: type, func: Callable[..., _T], *args: Any) -> _T:
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            self.__add_elapsed(operation, cls, time.perf_counter_ns() - start)
+
+    def add_regex_attempts(self, cls: type, count: int) -> None:
+        with self.__lock:
+            self.__regex_attempts[cls.__name__] += count
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__parses.clear()
+            self.__regex_attempts.clear()
+            self.__errors.clear()
+            self.__calls.clear()
+            self.__elapsed_ns.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            A snapshot of the counters and timings as a plain dictionary::
+
+                {
+                    "parses": {"Time": {"seconds": 2}},
+                    "regex_attempts": {"Time": 2},
+                    "errors": {"Time": {"UnitNotFoundError": 1}},
+                    "timings": {"parse": {"Time": {"calls": 3, "seconds": 0.000012}}},
+                    "parse_cache": {"hits": 0, ...} or None,
+                }
+        """
+
+        result: dict[str, Any] = {
+            "parses": {},
+            "regex_attempts": {},
+            "errors": {},
+            "timings": {},
+            "parse_cache": None,
+        }
+
+        with self.__lock:
+            for (class_name, unit_name), count in sorted(self.__parses.items()):
+                result["parses"].setdefault(class_name, {})[unit_name] = count
+
+            result["regex_attempts"] = dict(sorted(self.__regex_attempts.items()))
+
+            for (class_name, error_name), count in sorted(self.__errors.items()):
+                result["errors"].setdefault(class_name, {})[error_name] = count
+
+            for (operation, class_name), calls in sorted(self.__calls.items()):
+                result["timings"].setdefault(operation, {})[class_name] = {
+                    "calls": calls,
+                    "seconds": self.__elapsed_ns[(operation, class_name)] / 1e9,
+                }
+
+        cache = _cache.get_parse_cache()
+        if cache is not None:
+            result["parse_cache"] = cache.info()._asdict()
+
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        Returns:
+            The counters and timings in the Prometheus text exposition format.
+        """
+
+        data = self.as_dict()
+        lines: list[str] = []
+
+        def add_metric(
+            name: str, metric_type: str, help_text: str, samples: list[tuple[dict[str, str], Any]]
+        ) -> None:
+            metric_name = f"{_METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for labels, value in samples:
+                label_str = f"{{{_format_labels(labels)}}}" if labels else ""
+                lines.append(f"{metric_name}{label_str} {value}")
+
+        add_metric(
+            "parses_total",
+            "counter",
+            "Number of parsed values.",
+            [
+                ({"class": class_name, "unit": unit_name}, count)
+                for class_name, units in data["parses"].items()
+                for unit_name, count in units.items()
+            ],
+        )
+        add_metric(
+            "regex_attempts_total",
+            "counter",
+            "Number of regex matches that parsing tried.",
+            [
+                ({"class": class_name}, count)
+                for class_name, count in data["regex_attempts"].items()
+            ],
+        )
+        add_metric(
+            "parse_errors_total",
+            "counter",
+            "Number of exceptions that parsing raised.",
+            [
+                ({"class": class_name, "error": error_name}, count)
+                for class_name, errors in data["errors"].items()
+                for error_name, count in errors.items()
+            ],
+        )
+        timing_labels = [
+            ({"operation": operation, "class": class_name}, timing)
+            for operation, classes in data["timings"].items()
+            for class_name, timing in classes.items()
+        ]
+        add_metric(
+            "calls_total",
+            "counter",
+            "Number of calls of an operation.",
+            [(labels, timing["calls"]) for labels, timing in timing_labels],
+        )
+        add_metric(
+            "seconds_total",
+            "counter",
+            "Cumulative seconds spent in an operation.",
+            [(labels, repr(timing["seconds"])) for labels, timing in timing_labels],
+        )
+
+        cache_info = data["parse_cache"]
+        if cache_info is not None:
+            for name in ("hits", "misses", "evictions"):
+                add_metric(
+                    f"parse_cache_{name}_total",
+                    "counter",
+                    f"Number of {name} of the parse cache.",
+                    [({}, cache_info[name])],
+                )
+            add_metric(
+                "parse_cache_entries",
+                "gauge",
+                "Number of entries in the parse cache.",
+                [({}, cache_info["currsize"])],
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def __add_elapsed(self, operation: str, cls: type, elapsed_ns: int) -> None:
+        key = (operation, cls.__name__)
+        with self.__lock:
+            self.__calls[key] += 1
+            self.__elapsed_ns[key] += elapsed_ns
+
+
+# hot paths read this variable directly: a disabled instrumentation costs an attribute lookup
+instrumentation: Optional[Instrumentation] = None
+
+
+def enable_instrumentation() -> Instrumentation:
+    """
+    Enable recording of counters and timings of parsing and formatting.
+    The instrumentation is also enabled at import if the ``HUMANREADABLE_INSTRUMENT``
+    environment variable is ``1``, ``true``, ``yes``, or ``on``.
+    Returns the current instrumentation if it is already enabled.
+
+    Returns:
+        Instrumentation: The enabled instrumentation.
+    """
+
+    global instrumentation
+
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+
+    return instrumentation
+
+
+def disable_instrumentation() -> None:
+    global instrumentation
+
+    instrumentation = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """
+    Returns:
+        Optional[Instrumentation]: The enabled instrumentation,
+        or ``None`` if the instrumentation is disabled.
+    """
+
+    return instrumentation
+
+
+if os.environ.get(ENV_INSTRUMENT, "").strip().lower() in _ENV_TRUE_VALUES:
+    enable_instrumentation()
@@ -0,0 +1,175 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import string
+from typing import TYPE_CHECKING, Any, Final, Optional
+
+import numpy as np
+
+from ._types import ErrorPolicy, SupportsUnit
+
+
+if TYPE_CHECKING:
+    from ._base import HumanReadableValue
+
+
+_SIGN_CHARS: Final[str] = "+-"
+_NUMBER_CHARS: Final[str] = string.digits + "."
+_UNIT_CHARS: Final[str] = string.ascii_letters + string.whitespace + "/"
+_MAX_SUFFIX_SCANS: Final[int] = 32
+_MAX_EXACT_DIGITS: Final[int] = 15
+_MAX_EXACT_FLOAT: Final[float] = float(2**53)
+
+_CODE_ZERO: Final[int] = ord("0")
+_CODE_DOT: Final[int] = ord(".")
+_CODE_PLUS: Final[int] = ord("+")
+_CODE_MINUS: Final[int] = ord("-")
+
+
+def _to_codes(suffixes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns:
+        Unique suffixes and the index of the unique suffix for each element.
+    """
+
+    # values usually include a few distinct suffixes: comparing against each distinct suffix
+    # is much faster than np.unique, which sorts the strings
+    unique_suffixes: list[str] = []
+    codes = np.empty(suffixes.shape, dtype=np.intp)
+    remains = np.ones(suffixes.shape, dtype=np.bool_)
+
+    while len(unique_suffixes) < _MAX_SUFFIX_SCANS:
+        indices = np.flatnonzero(remains)
+        if indices.size == 0:
+            return (np.array(unique_suffixes, dtype=str), codes)
+
+        suffix = suffixes[indices[0]]
+        is_match = suffixes == suffix
+        codes[is_match] = len(unique_suffixes)
+        remains &= ~is_match
+        unique_suffixes.append(str(suffix))
+
+    unique_suffixes_array, codes = np.unique(suffixes, return_inverse=True)
+
+    return (unique_suffixes_array, codes.ravel())
+
+
+def _to_numbers(number_strs: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert decimal number strings with digit-wise integer arithmetic over the code points
+    of the strings. Much faster than astype(np.float64) for unicode arrays.
+
+    Returns:
+        Integer mantissas and powers of ten of the numbers as floats:
+        ``number == mantissa / power``, and whether each string is a valid number
+        that is converted exactly.
+    """
+
+    size = number_strs.size
+    width = max(number_strs.dtype.itemsize // 4, 1)
+    chars = np.ascontiguousarray(number_strs, dtype=f"<U{width}").view(np.uint32)
+    columns = chars.reshape(size, width).T.copy()
+
+    mantissas = np.zeros(size, dtype=np.int64)
+    num_digits = np.zeros(size, dtype=np.int64)
+    num_frac_digits = np.zeros(size, dtype=np.int64)
+    num_dots = np.zeros(size, dtype=np.int64)
+    is_valid = np.ones(size, dtype=np.bool_)
+    is_negative = columns[0] == _CODE_MINUS
+
+    for i, column in enumerate(columns):
+        digits = column - _CODE_ZERO  # wraps around for code points less than "0"
+        is_digit = digits <= 9
+        is_dot = column == _CODE_DOT
+
+        np.multiply(mantissas, 10, out=mantissas, where=is_digit)
+        np.add(mantissas, digits, out=mantissas, where=is_digit)
+        num_digits += is_digit
+        np.add(num_frac_digits, num_dots > 0, out=num_frac_digits, where=is_digit)
+        num_dots += is_dot
+
+        is_other = ~(is_digit | is_dot | (column == 0))
+        if i == 0:
+            is_other &= ~(is_negative | (column == _CODE_PLUS))
+
+        is_valid &= ~is_other
+
+    # mantissas and powers of ten are exact as floats up to 15 digits:
+    # longer numbers are converted by the scalar parser
+    is_valid &= (num_digits > 0) & (num_digits <= _MAX_EXACT_DIGITS) & (num_dots <= 1)
+    np.negative(mantissas, out=mantissas, where=is_negative)
+
+    return (mantissas.astype(np.float64), np.power(10.0, num_frac_digits), is_valid)
+
+
+def parse_array(
+    cls: type["HumanReadableValue"],
+    values: Any,
+    to_unit: SupportsUnit,
+    default_unit: Optional[SupportsUnit],
+    on_error: ErrorPolicy,
+) -> np.ndarray:
+    originals = np.asarray(values)
+    shape = originals.shape
+    originals = originals.ravel()
+    strings = originals if originals.dtype.kind == "U" else originals.astype(str)
+
+    # split each value into the numeric part and the unit suffix:
+    # unit specifiers consist of letters, whitespaces and slashes, numbers of signs, digits and dots.
+    # values are not stripped: leading whitespaces make the numeric part invalid and
+    # trailing whitespaces make the unit suffix invalid, as the scalar parser rejects them
+    number_strs = np.char.rstrip(strings, _UNIT_CHARS)
+    suffixes = np.char.lstrip(np.char.lstrip(strings, _SIGN_CHARS + _NUMBER_CHARS))
+    separator_lengths = (
+        np.char.str_len(strings) - np.char.str_len(number_strs) - np.char.str_len(suffixes)
+    )
+
+    # resolve each distinct suffix only once
+    unique_suffixes, suffix_codes = _to_codes(suffixes)
+    units = [
+        cls._UNIT_RESOLVER.find_unit(suffix) if suffix else default_unit
+        for suffix in unique_suffixes.tolist()
+    ]
+    coefs = [
+        (0, 1)
+        if unit is None
+        else (cls._get_key_coef(unit) / cls._get_key_coef(to_unit)).as_integer_ratio()
+        for unit in units
+    ]
+    coef_numerators = np.array([float(numerator) for numerator, _ in coefs], dtype=np.float64)
+    coef_denominators = np.array([float(denominator) for _, denominator in coefs], dtype=np.float64)
+    unit_found = np.array([unit is not None for unit in units], dtype=np.bool_)
+
+    mantissas, powers, is_valid = _to_numbers(number_strs)
+    is_valid &= unit_found[suffix_codes]
+    # the scalar parser allows at most one whitespace between a number and a unit,
+    # and no whitespace after a number without a unit
+    has_suffix = np.char.str_len(suffixes) > 0
+    is_valid &= np.where(has_suffix, separator_lengths <= 1, separator_lengths == 0)
+
+    # a single division of exact floats is correctly rounded as well as the division of
+    # integers in the scalar parser: values whose products exceed the exact range of floats
+    # are converted by the scalar parser
+    dividends = mantissas * coef_numerators[suffix_codes]
+    divisors = powers * coef_denominators[suffix_codes]
+    is_valid &= (np.abs(dividends) < _MAX_EXACT_FLOAT) & (divisors < _MAX_EXACT_FLOAT)
+    results = dividends / divisors
+
+    # compound values and invalid values are handled by the scalar parser
+    invalid_indices = np.flatnonzero(~is_valid)
+    if invalid_indices.size == 0:
+        return results.reshape(shape)
+
+    results[invalid_indices] = cls.parse_many(
+        originals[invalid_indices].tolist(),
+        to_unit,
+        default_unit=default_unit,
+        on_error="raise" if on_error == "raise" else "nan",
+    )
+
+    if on_error == "skip":
+        is_valid[invalid_indices] = ~np.isnan(results[invalid_indices])
+        return results[is_valid]
+
+    return results.reshape(shape)
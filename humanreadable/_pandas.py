@@ -0,0 +1,203 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Union
+
+from ._base import HumanReadableValue, _validate_error_policy
+from ._persec import BitsPerSecond
+from ._time import Time
+from ._types import ErrorPolicy, HumanReadableStyle, SupportsUnit
+from .error import ParameterError, UnitNotFoundError
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+_VALUE_CLASSES: tuple[type[HumanReadableValue], ...] = (Time, BitsPerSecond)
+
+
+def _find_value_class(unit: Union[str, SupportsUnit]) -> type[HumanReadableValue]:
+    for cls in _VALUE_CLASSES:
+        try:
+            cls._normalize_unit(unit)
+        except ValueError:
+            continue
+
+        return cls
+
+    raise UnitNotFoundError("unit not found", value=unit)
+
+
+def _parse_series(
+    series: "pd.Series",
+    cls: type[HumanReadableValue],
+    unit: Union[str, SupportsUnit],
+    default_unit: Union[str, SupportsUnit, None],
+    on_error: ErrorPolicy,
+) -> "pd.Series":
+    import numpy as np
+    import pandas as pd
+
+    # parse each distinct value only once: missing values are coded as -1 and become NaN
+    codes, uniques = pd.factorize(series)
+    parsed = cls.parse_array(
+        np.asarray(uniques, dtype=object),
+        unit,
+        default_unit=default_unit,
+        on_error="raise" if on_error == "raise" else "nan",
+    )
+    results = np.append(parsed, np.nan)[codes]
+    converted = pd.Series(results, index=series.index, name=series.name, dtype=np.float64)
+
+    if on_error == "skip":
+        # parsed values are never NaN: drop missing values and values that failed to parse
+        return converted[~np.isnan(results)]
+
+    return converted
+
+
+class HumanReadableSeriesAccessor:
+    """
+    pandas Series accessor to convert human-readable values with vectorized operations.
+    Registered by ``register_pandas_accessor``.
+
+    Example:
+        >>> df["latency"].humanreadable.to("ms")
+        >>> df["link"].humanreadable.bitrate("Gbps")
+    """
+
+    def __init__(self, series: "pd.Series") -> None:
+        self._series = series
+
+    def to(
+        self,
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+    ) -> "pd.Series":
+        """
+        Convert human-readable values to a float column in a unit.
+        The kind of values (time or bits per second) is determined by the unit.
+        """
+
+        return _parse_series(self._series, _find_value_class(unit), unit, default_unit, on_error)
+
+    def duration(
+        self,
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+    ) -> "pd.Series":
+        """
+        Convert human-readable time values to a float column in a unit.
+        """
+
+        return _parse_series(self._series, Time, unit, default_unit, on_error)
+
+    def bitrate(
+        self,
+        unit: Union[str, SupportsUnit],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+    ) -> "pd.Series":
+        """
+        Convert human-readable bits per second values to a float column in a unit.
+        """
+
+        return _parse_series(self._series, BitsPerSecond, unit, default_unit, on_error)
+
+    def to_humanreadable(
+        self, unit: Union[str, SupportsUnit], style: HumanReadableStyle = "full"
+    ) -> "pd.Series":
+        """
+        Format a numeric column in a unit to a categorical column of human-readable strings.
+        Each distinct number is formatted only once.
+        """
+
+        import numpy as np
+        import pandas as pd
+
+        cls = _find_value_class(unit)
+        codes, uniques = pd.factorize(self._series)
+        texts = [
+            cls.from_value(float(value), unit).to_humanreadable(style=style) for value in uniques
+        ]
+
+        # distinct numbers may be formatted to the same string
+        text_codes, categories = pd.factorize(pd.Index(texts, dtype=object))
+        codes = np.where(codes >= 0, np.append(text_codes, -1)[codes], -1)
+
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories),
+            index=self._series.index,
+            name=self._series.name,
+        )
+
+
+class HumanReadableDataFrameAccessor:
+    """
+    pandas DataFrame accessor to convert human-readable columns with vectorized operations.
+    Registered by ``register_pandas_accessor``.
+
+    Example:
+        >>> df.humanreadable.to({"latency": "ms", "link": "Gbps"})
+    """
+
+    def __init__(self, df: "pd.DataFrame") -> None:
+        self._df = df
+
+    def to(
+        self,
+        units: Mapping[Any, Union[str, SupportsUnit]],
+        default_unit: Union[str, SupportsUnit, None] = None,
+        on_error: ErrorPolicy = "raise",
+    ) -> "pd.DataFrame":
+        """
+        Convert human-readable columns to float columns.
+
+        Args:
+            units (Mapping):
+                Mapping of column names to the units of the converted columns.
+            on_error (str):
+                ``"skip"`` is not supported for DataFrames because it changes the
+                length of columns: use ``"nan"`` instead.
+
+        Returns:
+            pandas.DataFrame: A copy of the DataFrame with the converted columns.
+        """
+
+        _validate_error_policy(on_error)
+        if on_error == "skip":
+            raise ParameterError(
+                "invalid error policy for DataFrame", expected="raise or nan", value=on_error
+            )
+
+        df = self._df.copy()
+        for column, unit in units.items():
+            df[column] = _parse_series(
+                df[column], _find_value_class(unit), unit, default_unit, on_error
+            )
+
+        return df
+
+
+def register_pandas_accessor(name: str = "humanreadable") -> None:
+    """
+    Register pandas accessors for Series and DataFrame.
+    Requires pandas.
+
+    Args:
+        name (str):
+            Accessor name. Defaults to ``humanreadable``.
+    """
+
+    import pandas as pd
+
+    if getattr(pd.Series, name, None) is not HumanReadableSeriesAccessor:
+        pd.api.extensions.register_series_accessor(name)(HumanReadableSeriesAccessor)
+
+    if getattr(pd.DataFrame, name, None) is not HumanReadableDataFrameAccessor:
+        pd.api.extensions.register_dataframe_accessor(name)(HumanReadableDataFrameAccessor)
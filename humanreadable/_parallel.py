@@ -0,0 +1,85 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import math
+import os
+from array import array
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Final, Optional, Union
+
+from ._types import ErrorPolicy, SupportsUnit
+from .error import ParameterError
+
+
+if TYPE_CHECKING:
+    from ._base import HumanReadableValue
+
+
+# number of chunks per worker: smaller chunks balance the load between workers
+_CHUNKS_PER_WORKER: Final[int] = 4
+
+
+def _parse_chunk(
+    cls: type["HumanReadableValue"],
+    values: Sequence[str],
+    unit: SupportsUnit,
+    default_unit: Optional[SupportsUnit],
+    on_error: ErrorPolicy,
+) -> "array[float]":
+    # runs in worker processes: returns an array, which is pickled as a compact byte buffer
+    return cls.parse_many(values, unit, default_unit=default_unit, on_error=on_error)
+
+
+def parse_many_parallel(
+    cls: type["HumanReadableValue"],
+    values: Iterable[str],
+    unit: Union[str, SupportsUnit],
+    default_unit: Union[str, SupportsUnit, None],
+    on_error: ErrorPolicy,
+    workers: Optional[int],
+    executor: Optional[Executor],
+    chunksize: Optional[int],
+) -> "array[float]":
+    if workers is not None and workers < 1:
+        raise ParameterError(
+            "invalid workers", expected="greater than or equal to 1", value=workers
+        )
+
+    if chunksize is not None and chunksize < 1:
+        raise ParameterError(
+            "invalid chunksize", expected="greater than or equal to 1", value=chunksize
+        )
+
+    # resolve units before spawning workers so that invalid units fail fast
+    to_unit = cls._normalize_unit(unit)
+    default_unit = cls._normalize_unit(default_unit)
+
+    values = values if isinstance(values, Sequence) else list(values)
+    num_workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(math.ceil(len(values) / (num_workers * _CHUNKS_PER_WORKER)), 1)
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=num_workers) as owned_executor:
+            return parse_many_parallel(
+                cls, values, to_unit, default_unit, on_error, workers, owned_executor, chunksize
+            )
+
+    futures = [
+        executor.submit(
+            _parse_chunk, cls, values[i : i + chunksize], to_unit, default_unit, on_error
+        )
+        for i in range(0, len(values), chunksize)
+    ]
+
+    results: array[float] = array("d")
+    try:
+        for future in futures:
+            results.extend(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return results
@@ -2,15 +2,18 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+from bisect import bisect_right
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
 from decimal import Decimal
 from re import Pattern
 from typing import Final, NamedTuple, Optional, Union, cast
 
+from . import _instrument
 from ._base import HumanReadableValue
-from ._common import compile_units_regex_pattern
+from ._common import UnitResolver, compile_units_regex_pattern, get_decimal_context
 from ._types import HumanReadableStyle, SupportsUnit, TextUnitsMap, Units
+from .error import ParameterError
 
 
 _BPS_PATTERN: Final[str] = r"bits?(/|\s?per\s?)(s|sec|second)"
@@ -34,6 +37,25 @@ class ByteUnit(NamedTuple):
     full_unit_expr: str
 
 
+class _FormatTable(NamedTuple):
+    # bps of one of each unit in ascending order, and the units
+    thresholds: list[int]
+    units: list[ByteUnit]
+
+
+def _make_format_table(units: list[ByteUnit]) -> _FormatTable:
+    units = sorted(units, key=lambda unit: unit.k_size**unit.factor)
+
+    return _FormatTable(thresholds=[unit.k_size**unit.factor for unit in units], units=units)
+
+
+def _to_unit_label(unit: ByteUnit, style: str) -> str:
+    if style == "full":
+        return f" {unit.full_unit_expr}"
+
+    return f" {unit.name}"
+
+
 class BitsPerSecond(HumanReadableValue):
     """
     String converter that human-readable byte size to a number.
@@ -43,7 +65,8 @@ class BitsPerSecond(HumanReadableValue):
             Human readable size (bit per second). e.g. 256 Mbps
     """
 
-    @dataclass(frozen=True)
+    __slots__ = ()
+
     class Unit:
         BPS = ByteUnit(
             name="bps",
@@ -122,11 +145,55 @@ class BitsPerSecond(HumanReadableValue):
             Unit.BPS: _BPS_STR_UNITS,
         }
     )
+    _BASE_UNIT: Final[SupportsUnit] = Unit.BPS
+    _UNIT_RESOLVER: Final[UnitResolver] = UnitResolver(_TEXT_UNITS)
+
+    # units to format values with per base: SI (1000) and IEC (1024)
+    _FORMAT_TABLES: Final[dict[int, _FormatTable]] = {
+        1000: _make_format_table([Unit.BPS, Unit.KBPS, Unit.MBPS, Unit.GBPS, Unit.TBPS]),
+        1024: _make_format_table([Unit.BPS, Unit.KIBPS, Unit.MIBPS, Unit.GIBPS, Unit.TIBPS]),
+    }
 
     @classmethod
     def get_text_units(cls) -> TextUnitsMap:
         return cls._TEXT_UNITS
 
+    @classmethod
+    def from_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.BPS)
+
+    @classmethod
+    def from_kilo_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.KBPS)
+
+    @classmethod
+    def from_kibi_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.KIBPS)
+
+    @classmethod
+    def from_mega_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.MBPS)
+
+    @classmethod
+    def from_mebi_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.MIBPS)
+
+    @classmethod
+    def from_giga_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.GBPS)
+
+    @classmethod
+    def from_gibi_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.GIBPS)
+
+    @classmethod
+    def from_tera_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.TBPS)
+
+    @classmethod
+    def from_tebi_bps(cls, number: Union[int, float, Decimal]) -> "BitsPerSecond":
+        return cls.from_value(number, cls.Unit.TIBPS)
+
     @property
     def _text_units(self) -> TextUnitsMap:
         return self._TEXT_UNITS
@@ -147,7 +214,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.BPS))
+        return self._convert_to(self.Unit.BPS)
 
     @property
     def byte_per_sec(self) -> float:
@@ -155,7 +222,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def kilo_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.KBPS))
+        return self._convert_to(self.Unit.KBPS)
 
     @property
     def kilo_byte_per_sec(self) -> float:
@@ -163,7 +230,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def kibi_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.KIBPS))
+        return self._convert_to(self.Unit.KIBPS)
 
     @property
     def kibi_byte_per_sec(self) -> float:
@@ -171,7 +238,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def mega_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.MBPS))
+        return self._convert_to(self.Unit.MBPS)
 
     @property
     def mega_byte_per_sec(self) -> float:
@@ -179,7 +246,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def mebi_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.MIBPS))
+        return self._convert_to(self.Unit.MIBPS)
 
     @property
     def mebi_byte_per_sec(self) -> float:
@@ -187,7 +254,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def giga_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.GBPS))
+        return self._convert_to(self.Unit.GBPS)
 
     @property
     def giga_byte_per_sec(self) -> float:
@@ -195,7 +262,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def gibi_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.GIBPS))
+        return self._convert_to(self.Unit.GIBPS)
 
     @property
     def gibi_byte_per_sec(self) -> float:
@@ -203,7 +270,7 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def tera_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.TBPS))
+        return self._convert_to(self.Unit.TBPS)
 
     @property
     def tera_byte_per_sec(self) -> float:
@@ -211,88 +278,156 @@ class BitsPerSecond(HumanReadableValue):
 
     @property
     def tebi_bps(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.TIBPS))
+        return self._convert_to(self.Unit.TIBPS)
 
     @property
     def tebi_byte_per_sec(self) -> float:
         return self.tebi_bps / 8
 
-    def __eq__(self, other) -> bool:
-        return self.bps == other.bps
-
-    def __ne__(self, other) -> bool:
-        return self.bps != other.bps
-
-    def __lt__(self, other) -> bool:
-        return self.bps < other.bps
-
-    def __le__(self, other) -> bool:
-        return self.bps <= other.bps
-
-    def __gt__(self, other) -> bool:
-        return self.bps > other.bps
-
-    def __ge__(self, other) -> bool:
-        return self.bps >= other.bps
-
-    def __add__(self, other: "BitsPerSecond") -> "BitsPerSecond":
-        number = self._number + Decimal(other.get_as(self._from_unit))
-        return BitsPerSecond(str(number), default_unit=self._from_unit)
-
     def get_as(self, unit: Union[str, SupportsUnit]) -> float:
-        unit_maps: dict[SupportsUnit, str] = {
-            self.Unit.BPS: "bps",
-            self.Unit.KBPS: "kilo_bps",
-            self.Unit.KIBPS: "kibi_bps",
-            self.Unit.MBPS: "mega_bps",
-            self.Unit.MIBPS: "mebi_bps",
-            self.Unit.GBPS: "giga_bps",
-            self.Unit.GIBPS: "gibi_bps",
-            self.Unit.TBPS: "tera_bps",
-            self.Unit.TIBPS: "tebi_bps",
-        }
         norm_unit = self._normalize_unit(unit)
         assert norm_unit
 
-        return getattr(self, unit_maps[norm_unit])
+        return self._convert_to(norm_unit)
 
-    def _normalize_unit(self, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
+    @classmethod
+    def _normalize_unit(cls, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
         if isinstance(unit, ByteUnit):
             return unit
 
         return super()._normalize_unit(unit)
 
-    def __calc_coef(self, from_unit: SupportsUnit, to_unit: ByteUnit) -> Decimal:
+    @classmethod
+    def _compute_coef(cls, from_unit: SupportsUnit, to_unit: SupportsUnit) -> Decimal:
         from_unit_bu = cast(ByteUnit, from_unit)
-        if from_unit_bu.k_size == to_unit.k_size:
-            return Decimal(from_unit_bu.k_size ** (from_unit_bu.factor - to_unit.factor))
+        to_unit_bu = cast(ByteUnit, to_unit)
+        context = get_decimal_context()
+        if from_unit_bu.k_size == to_unit_bu.k_size:
+            return context.power(
+                Decimal(from_unit_bu.k_size), from_unit_bu.factor - to_unit_bu.factor
+            )
+
+        return context.divide(
+            Decimal(from_unit_bu.k_size**from_unit_bu.factor),
+            Decimal(to_unit_bu.k_size**to_unit_bu.factor),
+        )
 
-        return Decimal(from_unit_bu.k_size**from_unit_bu.factor) / Decimal(
-            to_unit.k_size**to_unit.factor
+    @classmethod
+    def __get_format_table(cls, base: int) -> _FormatTable:
+        try:
+            return cls._FORMAT_TABLES[base]
+        except KeyError:
+            raise ParameterError(
+                "invalid base", expected=" or ".join(map(str, cls._FORMAT_TABLES)), value=base
+            ) from None
+
+    @staticmethod
+    def __validate_precision(precision: int) -> None:
+        if not isinstance(precision, int) or isinstance(precision, bool) or precision < 0:
+            raise ParameterError(
+                "invalid precision", expected="greater than or equal to 0", value=precision
+            )
+
+    @staticmethod
+    def __find_unit_index(table: _FormatTable, bps: float) -> int:
+        # the largest unit that the value is one or more of. smaller values are in bps.
+        return max(bisect_right(table.thresholds, abs(bps)) - 1, 0)
+
+    def to_humanreadable(
+        self, style: HumanReadableStyle = "full", base: Optional[int] = None, precision: int = 1
+    ) -> str:
+        """
+        Convert the value to a human-readable string in the largest unit
+        that the value is one or more of.
+
+        Args:
+            style (str):
+                ``"full"`` for unit names (e.g. ``bits per second``),
+                otherwise unit symbols (e.g. ``bps``).
+            base (Optional[int]):
+                ``1000`` for SI units (e.g. ``Mbps``) or ``1024`` for IEC units (e.g. ``Mibps``).
+                Defaults to the base of the unit of the value.
+            precision (int):
+                Number of digits after the decimal point.
+
+        Returns:
+            A human-readable string.
+        """
+
+        instrumentation = _instrument.instrumentation
+        if instrumentation is None:
+            return self.__to_humanreadable(style, base, precision)
+
+        return instrumentation.measure(
+            "format", type(self), self.__to_humanreadable, style, base, precision
         )
 
-    def __filter_units_by_k(
-        self, units: list[SupportsUnit], from_unit: SupportsUnit
-    ) -> list[SupportsUnit]:
-        from_unit_bu = cast(ByteUnit, from_unit)
-        return [u for u in units if cast(ByteUnit, u).k_size == from_unit_bu.k_size]
+    def __to_humanreadable(self, style: str, base: Optional[int], precision: int) -> str:
+        if base is None:
+            base = cast(ByteUnit, self._from_unit).k_size
+
+        table = self.__get_format_table(base)
+        self.__validate_precision(precision)
 
-    def to_humanreadable(self, style: HumanReadableStyle = "full") -> str:
-        def _to_unit_str(unit, style: str) -> str:
-            if style == "full":
-                return f" {unit.full_unit_expr}"
+        unit = table.units[self.__find_unit_index(table, self.bps)]
 
-            return f" {unit.name}"
+        return f"{self.get_as(unit):.{precision:d}f}{_to_unit_label(unit, style)}"
+
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[Union[int, float]],
+        style: HumanReadableStyle = "full",
+        base: int = 1000,
+        precision: int = 1,
+    ) -> list[str]:
+        """
+        Convert numbers in bps to human-readable strings without creating an instance
+        for each number.
+
+        Args:
+            values (Iterable[Union[int, float]]):
+                Numbers in bps to convert, such as a list or a NumPy array.
+            style (str):
+                ``"full"`` for unit names, otherwise unit symbols.
+            base (int):
+                ``1000`` for SI units or ``1024`` for IEC units.
+            precision (int):
+                Number of digits after the decimal point.
+
+        Returns:
+            Human-readable strings in the order of the numbers.
+        """
+
+        instrumentation = _instrument.instrumentation
+        if instrumentation is None:
+            return cls.__format_many(values, style, base, precision)
+
+        return instrumentation.measure(
+            "format_many", cls, cls.__format_many, values, style, base, precision
+        )
+
+    @classmethod
+    def __format_many(
+        cls, values: Iterable[Union[int, float]], style: str, base: int, precision: int
+    ) -> list[str]:
+        table = cls.__get_format_table(base)
+        cls.__validate_precision(precision)
+
+        thresholds = table.thresholds
+        formatters: list[Callable[[float], str]] = [
+            f"{{:.{precision:d}f}}{_to_unit_label(unit, style)}".format for unit in table.units
+        ]
+        results: list[str] = []
 
-        filtered_units = self.__filter_units_by_k(self._units, self._from_unit)
-        for unit in reversed(sorted(filtered_units, key=lambda u: cast(ByteUnit, u).factor)):
-            number = self.get_as(unit)
-            if number < 1:
-                continue
+        for bps in values:
+            i = bisect_right(thresholds, abs(bps)) - 1
+            if i < 0:
+                i = 0
 
-            return f"{number:.1f}{_to_unit_str(unit, style)}"
+            results.append(formatters[i](bps / thresholds[i]))
 
-        raise ValueError("unit not found")
+        return results
 
 
 BitPerSecond = BitsPerSecond
@@ -0,0 +1,283 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import math
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
+
+from ._base import HumanReadableValue, _normalize_key, _to_exact_fraction
+from ._types import SupportsUnit
+from .error import ParameterError
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+_T = TypeVar("_T", bound=HumanReadableValue)
+
+
+class ValueRange(Generic[_T]):
+    """
+    Reusable validator of a closed range of human-readable values.
+    The bounds are parsed and converted once when the validator is created.
+
+    Values to check can be instances of the value class, human-readable strings,
+    or numbers in the base unit of the class (seconds or bps).
+    Instances, strings, integers, and decimals are compared exactly with the comparison keys
+    of the bounds, as comparison operators of the values do.
+    Floats are compared with the bounds that are converted to floats in the unit once,
+    which can differ from an exact comparison only for floats next to a bound.
+
+    Args:
+        cls (type):
+            Value class of the range.
+        min_value (Union[str, HumanReadableValue, None]):
+            Minimum value of the range. ``None`` for no lower bound.
+        max_value (Union[str, HumanReadableValue, None]):
+            Maximum value of the range. ``None`` for no upper bound.
+    """
+
+    @property
+    def min_value(self) -> Optional[_T]:
+        return self.__min_value
+
+    @property
+    def max_value(self) -> Optional[_T]:
+        return self.__max_value
+
+    def __init__(
+        self,
+        cls: type[_T],
+        min_value: Union[str, _T, None] = None,
+        max_value: Union[str, _T, None] = None,
+    ) -> None:
+        self.__cls = cls
+        self.__min_value = self.__to_bound(min_value)
+        self.__max_value = self.__to_bound(max_value)
+        self.__min_key = None if self.__min_value is None else self.__min_value._get_key()
+        self.__max_key = None if self.__max_value is None else self.__max_value._get_key()
+
+        if (
+            self.__min_key is not None
+            and self.__max_key is not None
+            and self.__min_key > self.__max_key
+        ):
+            raise ParameterError(
+                "min_value must be less than or equal to max_value",
+                expected=f"less than or equal to {self.__max_value}",
+                value=self.__min_value,
+            )
+
+        # float bounds of numbers in a unit: (-inf, inf) for missing bounds
+        self.__float_bounds: dict[SupportsUnit, tuple[float, float]] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"ValueRange({self.__cls.__name__}, "
+            f"min_value={self.__min_value}, max_value={self.__max_value})"
+        )
+
+    def __contains__(self, value: Any) -> bool:
+        base_unit = self.__cls._BASE_UNIT
+        return self.__compare(value, base_unit, self.__get_float_bounds(base_unit)) == 0
+
+    def validate(self, value: Any) -> None:
+        """
+        Raises:
+            ParameterError:
+                If the value is out of the range.
+        """
+
+        base_unit = self.__cls._BASE_UNIT
+        result = self.__compare(value, base_unit, self.__get_float_bounds(base_unit))
+        if result < 0:
+            raise ParameterError(
+                "value is too low",
+                expected=f"greater than or equal to {self.__min_value}",
+                value=value,
+            )
+        if result > 0:
+            raise ParameterError(
+                "value is too high",
+                expected=f"less than or equal to {self.__max_value}",
+                value=value,
+            )
+
+    def mask(
+        self, values: Iterable[Any], unit: Union[str, SupportsUnit, None] = None
+    ) -> list[bool]:
+        """
+        Check values in a batch.
+
+        Args:
+            values (Iterable):
+                Values to check.
+            unit (Union[str, SupportsUnit, None]):
+                Unit of the values that are plain numbers. Defaults to the base unit.
+
+        Returns:
+            list[bool]: Whether each value is within the range, in the order of the values.
+        """
+
+        norm_unit = self.__cls._BASE_UNIT if unit is None else self.__normalize_unit(unit)
+        float_bounds = self.__get_float_bounds(norm_unit)
+        lower, upper = float_bounds
+        compare = self.__compare
+
+        return [
+            lower <= value <= upper
+            if type(value) is float
+            else compare(value, norm_unit, float_bounds) == 0
+            for value in values
+        ]
+
+    def invalid_indices(
+        self, values: Iterable[Any], unit: Union[str, SupportsUnit, None] = None
+    ) -> list[int]:
+        """
+        Returns:
+            list[int]: Indices of the values that are out of the range.
+            See :py:meth:`mask` for the arguments.
+        """
+
+        return list(self.iter_invalid(values, unit))
+
+    def iter_invalid(
+        self, values: Iterable[Any], unit: Union[str, SupportsUnit, None] = None
+    ) -> Iterator[int]:
+        """
+        Check a stream of values lazily.
+        See :py:meth:`mask` for the arguments.
+
+        Yields:
+            int: Indices of the values that are out of the range.
+        """
+
+        norm_unit = self.__cls._BASE_UNIT if unit is None else self.__normalize_unit(unit)
+        float_bounds = self.__get_float_bounds(norm_unit)
+        lower, upper = float_bounds
+        compare = self.__compare
+
+        for i, value in enumerate(values):
+            if type(value) is float:
+                if not lower <= value <= upper:
+                    yield i
+            elif compare(value, norm_unit, float_bounds) != 0:
+                yield i
+
+    def mask_array(self, numbers: Any, unit: Union[str, SupportsUnit]) -> "np.ndarray":
+        """
+        Check an array of numbers in a unit with vectorized NumPy comparisons.
+        Requires NumPy.
+
+        Args:
+            numbers (array_like):
+                Numbers in the unit.
+            unit (Union[str, SupportsUnit]):
+                Unit of the numbers.
+
+        Returns:
+            numpy.ndarray: A boolean array with the same shape as the numbers
+            that is ``True`` for numbers within the range. NaN is out of the range.
+        """
+
+        import numpy as np
+
+        lower, upper = self.__get_float_bounds(self.__normalize_unit(unit))
+        array = np.asarray(numbers, dtype=np.float64)
+
+        return (array >= lower) & (array <= upper)
+
+    def __to_bound(self, value: Union[str, _T, None]) -> Optional[_T]:
+        if value is None:
+            return None
+
+        cls = self.__cls
+        if isinstance(value, str):
+            return cls(value)
+
+        if isinstance(value, HumanReadableValue) and value._COEF_TABLE is cls._COEF_TABLE:
+            return value
+
+        raise TypeError(f"bound of {cls.__name__}.range must be a string or a {cls.__name__}")
+
+    def __normalize_unit(self, unit: Union[str, SupportsUnit]) -> SupportsUnit:
+        norm_unit = self.__cls._normalize_unit(unit)
+        assert norm_unit
+
+        return norm_unit
+
+    def __get_float_bounds(self, unit: SupportsUnit) -> tuple[float, float]:
+        try:
+            return self.__float_bounds[unit]
+        except KeyError:
+            pass
+
+        min_value = self.__min_value
+        max_value = self.__max_value
+        bounds = (
+            -math.inf if min_value is None else min_value._convert_to(unit),
+            math.inf if max_value is None else max_value._convert_to(unit),
+        )
+        self.__float_bounds[unit] = bounds
+
+        return bounds
+
+    def __compare(self, value: Any, unit: SupportsUnit, float_bounds: tuple[float, float]) -> int:
+        """
+        Args:
+            unit:
+                Unit of the value if the value is a number.
+            float_bounds:
+                Bounds of the range as floats in the unit.
+
+        Returns:
+            Negative if the value is lower than the range, positive if the value is higher
+            than the range, or zero if the value is within the range.
+        """
+
+        cls = self.__cls
+        key: Union[int, Fraction]
+
+        if type(value) is cls or isinstance(value, HumanReadableValue):
+            if value._COEF_TABLE is not cls._COEF_TABLE:
+                raise TypeError(f"unsupported value for {cls.__name__}.range: {value!r}")
+
+            key = value._key
+            if key is None:
+                key = value._get_key()
+        elif isinstance(value, str):
+            key = cls(value)._get_key()
+        elif isinstance(value, float):
+            lower, upper = float_bounds
+            if value < lower:
+                return -1
+            if value > upper:
+                return 1
+            if value != value:
+                # NaN is not within any range
+                return -1
+
+            return 0
+        elif isinstance(value, (int, Decimal)) and not isinstance(value, bool):
+            if isinstance(value, Decimal) and not value.is_finite():
+                # NaN and infinities compare as floats do
+                return self.__compare(float(value), unit, float_bounds)
+
+            key = _normalize_key(_to_exact_fraction(value) * cls._get_key_coef(unit))
+        else:
+            raise TypeError(f"unsupported value for {cls.__name__}.range: {value!r}")
+
+        min_key = self.__min_key
+        if min_key is not None and key < min_key:
+            return -1
+
+        max_key = self.__max_key
+        if max_key is not None and key > max_key:
+            return 1
+
+        return 0
@@ -4,13 +4,16 @@
 
 import re
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Iterable
+from datetime import timedelta
 from decimal import Decimal
+from fractions import Fraction
 from re import Pattern
-from typing import Final, NamedTuple, Optional, Union, cast
+from typing import ClassVar, Final, NamedTuple, Optional, Union, cast
 
-from ._base import HumanReadableValue
-from ._common import compile_units_regex_pattern
+from . import _instrument
+from ._base import HumanReadableValue, _strip_zeros
+from ._common import UnitResolver, compile_units_regex_pattern, get_decimal_context
 from ._types import HumanReadableStyle, SupportsUnit, TextUnitsMap, Units
 from .error import ParameterError
 
@@ -21,6 +24,7 @@ _MINUTE_STR_UNITS: Final[Units] = ("m", "min", "mins", "minute", "minutes")
 _SEC_STR_UNITS: Final[Units] = ("s", "sec", "secs", "second", "seconds")
 _MSEC_STR_UNITS: Final[Units] = ("ms", "msec", "msecs", "millisecond", "milliseconds")
 _USEC_STR_UNITS: Final[Units] = ("us", "usec", "usecs", "microsecond", "microseconds")
+_NSEC_STR_UNITS: Final[Units] = ("ns", "nsec", "nsecs", "nanosecond", "nanoseconds")
 
 
 class TimeUnit(NamedTuple):
@@ -32,7 +36,8 @@ class TimeUnit(NamedTuple):
 
 
 class Time(HumanReadableValue):
-    @dataclass(frozen=True)
+    __slots__ = ()
+
     class Unit:
         DAY = TimeUnit(
             name="days",
@@ -76,6 +81,13 @@ class Time(HumanReadableValue):
             sixty_factor=2,
             day_factor=1,
         )
+        NANOSECOND = TimeUnit(
+            name="nanoseconds",
+            regexp=compile_units_regex_pattern(_NSEC_STR_UNITS, re.IGNORECASE),
+            thousand_factor=3,
+            sixty_factor=2,
+            day_factor=1,
+        )
 
     _TEXT_UNITS: Final[TextUnitsMap] = OrderedDict(
         {
@@ -85,36 +97,141 @@ class Time(HumanReadableValue):
             Unit.SECOND: _SEC_STR_UNITS,
             Unit.MILLISECOND: _MSEC_STR_UNITS,
             Unit.MICROSECOND: _USEC_STR_UNITS,
+            Unit.NANOSECOND: _NSEC_STR_UNITS,
         }
     )
+    _BASE_UNIT: Final[SupportsUnit] = Unit.SECOND
+    _UNIT_RESOLVER: Final[UnitResolver] = UnitResolver(_TEXT_UNITS, re.IGNORECASE)
+
+    # labels and sizes in the comparison key unit of the units, per style
+    _COMPONENTS: ClassVar[dict[str, tuple[tuple[str, int], ...]]] = {}
 
     @classmethod
     def get_text_units(cls) -> TextUnitsMap:
         return cls._TEXT_UNITS
 
+    @classmethod
+    def from_days(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.DAY)
+
+    @classmethod
+    def from_hours(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.HOUR)
+
+    @classmethod
+    def from_minutes(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.MINUTE)
+
+    @classmethod
+    def from_seconds(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.SECOND)
+
+    @classmethod
+    def from_milliseconds(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.MILLISECOND)
+
+    @classmethod
+    def from_microseconds(cls, number: Union[int, float, Decimal]) -> "Time":
+        return cls.from_value(number, cls.Unit.MICROSECOND)
+
+    @classmethod
+    def from_nanoseconds(cls, number: Union[int, float, Decimal]) -> "Time":
+        if type(number) is int:
+            # an integer of nanoseconds is the comparison key itself
+            return cls._new(Decimal(number), cls.Unit.NANOSECOND, key=number)
+
+        return cls.from_value(number, cls.Unit.NANOSECOND)
+
+    @classmethod
+    def from_timedelta(cls, delta: timedelta) -> "Time":
+        """
+        Create an instance from a :py:class:`datetime.timedelta` without rounding.
+
+        Args:
+            delta (datetime.timedelta):
+                Duration to convert.
+
+        Returns:
+            Time: A value in seconds.
+        """
+
+        if not isinstance(delta, timedelta):
+            raise TypeError(f"delta must be a timedelta: actual={type(delta)}")
+
+        microseconds = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+        return cls._new(
+            _strip_zeros(Decimal(microseconds).scaleb(-6)),
+            cls.Unit.SECOND,
+            key=microseconds * 1000,
+        )
+
+    from_ms = from_milliseconds
+    from_us = from_microseconds
+    from_ns = from_nanoseconds
+
     @property
     def days(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.DAY))
+        return self._convert_to(self.Unit.DAY)
 
     @property
     def hours(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.HOUR))
+        return self._convert_to(self.Unit.HOUR)
 
     @property
     def minutes(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.MINUTE))
+        return self._convert_to(self.Unit.MINUTE)
 
     @property
     def seconds(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.SECOND))
+        return self._convert_to(self.Unit.SECOND)
 
     @property
     def milliseconds(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.MILLISECOND))
+        return self._convert_to(self.Unit.MILLISECOND)
 
     @property
     def microseconds(self) -> float:
-        return float(self._number * self.__calc_coef(self._from_unit, self.Unit.MICROSECOND))
+        return self._convert_to(self.Unit.MICROSECOND)
+
+    @property
+    def nanoseconds(self) -> float:
+        return self._convert_to(self.Unit.NANOSECOND)
+
+    def total_ns(self) -> int:
+        """
+        Returns:
+            int: The exact number of nanoseconds of the value,
+            rounded half to even if the value has a finer fraction.
+        """
+
+        key = self._key
+        if key is None:
+            key = self._get_key()
+
+        return key if type(key) is int else round(key)
+
+    def to_timedelta(self) -> timedelta:
+        """
+        Returns:
+            datetime.timedelta: The value as a duration,
+            rounded half to even to microseconds as a ``timedelta`` rounds.
+
+        Raises:
+            OverflowError:
+                If the value is out of the range of a ``timedelta``.
+        """
+
+        key = self._key
+        if key is None:
+            key = self._get_key()
+
+        if type(key) is int:
+            microseconds, remainder = divmod(key, 1000)
+            if remainder == 0:
+                return timedelta(microseconds=microseconds)
+
+        return timedelta(microseconds=round(Fraction(key) / 1000))
 
     @property
     def _text_units(self) -> TextUnitsMap:
@@ -129,44 +246,32 @@ class Time(HumanReadableValue):
             self.Unit.SECOND,
             self.Unit.MILLISECOND,
             self.Unit.MICROSECOND,
+            self.Unit.NANOSECOND,
         ]
 
-    def __init__(
-        self, readable_value: str, default_unit: Union[str, SupportsUnit, None] = None
-    ) -> None:
-        values = re.findall(r"\d+\s*[a-zA-Z]+", readable_value)
-        if len(values) <= 1:
-            super().__init__(readable_value, default_unit)
-            return
-
-        t = _parse(readable_value, default_unit)
-        self._default_unit = t._default_unit
-        self._number = t._number
-        self._from_unit = t._from_unit
-
-        assert self._default_unit
-
-    def __eq__(self, other) -> bool:
-        return self.microseconds == other.microseconds
-
-    def __ne__(self, other) -> bool:
-        return self.microseconds != other.microseconds
-
-    def __lt__(self, other) -> bool:
-        return self.microseconds < other.microseconds
-
-    def __le__(self, other) -> bool:
-        return self.microseconds <= other.microseconds
-
-    def __gt__(self, other) -> bool:
-        return self.microseconds > other.microseconds
-
-    def __ge__(self, other) -> bool:
-        return self.microseconds >= other.microseconds
+    @classmethod
+    def _parse_compound(cls, readable_value: str) -> Optional[tuple[Decimal, SupportsUnit]]:
+        items = cls._UNIT_RESOLVER.split_compound(readable_value)
+
+        instrumentation = _instrument.instrumentation
+        if instrumentation is not None:
+            # the match of the sign and the matches of the items
+            instrumentation.add_regex_attempts(cls, 1 + (1 if items is None else len(items)))
+
+        if items is None or len(items) <= 1:
+            return None
+
+        # sum up to the finest unit of the items: coefficients from coarser units are integers
+        units = list(cls._TEXT_UNITS)
+        to_unit = max((unit for _, unit in items), key=units.index)
+        context = get_decimal_context()
+        number = Decimal(0)
+        for number_str, unit in items:
+            number = context.add(
+                number, context.multiply(Decimal(number_str), cls._calc_coef(unit, to_unit))
+            )
 
-    def __add__(self, other: "Time") -> "Time":
-        number = self._number + Decimal(other.get_as(self._from_unit))
-        return Time(str(number), default_unit=self._from_unit)
+        return (_strip_zeros(number), to_unit)
 
     def validate(self, min_value=None, max_value=None) -> None:
         if min_value is not None:
@@ -192,82 +297,129 @@ class Time(HumanReadableValue):
                 )
 
     def get_as(self, unit: Union[str, SupportsUnit]) -> float:
-        unit_maps: dict[SupportsUnit, str] = {
-            self.Unit.DAY: "days",
-            self.Unit.HOUR: "hours",
-            self.Unit.MINUTE: "minutes",
-            self.Unit.SECOND: "seconds",
-            self.Unit.MILLISECOND: "milliseconds",
-            self.Unit.MICROSECOND: "microseconds",
-        }
         norm_unit = self._normalize_unit(unit)
         assert norm_unit
 
-        return getattr(self, unit_maps[norm_unit])
+        return self._convert_to(norm_unit)
 
     def to_humanreadable(self, style: HumanReadableStyle = "full") -> str:
-        def _to_unit_str(unit: SupportsUnit, style: str) -> str:
-            if style in ("short", "abbr"):
-                return unit.name[0]
+        instrumentation = _instrument.instrumentation
+        if instrumentation is None:
+            return self.__to_humanreadable(style)
 
-            if style == "full":
-                return f" {unit.name}"
+        return instrumentation.measure("format", type(self), self.__to_humanreadable, style)
 
-            return unit.name
+    def __to_humanreadable(self, style: str) -> str:
+        text = self.__format_key(self._get_key(), self.__get_components(style))
+        if text is None:
+            return f"0 {(self._default_unit or self._from_unit).name}"
 
-        items: list[str] = []
+        return text
 
-        if self.days >= 1:
-            items.append(f"{int(self.days):d}{_to_unit_str(self.Unit.DAY, style)}")
-        if self.hours % 24 >= 1:
-            items.append(f"{int(self.hours) % 24:d}{_to_unit_str(self.Unit.HOUR, style)}")
-        if self.minutes % 60 >= 1:
-            items.append(f"{int(self.minutes) % 60:d}{_to_unit_str(self.Unit.MINUTE, style)}")
-        if self.seconds % 60 >= 1:
-            items.append(f"{int(self.seconds) % 60:d}{_to_unit_str(self.Unit.SECOND, style)}")
-        if self.milliseconds % 1000 >= 1:
-            items.append(
-                f"{int(self.milliseconds) % 1000:d}{_to_unit_str(self.Unit.MILLISECOND, style)}"
-            )
-        if self.microseconds % 1000 >= 1:
-            items.append(
-                f"{int(self.microseconds) % 1000:d}{_to_unit_str(self.Unit.MICROSECOND, style)}"
-            )
+    @classmethod
+    def format_many(cls, values: Iterable["Time"], style: HumanReadableStyle = "full") -> list[str]:
+        """
+        Convert values to human-readable strings.
+        Values that are equal are formatted only once.
 
-        if not items:
-            assert self._default_unit
-            return f"0 {self._default_unit.name}"
+        Args:
+            values (Iterable[Time]):
+                Values to convert.
+            style (str):
+                Style of the strings: ``"full"``, ``"short"``, or ``"abbr"``.
 
-        return " ".join(items)
+        Returns:
+            Human-readable strings in the order of the values.
+        """
 
-    def _normalize_unit(self, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
-        if isinstance(unit, TimeUnit):
-            return unit
+        instrumentation = _instrument.instrumentation
+        if instrumentation is None:
+            return cls.__format_many(values, style)
 
-        return super()._normalize_unit(unit)
+        return instrumentation.measure("format_many", cls, cls.__format_many, values, style)
 
-    def __calc_coef(self, from_unit: SupportsUnit, to_unit: TimeUnit) -> Decimal:
-        from_unit_tu = cast(TimeUnit, from_unit)
-        thousand_coef = Decimal(1000 ** (to_unit.thousand_factor - from_unit_tu.thousand_factor))
-        sixty_coef = Decimal(60 ** (to_unit.sixty_factor - from_unit_tu.sixty_factor))
-        day_coef = Decimal(24 ** (to_unit.day_factor - from_unit_tu.day_factor))
+    @classmethod
+    def __format_many(cls, values: Iterable["Time"], style: str) -> list[str]:
+        components = cls.__get_components(style)
+        texts: dict[Union[int, Fraction], Optional[str]] = {}
+        results: list[str] = []
+
+        for value in values:
+            if not isinstance(value, Time):
+                raise TypeError(f"unsupported value for {cls.__name__}.format_many: {value!r}")
+
+            key = value._get_key()
+            try:
+                text = texts[key]
+            except KeyError:
+                text = texts[key] = cls.__format_key(key, components)
+
+            if text is None:
+                text = f"0 {(value._default_unit or value._from_unit).name}"
 
-        return day_coef * sixty_coef * thousand_coef
+            results.append(text)
 
+        return results
 
-def _parse(value: Union[str, Time], default_unit: Union[str, SupportsUnit, None] = None) -> Time:
-    if isinstance(value, Time):
-        return value
+    @classmethod
+    def __get_components(cls, style: str) -> tuple[tuple[str, int], ...]:
+        try:
+            return cls._COMPONENTS[style]
+        except KeyError:
+            pass
+
+        components = []
+        for unit in cls._TEXT_UNITS:
+            if style in ("short", "abbr"):
+                label = unit.name[0]
+            elif style == "full":
+                label = f" {unit.name}"
+            else:
+                label = unit.name
+
+            components.append((label, int(cls._get_key_coef(unit))))
+
+        cls._COMPONENTS[style] = tuple(components)
+
+        return cls._COMPONENTS[style]
+
+    @staticmethod
+    def __format_key(
+        key: Union[int, Fraction], components: tuple[tuple[str, int], ...]
+    ) -> Optional[str]:
+        # split the integral part of the key into each unit with a single divmod cascade.
+        # a sign applies to the whole string, as a sign of a compound value does.
+        rest = int(key)
+        sign = "-" if rest < 0 else ""
+        rest = abs(rest)
+        items: list[str] = []
 
-    sum: Optional[Time] = None
+        for label, size in components:
+            count, rest = divmod(rest, size)
+            if count:
+                items.append(f"{count:d}{label}")
+
+        if not items:
+            return None
 
-    for item in reversed(re.findall(r"\d+\s*[a-zA-Z]+", value)):
-        t = Time(item, default_unit=default_unit)
-        if sum is None:
-            sum = t
-        else:
-            sum += t
+        return sign + " ".join(items)
 
-    assert sum is not None
+    @classmethod
+    def _normalize_unit(cls, unit: Union[str, SupportsUnit, None]) -> Optional[SupportsUnit]:
+        if isinstance(unit, TimeUnit):
+            return unit
+
+        return super()._normalize_unit(unit)
+
+    @classmethod
+    def _compute_coef(cls, from_unit: SupportsUnit, to_unit: SupportsUnit) -> Decimal:
+        from_unit_tu = cast(TimeUnit, from_unit)
+        to_unit_tu = cast(TimeUnit, to_unit)
+        context = get_decimal_context()
+        thousand_coef = context.power(
+            Decimal(1000), to_unit_tu.thousand_factor - from_unit_tu.thousand_factor
+        )
+        sixty_coef = context.power(Decimal(60), to_unit_tu.sixty_factor - from_unit_tu.sixty_factor)
+        day_coef = context.power(Decimal(24), to_unit_tu.day_factor - from_unit_tu.day_factor)
 
-    return sum
+        return context.multiply(context.multiply(day_coef, sixty_coef), thousand_coef)
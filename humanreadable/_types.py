@@ -1,5 +1,6 @@
+from collections.abc import Callable
 from re import Pattern
-from typing import Literal, Protocol
+from typing import Any, Literal, Protocol
 
 
 class SupportsUnit(Protocol):
@@ -15,3 +16,5 @@ class SupportsUnit(Protocol):
 Units = tuple[str, ...]
 TextUnitsMap = dict[SupportsUnit, Units]
 HumanReadableStyle = Literal["full", "short", "abbr"]
+ErrorPolicy = Literal["raise", "skip", "nan"]
+ErrorHandler = Callable[[int, Any, Exception], None]
@@ -46,7 +46,7 @@ setuptools.setup(
     license=pkg_info["__license__"],
     long_description=LONG_DESCRIPTION,
     long_description_content_type="text/x-rst",
-    packages=setuptools.find_packages(exclude=["test*"]),
+    packages=setuptools.find_packages(exclude=["test*", "benchmarks*"]),
     package_data={MODULE_NAME: ["py.typed"]},
     project_urls={
         "Changelog": f"{REPOSITORY_URL:s}/releases",
@@ -55,7 +55,11 @@ setuptools.setup(
     },
     python_requires=">=3.9",
     install_requires=INSTALL_REQUIRES,
-    extras_require={"test": TESTS_REQUIRES},
+    extras_require={
+        "dataframe": ["pandas>=1.3"],
+        "numpy": ["numpy>=1.21"],
+        "test": TESTS_REQUIRES,
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
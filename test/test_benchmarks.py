@@ -0,0 +1,62 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+import benchmarks
+
+
+class Test_run:
+    def test_normal(self):
+        calls = []
+
+        def setup():
+            calls.append("setup")
+            return lambda: calls.append("run")
+
+        results = benchmarks.run(
+            [benchmarks.Benchmark("a", setup, 10), benchmarks.Benchmark("b", setup, 10)],
+            repeat=3,
+            min_time=0,
+            pattern="^a$",
+        )
+
+        assert list(results) == ["a"]
+        assert results["a"] >= 0
+        assert calls == ["setup", "run"] * 3
+
+    def test_normal_cases(self):
+        names = [benchmark.name for benchmark in benchmarks.make_benchmarks()]
+
+        assert len(names) == len(set(names))
+        for prefix in ["parse/", "error/", "get_as/", "compare/", "add/", "format/"]:
+            assert any(name.startswith(prefix) for name in names)
+
+        results = benchmarks.run(
+            benchmarks.make_benchmarks(), repeat=1, min_time=0, pattern="compound/hms"
+        )
+        assert list(results) == ["parse/Time/compound/hms"]
+
+
+class Test_compare_results:
+    @pytest.mark.parametrize(
+        ["baseline", "current", "threshold", "expected"],
+        [
+            [{"a": 100}, {"a": 109}, 0.1, []],
+            [{"a": 100}, {"a": 111}, 0.1, ["a"]],
+            [{"a": 100, "b": 100}, {"a": 120, "b": 150}, 0.1, ["b", "a"]],
+            [{"a": 100}, {"b": 1000}, 0.1, []],
+            [{"a": 100}, {"a": 50}, 0, []],
+        ],
+    )
+    def test_normal(self, baseline, current, threshold, expected):
+        regressions = benchmarks.compare_results(baseline, current, threshold)
+
+        assert [regression.name for regression in regressions] == expected
+
+    def test_normal_save_load(self, tmp_path):
+        path = tmp_path / "baseline" / "results.json"
+        benchmarks.save_results(path, {"b": 2.5, "a": 1})
+
+        assert benchmarks.load_results(path) == {"a": 1.0, "b": 2.5}
@@ -0,0 +1,135 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from humanreadable import (
+    BitsPerSecond,
+    ParameterError,
+    ParseCache,
+    Time,
+    disable_parse_cache,
+    enable_parse_cache,
+    get_parse_cache,
+)
+
+
+@pytest.fixture
+def parse_cache():
+    yield enable_parse_cache
+    disable_parse_cache()
+
+
+class Test_ParseCache:
+    def test_normal_lru(self):
+        cache = ParseCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.info() == (3, 1, 1, 2, 2)
+
+    def test_normal_resize(self):
+        cache = ParseCache(maxsize=4)
+        for i in range(4):
+            cache.put(i, i)
+
+        cache.resize(1)
+
+        assert len(cache) == 1
+        assert cache.get(3) == 3
+        assert cache.info().evictions == 3
+
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 1, 0)
+
+    @pytest.mark.parametrize(["maxsize"], [[0], [-1]])
+    def test_exception(self, maxsize):
+        with pytest.raises(ParameterError):
+            ParseCache(maxsize=maxsize)
+
+        with pytest.raises(ParameterError):
+            ParseCache().resize(maxsize)
+
+
+class Test_parse_cache:
+    def test_normal_disabled(self):
+        assert get_parse_cache() is None
+        assert Time("100ms") is not Time("100ms")
+
+    @pytest.mark.parametrize(
+        ["cls", "value", "default_unit"],
+        [
+            [Time, "100ms", None],
+            [Time, "1h 30m", None],
+            [Time, "30", "seconds"],
+            [BitsPerSecond, "1Gbps", None],
+            [BitsPerSecond, "10", BitsPerSecond.Unit.MBPS],
+        ],
+    )
+    def test_normal(self, parse_cache, cls, value, default_unit):
+        cache = parse_cache(maxsize=8)
+        lhs = cls(value, default_unit=default_unit)
+        rhs = cls(value, default_unit=default_unit)
+
+        assert lhs is not rhs
+        assert lhs == rhs
+        assert repr(lhs) == repr(rhs)
+        assert cache.info().hits >= 1
+
+    def test_normal_intern(self, parse_cache):
+        cache = parse_cache(maxsize=8, intern=True)
+
+        assert Time("100ms") is Time("100ms")
+        assert Time("100ms") is not Time("100 ms")
+        assert BitsPerSecond("1Gbps") is BitsPerSecond("1Gbps")
+        assert cache.info().hits == 3
+
+    def test_normal_class_key(self, parse_cache):
+        parse_cache(maxsize=8, intern=True)
+
+        assert Time("2", default_unit="m").minutes == 2
+        assert BitsPerSecond("2", default_unit="mbps").mega_bps == 2
+
+    def test_normal_eviction(self, parse_cache):
+        cache = parse_cache(maxsize=2)
+        for value in ["1s", "2s", "3s", "1s"]:
+            Time(value)
+
+        assert cache.info() == (0, 4, 2, 2, 2)
+
+    @pytest.mark.parametrize(["cache_kwargs"], [[None], [{"intern": False}], [{"intern": True}]])
+    @pytest.mark.parametrize(
+        ["cls", "value", "default_unit"],
+        [[Time, "1h 30m", None], [Time, "30", "seconds"], [BitsPerSecond, "1Gbps", None]],
+    )
+    def test_normal_copy(self, parse_cache, cache_kwargs, cls, value, default_unit):
+        # instances are created without arguments to __new__ by copy and pickle
+        if cache_kwargs is not None:
+            parse_cache(maxsize=8, **cache_kwargs)
+        original = cls(value, default_unit=default_unit)
+
+        for restored in [
+            copy.copy(original),
+            copy.deepcopy(original),
+            pickle.loads(pickle.dumps(original)),
+        ]:
+            assert type(restored) is cls
+            assert restored == original
+            assert repr(restored) == repr(original)
+
+    def test_exception(self, parse_cache):
+        cache = parse_cache(maxsize=8)
+        for _ in range(2):
+            with pytest.raises(ParameterError):
+                Time("two secs")
+
+        assert len(cache) == 0
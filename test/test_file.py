@@ -0,0 +1,195 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import math
+import re
+
+import pytest
+
+from humanreadable import BitsPerSecond, ParameterError, Time, UnitNotFoundError
+
+
+def write_lines(tmp_path, lines, newline="\n"):
+    path = tmp_path / "values.log"
+    path.write_bytes("".join(line + newline for line in lines).encode("utf-8"))
+
+    return path
+
+
+class Test_Time_parse_file:
+    @pytest.mark.parametrize(
+        ["lines", "unit", "expected"],
+        [
+            [["250ms", "1s", " 2 min ", "", "-1.5h"], "ms", [250, 1000, 120000, -5400000]],
+            [["1h 30m", "10 SEC", "500us"], Time.Unit.SECOND, [5400, 10, 0.0005]],
+            [[], "s", []],
+        ],
+    )
+    def test_normal_line(self, tmp_path, lines, unit, expected):
+        assert list(Time.parse_file(write_lines(tmp_path, lines), unit)) == expected
+
+    def test_normal_crlf(self, tmp_path):
+        path = write_lines(tmp_path, ["250ms", "1s"], newline="\r\n")
+
+        assert list(Time.parse_file(path, "ms")) == [250, 1000]
+
+    def test_normal_without_trailing_newline(self, tmp_path):
+        path = tmp_path / "values.log"
+        path.write_bytes(b"250ms\n1s")
+
+        assert list(Time.parse_file(path, "ms")) == [250, 1000]
+
+    @pytest.mark.parametrize(
+        ["column", "delimiter", "expected"],
+        [
+            [1, ",", [250, 1500]],
+            [0, ",", [1000, 2000]],
+            [2, b"\t", [60000, 1]],
+        ],
+    )
+    def test_normal_column(self, tmp_path, column, delimiter, expected):
+        if delimiter == b"\t":
+            lines = ["a\tb\t1 min", "c\td\t1ms"]
+        else:
+            lines = ["1s, 250ms ,GET", "2s,1.5s,POST"]
+
+        path = write_lines(tmp_path, lines)
+
+        assert list(Time.parse_file(path, "ms", column=column, delimiter=delimiter)) == expected
+
+    @pytest.mark.parametrize(
+        ["column", "delimiter", "expected"],
+        [
+            [1, "||", [5, 2000]],
+            [2, "||", [60000, 1]],
+            [1, "│", [5, 2000]],
+        ],
+    )
+    def test_normal_multi_byte_delimiter(self, tmp_path, column, delimiter, expected):
+        # a delimiter of several characters or bytes is not a set of single-byte delimiters
+        lines = [f"a|b{delimiter}5ms{delimiter}1 min", f"c{delimiter}2s{delimiter}1ms"]
+        path = write_lines(tmp_path, lines)
+
+        assert list(Time.parse_file(path, "ms", column=column, delimiter=delimiter)) == expected
+
+    @pytest.mark.parametrize(
+        ["pattern", "expected"],
+        [
+            [r"latency=(\S+)", [250, 1500]],
+            [rb"(?P<method>\w+) / latency=(?P<value>\S+)", [250, 1500]],
+            [re.compile(r"\d+\.?\d*m?s$"), [250, 1500]],
+        ],
+    )
+    def test_normal_pattern(self, tmp_path, pattern, expected):
+        path = write_lines(tmp_path, ["GET / latency=250ms", "no latency", "POST / latency=1.5s"])
+
+        assert list(Time.parse_file(path, "ms", pattern=pattern)) == expected
+
+    def test_normal_byte_range(self, tmp_path):
+        lines = [f"{i}ms" for i in range(100)]
+        path = write_lines(tmp_path, lines)
+        expected = list(Time.parse_file(path, "ms"))
+        size = path.stat().st_size
+
+        for split_pos in [0, 1, 5, 6, size // 2, size - 1, size]:
+            results = list(Time.parse_file(path, "ms", end=split_pos)) + list(
+                Time.parse_file(path, "ms", start=split_pos)
+            )
+            assert results == expected
+
+    @pytest.mark.parametrize(["chunk_size"], [[1], [3], [7], [1024]])
+    def test_normal_chunk_size(self, tmp_path, chunk_size):
+        lines = [f"{i}s" for i in range(50)]
+        path = write_lines(tmp_path, lines)
+
+        assert list(Time.parse_file(path, "s", chunk_size=chunk_size)) == list(range(50))
+
+    def test_normal_consistent_with_parse_many(self, tmp_path):
+        # numbers are converted exactly: the result is a single rounding to a float
+        units = ["ns", "us", "ms", "s", "m", "h", "d"]
+        lines = [f"{i * 7919 % 100000}.{i * 104729 % 1000:03d}{units[i % 7]}" for i in range(700)]
+        lines += ["12.303ms", "-.25h", "+5.s"]
+        path = write_lines(tmp_path, lines)
+
+        for unit in ["s", "ms", "h"]:
+            assert list(Time.parse_file(path, unit)) == list(Time.parse_many(lines, unit))
+            assert list(Time.parse_file(path, unit)) == [Time(line).get_as(unit) for line in lines]
+
+    def test_normal_default_unit(self, tmp_path):
+        path = write_lines(tmp_path, ["10", "1s"])
+
+        assert list(Time.parse_file(path, "ms", default_unit="s")) == [10000, 1000]
+
+    @pytest.mark.parametrize(
+        ["on_error", "expected"],
+        [
+            ["skip", [1000, 2000]],
+            ["nan", [1000, math.nan, 2000]],
+        ],
+    )
+    def test_normal_on_error(self, tmp_path, on_error, expected):
+        path = write_lines(tmp_path, ["1s", "n/a", "2s"])
+        results = list(Time.parse_file(path, "ms", on_error=on_error))
+
+        assert len(results) == len(expected)
+        for result, value in zip(results, expected):
+            assert result == value or (math.isnan(result) and math.isnan(value))
+
+    @pytest.mark.parametrize(
+        ["on_error", "expected"],
+        [
+            ["skip", [1000, 2000, 3]],
+            ["nan", [1000, math.nan, math.nan, 2000, 3, math.nan]],
+        ],
+    )
+    def test_normal_on_error_column(self, tmp_path, on_error, expected):
+        # a line without the column, an empty column, a blank line, and an invalid value
+        path = write_lines(tmp_path, ["a,1s", "b", "c,", "", "d,2s", ",3ms", "e,x"])
+        results = list(Time.parse_file(path, "ms", on_error=on_error, column=1))
+
+        assert len(results) == len(expected)
+        for result, value in zip(results, expected):
+            assert result == value or (math.isnan(result) and math.isnan(value))
+
+    @pytest.mark.parametrize(["line"], [["b"], ["c,"], ["c, "]])
+    def test_exception_on_error_column(self, tmp_path, line):
+        path = write_lines(tmp_path, ["a,1s", line])
+
+        with pytest.raises(ParameterError):
+            Time.parse_file(path, "ms", column=1)
+
+    def test_normal_pattern_flags(self, tmp_path):
+        path = write_lines(tmp_path, ["LATENCY=250ms", "latency=1.5s"])
+
+        for pattern in [re.compile(r"latency=(\S+)", re.I), re.compile(rb"latency=(\S+)", re.I)]:
+            assert list(Time.parse_file(path, "ms", pattern=pattern)) == [250, 1500]
+
+    def test_exception_on_error(self, tmp_path):
+        path = write_lines(tmp_path, ["1s", "n/a"])
+
+        with pytest.raises(UnitNotFoundError):
+            Time.parse_file(path, "ms")
+
+    @pytest.mark.parametrize(
+        ["kwargs", "expected"],
+        [
+            [{"column": 0, "pattern": r"(\S+)"}, ParameterError],
+            [{"column": -1}, ParameterError],
+            [{"column": 0, "delimiter": ""}, ParameterError],
+            [{"chunk_size": 0}, ParameterError],
+            [{"on_error": "ignore"}, ParameterError],
+        ],
+    )
+    def test_exception_parameter(self, tmp_path, kwargs, expected):
+        path = write_lines(tmp_path, ["1s"])
+
+        with pytest.raises(expected):
+            Time.parse_file(path, "ms", **kwargs)
+
+
+class Test_BitsPerSecond_parse_file:
+    def test_normal(self, tmp_path):
+        path = write_lines(tmp_path, ["eth0,10 Gbps", "eth1,1 Kibit/s", "eth2,5 bits per second"])
+
+        assert list(BitsPerSecond.parse_file(path, "bps", column=1)) == [1e10, 1024, 5]
@@ -0,0 +1,63 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import subprocess
+import sys
+
+
+# budget of the cumulative import time of the humanreadable package (typically 20-40 ms):
+# generous to tolerate slow CI machines, while catching heavy dependencies at import time
+IMPORT_TIME_BUDGET_US = 100_000
+
+_HEAVY_MODULES = ("typepy", "dataclasses", "inspect", "numpy", "pandas")
+
+
+def run_python(code, tmp_path):
+    # a dedicated bytecode cache: measure imports of compiled modules, without writing
+    # bytecode files to the source tree
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-X", f"pycache_prefix={tmp_path}", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    )
+
+
+class Test_import:
+    def test_normal_lazy(self, tmp_path):
+        code = "\n".join(
+            [
+                "import sys",
+                "before = set(sys.modules)",
+                "import humanreadable as hr",
+                "print(','.join(sorted(set(sys.modules) - before)))",
+                "print(hr.Time.Unit.DAY.regexp._compiled is None)",
+            ]
+        )
+        imported_modules, is_lazy = run_python(code, tmp_path).stdout.splitlines()
+
+        for module in imported_modules.split(","):
+            assert module.split(".")[0] not in _HEAVY_MODULES
+        assert is_lazy == "True"
+
+    def test_normal_time_budget(self, tmp_path):
+        # the first run writes bytecode to the cache
+        run_python("import humanreadable", tmp_path)
+
+        import_times = []
+        for _ in range(3):
+            stderr = run_python("import humanreadable", tmp_path).stderr
+            for line in stderr.splitlines():
+                _, _, cumulative, name = [
+                    item.strip() for item in line.replace(":", "|").split("|")
+                ]
+                if name == "humanreadable":
+                    import_times.append(int(cumulative))
+
+        assert min(import_times) <= IMPORT_TIME_BUDGET_US
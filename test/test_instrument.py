@@ -0,0 +1,163 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from humanreadable import (
+    BitsPerSecond,
+    Instrumentation,
+    Time,
+    UnitNotFoundError,
+    disable_instrumentation,
+    disable_parse_cache,
+    enable_instrumentation,
+    enable_parse_cache,
+    get_instrumentation,
+)
+
+
+@pytest.fixture
+def instrumentation():
+    disable_instrumentation()
+    yield enable_instrumentation()
+    disable_instrumentation()
+    disable_parse_cache()
+
+
+class Test_enable_instrumentation:
+    def test_normal(self):
+        disable_instrumentation()
+        assert get_instrumentation() is None
+
+        instrumentation = enable_instrumentation()
+        assert isinstance(instrumentation, Instrumentation)
+        assert enable_instrumentation() is instrumentation
+        assert get_instrumentation() is instrumentation
+
+        disable_instrumentation()
+        assert get_instrumentation() is None
+
+    def test_normal_disabled(self):
+        disable_instrumentation()
+        instrumentation = Instrumentation()
+        Time("1s")
+
+        assert instrumentation.as_dict()["parses"] == {}
+
+    @pytest.mark.parametrize(["env_value", "expected"], [["1", True], ["on", True], ["0", False]])
+    def test_normal_env(self, env_value, expected):
+        env = dict(
+            os.environ, PYTHONPATH=os.pathsep.join(sys.path), HUMANREADABLE_INSTRUMENT=env_value
+        )
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import humanreadable as hr; print(hr.get_instrumentation() is not None)",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+            env=env,
+        )
+
+        assert proc.stdout.strip() == str(expected)
+
+
+class Test_Instrumentation:
+    def test_normal_parse(self, instrumentation):
+        Time("1s")
+        Time("2s")
+        Time("1h 30m")
+        Time("1", default_unit="ms")
+        BitsPerSecond("1Gbps")
+        Time.parse_many(["1s", "1s", "3m"], "s")
+
+        data = instrumentation.as_dict()
+        assert data["parses"] == {
+            "BitsPerSecond": {"Gbps": 1},
+            "Time": {"milliseconds": 1, "minutes": 2, "seconds": 3},
+        }
+        # a match per single-unit value, and a sign match and two item matches for 1h 30m
+        assert data["regex_attempts"] == {"BitsPerSecond": 1, "Time": 9}
+        assert data["timings"]["parse"]["Time"]["calls"] == 6
+        assert data["timings"]["parse"]["Time"]["seconds"] >= 0
+        assert data["parse_cache"] is None
+
+    def test_normal_errors(self, instrumentation):
+        for value, exception in [
+            ["abc", UnitNotFoundError],
+            ["1", UnitNotFoundError],
+            [None, TypeError],
+        ]:
+            with pytest.raises(exception):
+                Time(value)
+        with pytest.raises(UnitNotFoundError):
+            Time.parse_many(["1.2.3s"], "s")
+
+        data = instrumentation.as_dict()
+        assert data["errors"] == {
+            "Time": {"TypeError": 1, "UnitNotFoundError": 3},
+        }
+        assert data["parses"] == {}
+        assert data["timings"]["parse"]["Time"]["calls"] == 4
+
+    def test_normal_format(self, instrumentation):
+        Time("1s").to_humanreadable()
+        Time.format_many([Time("1s"), Time("2s")])
+        BitsPerSecond.format_many([1, 2])
+
+        timings = instrumentation.as_dict()["timings"]
+        assert timings["format"]["Time"]["calls"] == 1
+        assert timings["format_many"]["Time"]["calls"] == 1
+        assert timings["format_many"]["BitsPerSecond"]["calls"] == 1
+
+    def test_normal_cache(self, instrumentation):
+        enable_parse_cache()
+        Time("1s")
+        Time("1s")
+
+        data = instrumentation.as_dict()
+        assert data["parses"] == {"Time": {"seconds": 1}}
+        assert data["parse_cache"]["hits"] == 1
+        assert data["parse_cache"]["misses"] == 1
+
+    def test_normal_reset(self, instrumentation):
+        Time("1s")
+        instrumentation.reset()
+
+        assert instrumentation.as_dict() == {
+            "parses": {},
+            "regex_attempts": {},
+            "errors": {},
+            "timings": {},
+            "parse_cache": None,
+        }
+
+    def test_normal_prometheus(self, instrumentation):
+        enable_parse_cache()
+        Time("1s")
+        with pytest.raises(UnitNotFoundError):
+            BitsPerSecond("1 parsec")
+
+        lines = instrumentation.to_prometheus().splitlines()
+
+        assert "# TYPE humanreadable_parses_total counter" in lines
+        assert 'humanreadable_parses_total{class="Time",unit="seconds"} 1' in lines
+        assert 'humanreadable_regex_attempts_total{class="Time"} 1' in lines
+        assert (
+            'humanreadable_parse_errors_total{class="BitsPerSecond",error="UnitNotFoundError"} 1'
+            in lines
+        )
+        assert 'humanreadable_calls_total{operation="parse",class="Time"} 1' in lines
+        assert any(
+            line.startswith('humanreadable_seconds_total{operation="parse",class="Time"} ')
+            for line in lines
+        )
+        assert "humanreadable_parse_cache_misses_total 2" in lines
+        assert "# TYPE humanreadable_parse_cache_entries gauge" in lines
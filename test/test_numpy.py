@@ -0,0 +1,114 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from humanreadable import BitsPerSecond, ParameterError, Time, UnitNotFoundError
+
+
+np = pytest.importorskip("numpy")
+
+
+class Test_parse_array:
+    @pytest.mark.parametrize(
+        ["cls", "values", "unit", "expected"],
+        [
+            [
+                Time,
+                ["250ms", "1s", "2 min", "250ms", "-1.5h"],
+                "ms",
+                [250, 1000, 120000, 250, -5400000],
+            ],
+            [Time, ["1 hour 30 minutes", "1.5h20m", "10 SEC"], Time.Unit.SECOND, [5400, 6600, 10]],
+            [Time, [["1s", "2s"], ["3s", "4s"]], "s", [[1, 2], [3, 4]]],
+            [Time, [], "s", []],
+            [BitsPerSecond, ["10 Gbps", "1 Kibit/s", "5 bits per second"], "bps", [1e10, 1024, 5]],
+            [BitsPerSecond, np.array(["1Gbps", "512Mbps"], dtype=object), "Mbps", [1000, 512]],
+        ],
+    )
+    def test_normal(self, cls, values, unit, expected):
+        results = cls.parse_array(values, unit)
+
+        assert results.dtype == np.float64
+        np.testing.assert_array_equal(results, np.array(expected, dtype=np.float64))
+
+    def test_normal_consistent_with_parse_many(self):
+        values = ["1d", "2h", "3m", "4s", "5ms", "6us", ".5s", "+7 msecs", "1h30m"]
+        np.testing.assert_array_equal(
+            Time.parse_array(values, "us"), np.array(Time.parse_many(values, "us"))
+        )
+
+    @pytest.mark.parametrize(
+        ["cls", "suffixes", "units"],
+        [
+            [Time, ["ns", "us", "ms", "s", "m", "h", "d"], ["ns", "ms", "s", "m", "h", "d"]],
+            [BitsPerSecond, ["bps", "Kbps", "Mbps", "Gibps"], ["bps", "Kbps", "Mibps"]],
+        ],
+    )
+    def test_normal_equal_to_parse_many(self, cls, suffixes, units):
+        # numbers and coefficients that are not exact as floats are converted with a single
+        # rounding as well as parse_many and get_as
+        numbers = [
+            f"{sign}{integer}.{fraction}"
+            for sign in ["", "-"]
+            for integer in [0, 1, 7, 123, 99999]
+            for fraction in ["1", "3", "07", "123", "999", "123456789"]
+        ]
+        values = [f"{number}{suffix}" for number in numbers for suffix in suffixes]
+
+        for unit in units:
+            np.testing.assert_array_equal(
+                cls.parse_array(values, unit), np.array(cls.parse_many(values, unit))
+            )
+
+    @pytest.mark.parametrize(
+        ["values", "default_unit"],
+        [
+            [["5ms", "5 ms", "5\tms", "5   ms", " 5ms", "5ms ", " 2 min ", "-5 ms"], None],
+            [["5", " 5", "5 ", "5  ", "+5", "5s"], "s"],
+        ],
+    )
+    def test_normal_whitespace_consistent_with_parse_many(self, values, default_unit):
+        np.testing.assert_array_equal(
+            Time.parse_array(values, "ms", default_unit=default_unit, on_error="nan"),
+            np.array(
+                Time.parse_many(values, "ms", default_unit=default_unit, on_error="nan"),
+                dtype=np.float64,
+            ),
+        )
+
+    @pytest.mark.parametrize(["value"], [["5   ms"], [" 5ms"], ["5ms "], [" 2 min "]])
+    def test_exception_whitespace(self, value):
+        with pytest.raises(UnitNotFoundError):
+            Time.parse_array(["1s", value], "s")
+
+    def test_normal_default_unit(self):
+        results = Time.parse_array(["2", "3s"], "s", default_unit="minutes")
+        np.testing.assert_array_equal(results, [120, 3])
+
+    @pytest.mark.parametrize(
+        ["on_error", "expected"],
+        [
+            ["nan", [1, np.nan, 2, np.nan, np.nan, np.nan, np.nan]],
+            ["skip", [1, 2]],
+        ],
+    )
+    def test_normal_on_error(self, on_error, expected):
+        values = ["1s", "two secs", "2s", "1e3s", "1.2.3s", "+-1s", "10"]
+        results = Time.parse_array(values, "s", on_error=on_error)
+
+        np.testing.assert_array_equal(results, expected)
+
+    @pytest.mark.parametrize(
+        ["values", "expected"],
+        [
+            [["1s", "two secs"], ParameterError],
+            [["1s", "1.2.3s"], ParameterError],
+            [["1s", "10"], UnitNotFoundError],
+            [np.array(["1s", None], dtype=object), TypeError],
+        ],
+    )
+    def test_exception(self, values, expected):
+        with pytest.raises(expected):
+            Time.parse_array(values, "s")
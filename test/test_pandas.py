@@ -0,0 +1,132 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from humanreadable import (
+    BitsPerSecond,
+    ParameterError,
+    Time,
+    UnitNotFoundError,
+    register_pandas_accessor,
+)
+
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def accessor():
+    register_pandas_accessor()
+
+
+class Test_SeriesAccessor_to:
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["250ms", "1s", "250ms", "1h 30m"], "ms", [250, 1000, 250, 5400000]],
+            [["10 Gbps", "512 Mbps"], "Gbps", [10, 0.512]],
+            [["1s", None, "2s"], "s", [1, np.nan, 2]],
+        ],
+    )
+    def test_normal(self, values, unit, expected):
+        series = pd.Series(values, index=list("abcd")[: len(values)], name="col")
+        results = series.humanreadable.to(unit)
+
+        assert results.dtype == np.float64
+        assert results.name == "col"
+        pd.testing.assert_index_equal(results.index, series.index)
+        np.testing.assert_array_equal(results.to_numpy(), expected)
+
+    def test_normal_equal_to_parse_many(self):
+        values = [f"{i}.{i * 7}{suffix}" for i in range(1, 100) for suffix in ["us", "ms", "h"]]
+        results = pd.Series(values).humanreadable.to("s")
+
+        np.testing.assert_array_equal(results.to_numpy(), np.array(Time.parse_many(values, "s")))
+
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["1s", "250ms"], Time.Unit.MILLISECOND, [1000, 250]],
+            [["10 Gbps", "512 Mbps"], BitsPerSecond.Unit.GBPS, [10, 0.512]],
+        ],
+    )
+    def test_normal_unit_object(self, values, unit, expected):
+        np.testing.assert_array_equal(pd.Series(values).humanreadable.to(unit).to_numpy(), expected)
+
+    def test_normal_duration_bitrate(self):
+        assert pd.Series(["2m"]).humanreadable.duration("s").tolist() == [120]
+        assert pd.Series(["2 Mbps"]).humanreadable.bitrate("Kbps").tolist() == [2000]
+
+    @pytest.mark.parametrize(
+        ["on_error", "expected_index", "expected"],
+        [
+            ["nan", [0, 1, 2, 3], [1, np.nan, 2, np.nan]],
+            ["skip", [0, 2], [1, 2]],
+        ],
+    )
+    def test_normal_on_error(self, on_error, expected_index, expected):
+        results = pd.Series(["1s", "bad", "2s", None]).humanreadable.to("s", on_error=on_error)
+
+        assert results.index.tolist() == expected_index
+        np.testing.assert_array_equal(results.to_numpy(), expected)
+
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["1s", "bad"], "s", ParameterError],
+            [["1s"], "parsec", UnitNotFoundError],
+        ],
+    )
+    def test_exception(self, values, unit, expected):
+        with pytest.raises(expected):
+            pd.Series(values).humanreadable.to(unit)
+
+
+class Test_SeriesAccessor_to_humanreadable:
+    def test_normal(self):
+        series = pd.Series([4000, 60, 4000, np.nan])
+        results = series.humanreadable.to_humanreadable("s", style="short")
+
+        assert isinstance(results.dtype, pd.CategoricalDtype)
+        assert results.tolist()[:3] == ["1h 6m 40s", "1m", "1h 6m 40s"]
+        assert pd.isna(results.iloc[3])
+
+    def test_normal_bitrate(self):
+        results = pd.Series([1.01, 1.02, 2000]).humanreadable.to_humanreadable("Mbps")
+
+        assert results.tolist() == [
+            "1.0 megabits per second",
+            "1.0 megabits per second",
+            "2.0 gigabits per second",
+        ]
+        assert len(results.cat.categories) == 2
+
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [[2000], BitsPerSecond.Unit.MBPS, ["2.0 gigabits per second"]],
+            [[120], Time.Unit.SECOND, ["2 minutes"]],
+        ],
+    )
+    def test_normal_unit_object(self, values, unit, expected):
+        results = pd.Series(values).humanreadable.to_humanreadable(unit)
+
+        assert results.tolist() == expected
+
+
+class Test_DataFrameAccessor_to:
+    def test_normal(self):
+        df = pd.DataFrame({"latency": ["1s", "250ms"], "link": ["1 Gbps", "10 Mbps"], "x": [1, 2]})
+        results = df.humanreadable.to({"latency": "ms", "link": "Mbps"})
+
+        assert results["latency"].tolist() == [1000, 250]
+        assert results["link"].tolist() == [1000, 10]
+        assert results["x"].tolist() == [1, 2]
+        assert df["latency"].tolist() == ["1s", "250ms"]
+
+    def test_exception(self):
+        with pytest.raises(ParameterError):
+            pd.DataFrame({"a": ["1s"]}).humanreadable.to({"a": "s"}, on_error="skip")
@@ -2,12 +2,15 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import pickle
+import platform
 import sys
 from decimal import Decimal
+from fractions import Fraction
 
 import pytest
 
-from humanreadable import BitsPerSecond, ParameterError, UnitNotFoundError
+from humanreadable import BitsPerSecond, ParameterError, Time, UnitNotFoundError
 
 
 KILO = Decimal(1000**1)
@@ -43,6 +46,43 @@ class Test_BitsPerSecond_constructor:
             BitsPerSecond(value).bps
 
 
+class Test_BitsPerSecond_unit:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["10bps", BitsPerSecond.Unit.BPS],
+            ["10 bits per second", BitsPerSecond.Unit.BPS],
+            ["10 kbit/s", BitsPerSecond.Unit.KBPS],
+            ["10Kibps", BitsPerSecond.Unit.KIBPS],
+            ["10 Mbits/sec", BitsPerSecond.Unit.MBPS],
+            ["10 mibit per sec", BitsPerSecond.Unit.MIBPS],
+            ["10 Gbps", BitsPerSecond.Unit.GBPS],
+            ["10 Gibits/s", BitsPerSecond.Unit.GIBPS],
+            ["10tbps", BitsPerSecond.Unit.TBPS],
+            [".5 Tibit/second", BitsPerSecond.Unit.TIBPS],
+        ],
+    )
+    def test_normal(self, value, expected):
+        assert BitsPerSecond(value)._from_unit == expected
+
+    @pytest.mark.parametrize(
+        ["unit", "expected"],
+        [
+            ["Mbps", BitsPerSecond.Unit.MBPS],
+            ["kibps", BitsPerSecond.Unit.KIBPS],
+            ["Gbit/s", BitsPerSecond.Unit.GBPS],
+            [BitsPerSecond.Unit.BPS, BitsPerSecond.Unit.BPS],
+        ],
+    )
+    def test_normal_normalize(self, unit, expected):
+        assert BitsPerSecond._normalize_unit(unit) == expected
+
+    @pytest.mark.parametrize(["unit"], [["MBPS"], ["Kbit"], ["ms"]])
+    def test_exception_normalize(self, unit):
+        with pytest.raises(ValueError):
+            BitsPerSecond._normalize_unit(unit)
+
+
 class Test_BitsPerSecond_repr:
     @pytest.mark.parametrize(
         ["value", "expected"],
@@ -68,6 +108,21 @@ class Test_BitsPerSecond_eq:
         assert (BitsPerSecond(lhs) == BitsPerSecond(rhs)) is expected
         assert (BitsPerSecond(lhs) == BitsPerSecond(rhs)) is expected
 
+    def test_normal_other_types(self):
+        assert BitsPerSecond("1Kbps") == 1000
+        assert BitsPerSecond("1Kibps") != "1024 bps"
+        assert BitsPerSecond("1Kibps") > "1Kbps"
+        assert BitsPerSecond("1bps") != Time("1s")
+
+
+class Test_BitsPerSecond_hash:
+    def test_normal(self):
+        values = {BitsPerSecond("1Gbps"), BitsPerSecond("1000Mbps"), BitsPerSecond("1Gibps")}
+
+        assert len(values) == 2
+        assert hash(BitsPerSecond("1.5Kbps")) == hash(1500)
+        assert hash(BitsPerSecond("-0.5bps")) == hash(Fraction(-1, 2))
+
 
 class Test_BitsPerSecond_add:
     @pytest.mark.parametrize(
@@ -80,6 +135,80 @@ class Test_BitsPerSecond_add:
         assert (BitsPerSecond(lhs) + BitsPerSecond(rhs)) == BitsPerSecond(expected)
 
 
+class Test_BitsPerSecond_arithmetic:
+    @pytest.mark.parametrize(
+        ["result", "expected"],
+        [
+            [BitsPerSecond("1Gbps") - BitsPerSecond("250Mbps"), "750Mbps"],
+            [BitsPerSecond("1Kibps") + BitsPerSecond("1Kbps"), "2024bps"],
+            [BitsPerSecond("100Mbps") * 3, "300Mbps"],
+            [BitsPerSecond("1Gbps") / 8, "125Mbps"],
+            [-BitsPerSecond("1Mbps"), "-1Mbps"],
+            [abs(BitsPerSecond("-1Mbps")), "1Mbps"],
+        ],
+    )
+    def test_normal(self, result, expected):
+        assert isinstance(result, BitsPerSecond)
+        assert result.bps == BitsPerSecond(expected).bps
+
+    def test_normal_ratio(self):
+        assert BitsPerSecond("250Mbps") / BitsPerSecond("1Gbps") == 0.25
+
+    def test_normal_sum(self):
+        rates = [BitsPerSecond("1Gbps"), BitsPerSecond("500Mbps"), BitsPerSecond("1Kbps")]
+
+        assert sum(rates).bps == 1500001000
+        assert BitsPerSecond.sum(rates).bps == 1500001000
+        assert BitsPerSecond.sum(rates, unit="Mbps").mega_bps == 1500.001
+        assert BitsPerSecond.sum([]).bps == 0
+
+    def test_exception(self):
+        from humanreadable import Time
+
+        with pytest.raises(TypeError):
+            BitsPerSecond("1Gbps") + Time("1s")
+        with pytest.raises(TypeError):
+            BitsPerSecond.sum([BitsPerSecond("1Gbps"), Time("1s")])
+
+
+class Test_BitsPerSecond_from_value:
+    @pytest.mark.parametrize(
+        ["method", "number", "expected"],
+        [
+            [BitsPerSecond.from_bps, 512, "512 bps"],
+            [BitsPerSecond.from_kilo_bps, 1.5, "1.5 Kbps"],
+            [BitsPerSecond.from_kibi_bps, 1, "1 Kibps"],
+            [BitsPerSecond.from_mega_bps, 100, "100 Mbps"],
+            [BitsPerSecond.from_mebi_bps, 1, "1 Mibps"],
+            [BitsPerSecond.from_giga_bps, Decimal("2.5"), "2.5 Gbps"],
+            [BitsPerSecond.from_gibi_bps, 1, "1 Gibps"],
+            [BitsPerSecond.from_tera_bps, 1, "1 Tbps"],
+            [BitsPerSecond.from_tebi_bps, 1, "1 Tibps"],
+        ],
+    )
+    def test_normal(self, method, number, expected):
+        value = method(number)
+
+        assert isinstance(value, BitsPerSecond)
+        assert repr(value) == repr(BitsPerSecond(expected))
+        assert value.bps == BitsPerSecond(expected).bps
+
+    def test_normal_from_value(self):
+        assert BitsPerSecond.from_value(8, "Mbps").kilo_bps == 8000
+
+    @pytest.mark.parametrize(
+        ["number", "unit", "expected"],
+        [
+            ["1", "bps", TypeError],
+            [float("nan"), "bps", ParameterError],
+            [1, "ms", ValueError],
+        ],
+    )
+    def test_exception(self, number, unit, expected):
+        with pytest.raises(expected):
+            BitsPerSecond.from_value(number, unit)
+
+
 class Test_BitsPerSecond_less_than:
     @pytest.mark.parametrize(
         ["lhs", "rhs", "expected"],
@@ -334,3 +463,138 @@ class Test_BitsPerSecond_to_humanreadable:
     )
     def test_normal_default_unit(self, value, style, expected):
         assert BitsPerSecond(value).to_humanreadable(style=style) == expected
+
+    @pytest.mark.parametrize(
+        ["value", "kwargs", "expected"],
+        [
+            ["100Mbps", {"base": 1024}, "95.4 mebibits per second"],
+            ["1Gibps", {"base": 1000, "style": "short"}, "1.1 Gbps"],
+            ["123456 Mbps", {"precision": 3}, "123.456 gigabits per second"],
+            ["1500 bps", {"precision": 0, "style": "short"}, "2 Kbps"],
+            ["0bps", {}, "0.0 bits per second"],
+            ["0.5Kibps", {"style": "short"}, "512.0 bps"],
+            ["-2Mbps", {"style": "short"}, "-2.0 Mbps"],
+        ],
+    )
+    def test_normal(self, value, kwargs, expected):
+        assert BitsPerSecond(value).to_humanreadable(**kwargs) == expected
+
+    @pytest.mark.parametrize(
+        ["kwargs"],
+        [
+            [{"base": 1023}],
+            [{"precision": -1}],
+            [{"precision": 1.5}],
+        ],
+    )
+    def test_exception(self, kwargs):
+        with pytest.raises(ParameterError):
+            BitsPerSecond("1Mbps").to_humanreadable(**kwargs)
+
+
+class Test_BitsPerSecond_format_many:
+    @pytest.mark.parametrize(
+        ["values", "kwargs", "expected"],
+        [
+            [
+                [0, 999, 1000, 1.5e9, -2e6],
+                {"style": "short"},
+                ["0.0 bps", "999.0 bps", "1.0 Kbps", "1.5 Gbps", "-2.0 Mbps"],
+            ],
+            [
+                [1000, 1024, 1024**4 * 2],
+                {"base": 1024, "precision": 0},
+                ["1000 bits per second", "1 kibibits per second", "2 tebibits per second"],
+            ],
+            [[], {}, []],
+        ],
+    )
+    def test_normal(self, values, kwargs, expected):
+        assert BitsPerSecond.format_many(values, **kwargs) == expected
+
+    def test_normal_same_as_to_humanreadable(self):
+        values = ["1bps", "100Mbps", "123456 Mbps", "999 Kbps", "10Tbps"]
+
+        assert BitsPerSecond.format_many(
+            [BitsPerSecond(value).bps for value in values], style="short"
+        ) == [BitsPerSecond(value).to_humanreadable(style="short") for value in values]
+
+    def test_exception(self):
+        with pytest.raises(ParameterError) as e:
+            BitsPerSecond.format_many([1], base=10)
+
+        # the KeyError of the table lookup is not chained
+        assert e.value.__cause__ is None
+        assert e.value.__suppress_context__
+
+
+class Test_BitsPerSecond_parse_many:
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["10 Gbps", "1Mbps", "10 Gbps"], BitsPerSecond.Unit.MBPS, [10000, 1, 10000]],
+            [["1Kibps", "1Kbps"], "bps", [1024, 1000]],
+        ],
+    )
+    def test_normal(self, values, unit, expected):
+        assert list(BitsPerSecond.parse_many(values, unit)) == expected
+
+    def test_normal_on_error(self):
+        values = ["1Kbps", "10kb", "2Kbps"]
+        assert list(BitsPerSecond.parse_many(values, "Kbps", on_error="skip")) == [1, 2]
+
+    def test_exception(self):
+        with pytest.raises(UnitNotFoundError):
+            BitsPerSecond.parse_many(["10"], "bps")
+
+
+class Test_BitsPerSecond_iter_parse:
+    def test_normal(self):
+        lines = ["10 Gbps\n", "n/a\n", "512 Mbps\n"]
+        results = BitsPerSecond.iter_parse(lines, BitsPerSecond.Unit.MBPS, on_error="skip")
+
+        assert list(results) == [10000, 512]
+
+
+class Test_BitsPerSecond_memory:
+    @pytest.mark.skipif(
+        platform.python_implementation() != "CPython", reason="object sizes of CPython"
+    )
+    def test_normal_size(self):
+        value = BitsPerSecond("10 Gbps")
+
+        assert not hasattr(value, "__dict__")
+        size = sys.getsizeof(value)
+        assert size <= 64
+
+        # conversions and comparisons do not grow an instance
+        value.mega_bps
+        hash(value)
+        assert sys.getsizeof(value) == size
+
+    def test_normal_pickle(self):
+        value = BitsPerSecond("10 Gbps", default_unit=BitsPerSecond.Unit.BPS)
+        restored = pickle.loads(pickle.dumps(value))
+
+        assert type(restored) is BitsPerSecond
+        assert str(restored) == str(value)
+        assert restored._default_unit == value._default_unit
+
+    def test_normal_pickle_size(self):
+        values = [BitsPerSecond(f"{i} Gibps") for i in range(100)]
+        restored = pickle.loads(pickle.dumps(values))
+
+        assert restored == values
+        assert len(pickle.dumps(values)) < 40 * len(values)
+
+
+class Test_BitsPerSecond_codec:
+    def test_normal(self):
+        values = [BitsPerSecond("10 Gibps"), BitsPerSecond("1.5Kbps"), BitsPerSecond("3 bps")]
+        restored = BitsPerSecond.decode_many(BitsPerSecond.encode_many(values))
+
+        assert [repr(value) for value in restored] == [repr(value) for value in values]
+
+    def test_exception(self):
+        with pytest.raises(ParameterError):
+            BitsPerSecond.encode_many([BitsPerSecond("0.5bps")])
@@ -0,0 +1,156 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from humanreadable import BitsPerSecond, ParameterError, Time, UnitNotFoundError, ValueRange
+
+
+class Test_ValueRange_contains:
+    @pytest.mark.parametrize(
+        ["min_value", "max_value", "value", "expected"],
+        [
+            ["10ms", "5s", "1s", True],
+            ["10ms", "5s", "10ms", True],
+            ["10ms", "5s", "5000ms", True],
+            ["10ms", "5s", "9999us", False],
+            ["10ms", "5s", "5000000001ns", False],
+            ["10ms", "5s", Time("2m"), False],
+            ["10ms", "5s", 0.01, True],
+            ["10ms", "5s", 5, True],
+            ["10ms", "5s", Decimal("5.1"), False],
+            ["10ms", "5s", float("nan"), False],
+            # integers and decimals are compared exactly, as comparison operators do
+            ["100ms", "1s", Decimal("0.1"), True],
+            ["100ms", "1s", Decimal("0.0999999999999999999999"), False],
+            ["0.1s", "1s", Decimal("0.1"), True],
+            [None, "3s", 3, True],
+            [None, "2999999999ns", 3, False],
+            ["10ms", "5s", Decimal("NaN"), False],
+            ["10ms", None, Decimal("Infinity"), True],
+            ["10ms", "5s", Decimal("Infinity"), False],
+            [None, "5s", "-1d", True],
+            ["10ms", None, "100d", True],
+            [Time("1s"), Time("1s"), "1000ms", True],
+        ],
+    )
+    def test_normal(self, min_value, max_value, value, expected):
+        value_range = Time.range(min_value, max_value)
+
+        assert isinstance(value_range, ValueRange)
+        assert (value in value_range) is expected
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["1Mbps", True], ["1Gbps", True], ["1.5Gbps", False], [999, False]],
+    )
+    def test_normal_bps(self, value, expected):
+        assert (value in BitsPerSecond.range("1Kbps", "1Gbps")) is expected
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["1x", UnitNotFoundError],
+            [BitsPerSecond("1bps"), TypeError],
+            [None, TypeError],
+        ],
+    )
+    def test_exception(self, value, expected):
+        with pytest.raises(expected):
+            value in Time.range("10ms", "5s")  # noqa: B015
+
+
+class Test_ValueRange_constructor:
+    def test_normal(self):
+        value_range = Time.range("10ms", "5s")
+
+        assert value_range.min_value == Time("10ms")
+        assert value_range.max_value == Time("5s")
+        assert (
+            repr(value_range) == "ValueRange(Time, min_value=10 milliseconds, max_value=5 seconds)"
+        )
+        assert Time.range().mask(["-1d", "1d"]) == [True, True]
+
+    @pytest.mark.parametrize(
+        ["min_value", "max_value", "expected"],
+        [
+            ["5s", "10ms", ParameterError],
+            [10, None, TypeError],
+            [None, BitsPerSecond("1bps"), TypeError],
+            ["1x", None, UnitNotFoundError],
+        ],
+    )
+    def test_exception(self, min_value, max_value, expected):
+        with pytest.raises(expected):
+            Time.range(min_value, max_value)
+
+
+class Test_ValueRange_validate:
+    @pytest.mark.parametrize(["value"], [["10ms"], [Time("1s")], [0.5]])
+    def test_normal(self, value):
+        Time.range("10ms", "5s").validate(value)
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["1ms", "value is too low"], [Time("1m"), "value is too high"], [60, "value is too high"]],
+    )
+    def test_exception(self, value, expected):
+        with pytest.raises(ParameterError, match=expected):
+            Time.range("10ms", "5s").validate(value)
+
+
+class Test_ValueRange_mask:
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["1ms", "1s", Time("10s"), 0.01], None, [False, True, False, True]],
+            [[5, 10, 5000, 5001, float("nan")], "ms", [False, True, True, False, False]],
+            [[0.01, 5.0], Time.Unit.SECOND, [True, True]],
+            [
+                [Decimal("10"), Decimal("9.999999999999999999"), 5000, "5s"],
+                "ms",
+                [True, False, True, True],
+            ],
+            [[], None, []],
+        ],
+    )
+    def test_normal(self, values, unit, expected):
+        value_range = Time.range("10ms", "5s")
+
+        assert value_range.mask(values, unit) == expected
+        assert value_range.invalid_indices(values, unit) == [
+            i for i, is_valid in enumerate(expected) if not is_valid
+        ]
+
+    @pytest.mark.parametrize(
+        ["value", "unit"],
+        [[Decimal("0.1"), None], [Decimal("100"), "ms"], [100, "ms"], [100000, "us"]],
+    )
+    def test_normal_consistent_with_compare(self, value, unit):
+        value_range = Time.range("100ms", "1s")
+        expected = Time("100ms") <= (value if unit is None else Time.from_value(value, unit))
+
+        assert value_range.mask([value], unit) == [expected]
+        assert value_range.invalid_indices([value], unit) == ([] if expected else [0])
+
+    def test_normal_stream(self):
+        value_range = BitsPerSecond.range(max_value="100Mbps")
+        values = (f"{i}Mbps" for i in range(0, 1000, 50))
+        invalid = value_range.iter_invalid(values)
+
+        assert next(invalid) == 3
+        assert next(invalid) == 4
+        assert value_range.invalid_indices(range(200), unit="Mbps") == list(range(101, 200))
+
+
+class Test_ValueRange_mask_array:
+    def test_normal(self):
+        np = pytest.importorskip("numpy")
+
+        mask = Time.range("10ms", "5s").mask_array(np.array([[5, 10], [5000, np.nan]]), unit="ms")
+
+        assert mask.dtype == np.bool_
+        assert mask.tolist() == [[False, True], [True, False]]
@@ -0,0 +1,126 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import decimal
+import re
+import threading
+
+import pytest
+
+from humanreadable import (
+    BitsPerSecond,
+    Time,
+    disable_instrumentation,
+    disable_parse_cache,
+    enable_instrumentation,
+    enable_parse_cache,
+)
+from humanreadable._common import UnitResolver
+
+
+NUM_THREADS = 16
+
+_TIME_VALUES = [f"{i}.{i % 10}{unit}" for i in range(50) for unit in ["ms", "s", "m", "h", "us"]]
+_TIME_VALUES += ["1h 30m", "-2d 3h", "10s 250ms", "1.5d"]
+_BPS_VALUES = [f"{i} {unit}" for i in range(50) for unit in ["Kbps", "Mibps", "Gbps", "bps"]]
+
+
+def run_threads(target, num_threads=NUM_THREADS):
+    barrier = threading.Barrier(num_threads)
+    results = [None] * num_threads
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            results[index] = target(index)
+        except BaseException as e:  # noqa: B036
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    return results
+
+
+def convert_values(index):
+    # each thread parses the values in a different order
+    offset = index * 7
+    times = _TIME_VALUES[offset:] + _TIME_VALUES[:offset]
+    bitrates = _BPS_VALUES[offset:] + _BPS_VALUES[:offset]
+
+    return (
+        {value: (Time(value).seconds, Time(value).to_humanreadable()) for value in times},
+        {value: BitsPerSecond(value).kilo_bps for value in bitrates},
+        list(Time.parse_many(_TIME_VALUES, "ms")),
+    )
+
+
+@pytest.fixture
+def expected():
+    return convert_values(0)
+
+
+class Test_thread_safety:
+    def test_normal_init(self, expected):
+        assert run_threads(convert_values) == [expected] * NUM_THREADS
+
+    @pytest.mark.parametrize(["intern"], [[False], [True]])
+    def test_normal_parse_cache(self, expected, intern):
+        enable_parse_cache(maxsize=64, intern=intern)
+        try:
+            results = run_threads(convert_values)
+        finally:
+            disable_parse_cache()
+
+        assert results == [expected] * NUM_THREADS
+
+    def test_normal_instrumentation(self):
+        disable_instrumentation()
+        instrumentation = enable_instrumentation()
+        try:
+            run_threads(lambda index: [Time("1s") for _ in range(100)])
+        finally:
+            disable_instrumentation()
+
+        data = instrumentation.as_dict()
+        assert data["parses"] == {"Time": {"seconds": 100 * NUM_THREADS}}
+        assert data["timings"]["parse"]["Time"]["calls"] == 100 * NUM_THREADS
+
+    def test_normal_shared_instances(self):
+        # per-instance comparison keys are filled concurrently
+        values = [Time.from_value(i, "ms") for i in range(500)]
+
+        def convert(index):
+            return [
+                (value.seconds, value.minutes, hash(value), value < values[-1]) for value in values
+            ]
+
+        results = run_threads(convert)
+        assert all(result == results[0] for result in results)
+        assert results[0][1] == (0.001, 0.001 / 60, hash(Time("1ms")), True)
+
+    def test_normal_lazy_compile(self):
+        # regexes of a new resolver are compiled by the first of the concurrent calls
+        resolver = UnitResolver(Time.get_text_units(), re.IGNORECASE)
+
+        results = run_threads(lambda index: [resolver.split(f"{i}ms") for i in range(100)])
+
+        assert all(result == results[0] for result in results)
+        assert results[0][1] == ("1", Time.Unit.MILLISECOND)
+
+    def test_normal_decimal_context(self, expected):
+        # decimal contexts of the callers do not change the results
+        def convert_with_context(index):
+            with decimal.localcontext() as context:
+                context.prec = 2 + index % 4
+                context.rounding = decimal.ROUND_DOWN
+                return convert_values(0)
+
+        assert run_threads(convert_with_context) == [expected] * NUM_THREADS
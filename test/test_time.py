@@ -2,9 +2,19 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import io
+import math
+import pickle
+import platform
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
 import pytest
 
-from humanreadable import ParameterError, Time
+from humanreadable import BitsPerSecond, ParameterError, Time
 
 
 class Test_Time_constructor:
@@ -20,6 +30,10 @@ class Test_Time_constructor:
             ["10kb", ParameterError],
             ["2micro", ParameterError],
             ["two secs", ParameterError],
+            ["1h foo 30m", ParameterError],
+            ["1h30", ParameterError],
+            ["1h -30m", ParameterError],
+            ["1h30q", ParameterError],
         ],
     )
     def test_exception(self, value, exception):
@@ -27,6 +41,47 @@ class Test_Time_constructor:
             Time(value)
 
 
+class Test_Time_unit:
+    @pytest.mark.parametrize(
+        ["unit", "specifier"],
+        [
+            [unit, specifier]
+            for unit, specifiers in Time.get_text_units().items()
+            for specifier in specifiers
+        ],
+    )
+    def test_normal(self, unit, specifier):
+        for value in [f"12{specifier}", f"1.5 {specifier}", f"-3{specifier.upper()}"]:
+            assert Time(value)._from_unit == unit
+
+    @pytest.mark.parametrize(
+        ["unit", "expected"],
+        [
+            ["ms", Time.Unit.MILLISECOND],
+            ["MSECS", Time.Unit.MILLISECOND],
+            ["Minutes", Time.Unit.MINUTE],
+            [" m", Time.Unit.MINUTE],
+            [Time.Unit.HOUR, Time.Unit.HOUR],
+            [None, None],
+        ],
+    )
+    def test_normal_normalize(self, unit, expected):
+        assert Time._normalize_unit(unit) == expected
+
+    def test_normal_aliases(self):
+        # the alias index must be consistent with the unit regexes
+        Time._normalize_unit("s")
+        for alias, unit in Time._UNIT_ALIASES.items():
+            if isinstance(alias, str):
+                assert unit.regexp.match(alias)
+                assert unit.regexp.match(alias.upper())
+
+    @pytest.mark.parametrize(["unit"], [["parsec"], ["mss"], [""], [BitsPerSecond.Unit.GBPS]])
+    def test_exception_normalize(self, unit):
+        with pytest.raises(ValueError):
+            Time._normalize_unit(unit)
+
+
 class Test_Time_repr:
     @pytest.mark.parametrize(
         ["value", "expected"],
@@ -50,6 +105,122 @@ class Test_Time_eq:
     def test_exception(self, lhs, rhs, expected):
         assert (Time(lhs) == Time(rhs)) is expected
 
+    @pytest.mark.parametrize(
+        ["lhs", "rhs", "expected"],
+        [
+            ["1s", 1, True],
+            ["1500ms", 1.5, True],
+            ["1500ms", Decimal("1.5"), True],
+            ["1m", 60, True],
+            ["1s", 2, False],
+            # strings are never equal to values, as their hashes differ
+            ["1s", "1s", False],
+            ["1s", "1000ms", False],
+            ["1s", "abc", False],
+            ["1s", None, False],
+            # floats are compared by their exact binary values, as Fraction and float are
+            ["1ms", 0.001, False],
+            ["100ms", 0.1, False],
+            ["1ms", Decimal("0.001"), True],
+            ["1s", math.nan, False],
+            ["1s", math.inf, False],
+        ],
+    )
+    def test_normal_other_types(self, lhs, rhs, expected):
+        assert (Time(lhs) == rhs) is expected
+        assert (Time(lhs) != rhs) is not expected
+        assert (rhs == Time(lhs)) is expected
+
+    def test_normal_str(self):
+        assert len({Time("1s"), "1s"}) == 2
+        assert Time("1h 30m") == Time("90m")
+
+    def test_normal_float(self):
+        # values from floats keep the shortest decimal representation of the float,
+        # which is not equal to the exact binary value of the float
+        assert Time.from_seconds(0.1) != 0.1
+        assert Time.from_seconds(0.1) == Decimal("0.1")
+        assert Time.from_seconds(0.1).seconds == 0.1
+        assert not Time("100ms") >= 0.1
+        assert Time("100ms") < 0.1
+
+
+class Test_Time_hash:
+    def test_normal(self):
+        assert len({Time("1s"), Time("1000ms"), Time("1000000us"), Time("2s")}) == 2
+        assert {Time("60s"): "minute"}[Time("1m")] == "minute"
+
+    @pytest.mark.parametrize(
+        ["value", "number"],
+        [
+            ["1s", 1],
+            ["1500ms", 1.5],
+            ["1us", Decimal("0.000001")],
+            ["2h", 7200],
+            ["-1.5ms", Decimal("-0.0015")],
+            ["0.5ns", Fraction(1, 2 * 10**9)],
+        ],
+    )
+    def test_normal_number(self, value, number):
+        assert hash(Time(value)) == hash(number)
+
+    @pytest.mark.parametrize(
+        ["value", "number"],
+        [
+            ["1ms", 0.001],
+            ["100ms", 0.1],
+            ["0.1s", 0.1],
+            ["1.5s", 1.5],
+            ["1ms", Decimal("0.001")],
+            ["1s", 1],
+        ],
+    )
+    def test_normal_consistent_with_eq(self, value, number):
+        # equal objects must have equal hashes
+        value = Time(value)
+        assert (value == number) is (hash(value) == hash(number))
+
+
+class Test_Time_compare:
+    @pytest.mark.parametrize(
+        ["lhs", "rhs", "expected"],
+        [
+            ["999ms", "1s", True],
+            ["1s", "999ms", False],
+            ["1s", "1000ms", False],
+            ["-1h", "1us", True],
+            ["59.999s", "1m", True],
+        ],
+    )
+    def test_normal(self, lhs, rhs, expected):
+        assert (Time(lhs) < Time(rhs)) is expected
+        assert (Time(rhs) > Time(lhs)) is expected
+        assert (Time(lhs) >= Time(rhs)) is not expected
+        assert (Time(rhs) <= Time(lhs)) is not expected
+
+    def test_normal_sort(self):
+        values = [Time("1h"), Time("30s"), Time("2m"), Time("500ms"), Time("0.5h")]
+
+        assert [repr(value) for value in sorted(values)] == [
+            "500 milliseconds",
+            "30 seconds",
+            "2 minutes",
+            "0.5 hours",
+            "1 hours",
+        ]
+        assert max(values) == Time("60m")
+
+    def test_normal_other_types(self):
+        assert Time("1500ms") > 1
+        assert Time("1500ms") <= 1.5
+        assert Time("1s") < "2s"
+        assert Time("1m") >= "60s"
+
+    @pytest.mark.parametrize(["rhs"], [[None], [object()], ["abc"], [True]])
+    def test_exception(self, rhs):
+        with pytest.raises(TypeError):
+            Time("1s") < rhs
+
 
 class Test_Time_add:
     @pytest.mark.parametrize(
@@ -62,6 +233,165 @@ class Test_Time_add:
     def test_exception(self, lhs, rhs, expected):
         assert (Time(lhs) + Time(rhs)) == Time(expected)
 
+    def test_normal_sum(self):
+        assert sum([Time("1s"), Time("250ms"), Time("1m")]) == Time("61.25s")
+
+    @pytest.mark.parametrize(["rhs"], [[1], ["1s"], [None]])
+    def test_exception_type(self, rhs):
+        with pytest.raises(TypeError):
+            Time("1s") + rhs
+
+
+class Test_Time_arithmetic:
+    @pytest.mark.parametrize(
+        ["result", "expected"],
+        [
+            [Time("1m") - Time("30s"), Time("30s")],
+            [Time("1s") - Time("1500ms"), Time("-500ms")],
+            [Time("250ms") * 4, Time("1s")],
+            [2 * Time("1.5h"), Time("3h")],
+            [Time("1s") * 0.5, Time("500ms")],
+            [Time("1s") * Decimal("0.001"), Time("1ms")],
+            [Time("1m") / 4, Time("15s")],
+            [-Time("1s"), Time("-1s")],
+            [abs(Time("-1h30m")), Time("90m")],
+        ],
+    )
+    def test_normal(self, result, expected):
+        assert isinstance(result, Time)
+        assert result == expected
+
+    def test_normal_unit(self):
+        # the unit of the left operand is kept
+        assert repr(Time("1s") + Time("500ms")) == "1.5 seconds"
+        assert repr(Time("1h") * 2) == "2 hours"
+
+    @pytest.mark.parametrize(
+        ["lhs", "rhs", "expected"],
+        [
+            ["1m", "30s", 2],
+            ["250ms", "1s", 0.25],
+            ["-1h", "30m", -2],
+        ],
+    )
+    def test_normal_ratio(self, lhs, rhs, expected):
+        assert Time(lhs) / Time(rhs) == expected
+
+    @pytest.mark.parametrize(
+        ["operation", "expected"],
+        [
+            [lambda: Time("1s") - 1, TypeError],
+            [lambda: Time("1s") * Time("1s"), TypeError],
+            [lambda: Time("1s") * "2", TypeError],
+            [lambda: 1 / Time("1s"), TypeError],
+            [lambda: Time("1s") / 0, ZeroDivisionError],
+            [lambda: Time("1s") / Time("0s"), ZeroDivisionError],
+            [lambda: Time("1s") * math.nan, ParameterError],
+        ],
+    )
+    def test_exception(self, operation, expected):
+        with pytest.raises(expected):
+            operation()
+
+
+class Test_Time_sum:
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["1s", "250ms", "1m"], None, "61.25s"],
+            [["1s", "250ms", "1m"], "ms", "61250ms"],
+            [["1h", "-30m"], Time.Unit.MINUTE, "30m"],
+            [[], None, "0s"],
+            [[], "ms", "0ms"],
+        ],
+    )
+    def test_normal(self, values, unit, expected):
+        result = Time.sum((Time(value) for value in values), unit=unit)
+
+        assert result == Time(expected)
+        assert result._from_unit == Time(expected)._from_unit
+
+    def test_normal_many(self):
+        values = [Time.from_milliseconds(i) for i in range(100000)]
+
+        assert Time.sum(values).seconds == sum(range(100000)) / 1000
+
+    @pytest.mark.parametrize(["values"], [[[Time("1s"), 1]], [[Time("1s"), "1s"]]])
+    def test_exception(self, values):
+        with pytest.raises(TypeError):
+            Time.sum(values)
+
+
+class Test_Time_from_value:
+    @pytest.mark.parametrize(
+        ["number", "unit", "expected"],
+        [
+            [90, "s", Time("90s")],
+            [1.5, Time.Unit.MINUTE, Time("90 seconds")],
+            [Decimal("0.25"), "ms", Time("250us")],
+            [-2, "hours", Time("-2h")],
+        ],
+    )
+    def test_normal(self, number, unit, expected):
+        assert Time.from_value(number, unit) == expected
+
+    @pytest.mark.parametrize(
+        ["method", "number", "expected"],
+        [
+            [Time.from_days, 1, "1d"],
+            [Time.from_hours, 1.5, "1.5h"],
+            [Time.from_minutes, 3, "3m"],
+            [Time.from_seconds, 0.1, "0.1s"],
+            [Time.from_milliseconds, 250, "250ms"],
+            [Time.from_ms, 250, "250ms"],
+            [Time.from_microseconds, 10, "10us"],
+            [Time.from_us, 10, "10us"],
+            [Time.from_nanoseconds, 10, "10ns"],
+            [Time.from_ns, 10, "10ns"],
+            [Time.from_ns, 2.5, "2.5ns"],
+        ],
+    )
+    def test_normal_named(self, method, number, expected):
+        value = method(number)
+
+        assert isinstance(value, Time)
+        assert repr(value) == repr(Time(expected))
+
+    def test_normal_float(self):
+        # floats keep the shortest representation as well as parsed strings
+        assert Time.from_seconds(0.1)._number == Decimal("0.1")
+
+    @pytest.mark.parametrize(
+        ["number", "unit", "expected"],
+        [
+            ["1", "s", TypeError],
+            [None, "s", TypeError],
+            [True, "s", TypeError],
+            [math.nan, "s", ParameterError],
+            [math.inf, "s", ParameterError],
+            [1, None, ParameterError],
+            [1, "parsec", ValueError],
+        ],
+    )
+    def test_exception(self, number, unit, expected):
+        with pytest.raises(expected):
+            Time.from_value(number, unit)
+
+
+class Test_Time_compound:
+    @pytest.mark.parametrize(
+        ["value", "expected_repr"],
+        [
+            ["1h 30m 15s 250ms", "5415250 milliseconds"],
+            ["1.5h20m", "110 minutes"],
+            ["1.25h 0.50m", "75.5 minutes"],
+            ["1.5s 500ms", "2000 milliseconds"],
+            ["30m 1h", "90 minutes"],
+        ],
+    )
+    def test_normal(self, value, expected_repr):
+        assert repr(Time(value)) == expected_repr
+
 
 class Test_Time_days:
     @pytest.mark.parametrize(
@@ -121,6 +451,14 @@ class Test_Time_seconds:
             ["12min 40sec", 760],
             ["12 minutes 40 seconds", 760],
             ["1 hour 12 minutes 40 seconds", 4360],
+            ["1h 30m 15s 250ms", 5415.25],
+            ["1.5h20m", 6600],
+            ["1m30s500ms", 90.5],
+            ["500ms1s", 1.5],
+            ["1ms1s", 1.001],
+            ["1 us", 0.000001],
+            ["-1h30m", -5400],
+            [" 2d 1h ", 176400],
         ],
     )
     def test_normal(self, value, expected):
@@ -139,6 +477,54 @@ class Test_Time_seconds:
         assert Time(value, default_unit=default_unit).seconds == expected
 
 
+class Test_Time_coef:
+    @pytest.mark.parametrize(
+        ["from_unit", "to_unit", "expected"],
+        [
+            [Time.Unit.DAY, Time.Unit.MICROSECOND, Decimal(86400000000)],
+            [Time.Unit.MILLISECOND, Time.Unit.SECOND, Decimal("0.001")],
+            [Time.Unit.MICROSECOND, Time.Unit.SECOND, Decimal("0.000001")],
+            [Time.Unit.SECOND, Time.Unit.SECOND, Decimal(1)],
+        ],
+    )
+    def test_normal(self, from_unit, to_unit, expected):
+        assert Time._calc_coef(from_unit, to_unit) == expected
+
+    def test_normal_table(self):
+        assert len(Time._COEF_TABLE) == len(Time.get_text_units())
+        with pytest.raises(TypeError):
+            Time._COEF_TABLE[Time.Unit.SECOND][Time.Unit.DAY] = Decimal(1)  # type: ignore
+
+    def test_normal_repeated(self):
+        value = Time("90s")
+
+        assert value.minutes == 1.5
+        assert value.minutes == 1.5
+        assert value.get_as("m") == 1.5
+
+    @pytest.mark.parametrize(
+        ["value", "unit", "expected"],
+        [
+            ["1s", "h", 1 / 3600],
+            ["1 days", "us", 86400000000.0],
+            [
+                "123456789012345678.123456 days",
+                "s",
+                float(Fraction("123456789012345678.123456") * 86400),
+            ],
+            ["0.000001s", "d", 1 / 86400000000],
+            ["2.5 h", "us", 9000000000.0],
+        ],
+    )
+    def test_normal_correctly_rounded(self, value, unit, expected):
+        assert Time(value).get_as(unit) == expected
+
+    def test_normal_decimal_context(self):
+        with localcontext() as ctx:
+            ctx.prec = 3
+            assert Time("123456789s").minutes == 123456789 / 60
+
+
 class Test_Time_milliseconds:
     @pytest.mark.parametrize(
         ["value", "expected"],
@@ -177,6 +563,89 @@ class Test_Time_microseconds:
         assert Time(value).microseconds == expected
 
 
+class Test_Time_nanoseconds:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["1s", 1000000000],
+            ["1.5us", 1500],
+            ["123 nsecs", 123],
+            ["0.5ns", 0.5],
+            ["1h 1ns", 3600000000001],
+        ],
+    )
+    def test_normal(self, value, expected):
+        assert Time(value).nanoseconds == expected
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["1s", 1000000000],
+            ["123456789012345678 days", 123456789012345678 * 86400 * 10**9],
+            ["-1.5us", -1500],
+            ["1.5ns", 2],
+            ["2.5ns", 2],
+        ],
+    )
+    def test_normal_total_ns(self, value, expected):
+        total = Time(value).total_ns()
+
+        assert type(total) is int
+        assert total == expected
+
+    def test_normal_perf_counter_ns(self):
+        value = Time.from_ns(1234567)
+
+        assert value == Time("1.234567ms")
+        assert value.total_ns() == 1234567
+        assert repr(value) == "1234567 nanoseconds"
+
+
+class Test_Time_timedelta:
+    @pytest.mark.parametrize(
+        ["delta", "expected"],
+        [
+            [timedelta(0), "0 seconds"],
+            [timedelta(seconds=1.5), "1.5 seconds"],
+            [timedelta(days=3, seconds=5, microseconds=7), "259205.000007 seconds"],
+            [timedelta(minutes=-1), "-60 seconds"],
+            [timedelta.max, "86399999999999.999999 seconds"],
+        ],
+    )
+    def test_normal_from_timedelta(self, delta, expected):
+        value = Time.from_timedelta(delta)
+
+        assert repr(value) == expected
+        assert value.to_timedelta() == delta
+        assert value.total_ns() == (delta // timedelta(microseconds=1)) * 1000
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["1d 2h", timedelta(days=1, hours=2)],
+            ["1.5us", timedelta(microseconds=2)],
+            ["2500ns", timedelta(microseconds=2)],
+            ["-1ns", timedelta(0)],
+            ["123456789012.345678 s", timedelta(seconds=123456789012, microseconds=345678)],
+        ],
+    )
+    def test_normal_to_timedelta(self, value, expected):
+        assert Time(value).to_timedelta() == expected
+
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["1000000000d", OverflowError]],
+    )
+    def test_exception_to_timedelta(self, value, expected):
+        with pytest.raises(expected):
+            Time(value).to_timedelta()
+
+    @pytest.mark.parametrize(["delta"], [[1], ["1s"], [Time("1s")]])
+    def test_exception_from_timedelta(self, delta):
+        with pytest.raises(TypeError):
+            Time.from_timedelta(delta)
+
+
 class Test_Time_validate:
     @pytest.mark.parametrize(
         ["value", "min_value", "max_value"],
@@ -217,7 +686,9 @@ class Test_Time_get_as:
             ["2", Time.Unit.MINUTE, 2],
             ["2", Time.Unit.SECOND, 2],
             ["2", Time.Unit.MILLISECOND, 2],
+            ["2", "ms", 2],
             ["2", Time.Unit.MICROSECOND, 2],
+            ["2", "us", 2],
         ],
     )
     def test_normal_default_unit(self, value, default_unit, expected):
@@ -236,3 +707,280 @@ class Test_Time_to_humanreadable:
     )
     def test_normal_default_unit(self, value, default_unit, style, expected):
         assert Time(value, default_unit=default_unit).to_humanreadable(style=style) == expected
+
+    @pytest.mark.parametrize(
+        ["value", "style", "expected"],
+        [
+            ["-1h 30m", "full", "-1 hours 30 minutes"],
+            ["-90s", "short", "-1m 30s"],
+            ["1.5ms", "full", "1 milliseconds 500 microseconds"],
+            ["0.5us", "full", "500 nanoseconds"],
+            # sub-microsecond values include nanoseconds, which the formats did not before
+            ["1.5us", "full", "1 microseconds 500 nanoseconds"],
+            ["1.5us", "short", "1m 500n"],
+            ["1ms 1ns", "full", "1 milliseconds 1 nanoseconds"],
+            ["1s 2.5ns", "short", "1s 2n"],
+            ["0.5ns", "full", "0 nanoseconds"],
+            ["1d 1us", "abbr", "1d 1m"],
+            ["2m", "compact", "2minutes"],
+            ["100000000000000000000s", "short", "1157407407407407d 9h 46m 40s"],
+        ],
+    )
+    def test_normal(self, value, style, expected):
+        assert Time(value).to_humanreadable(style=style) == expected
+
+
+class Test_Time_format_many:
+    def test_normal(self):
+        values = [Time("90m"), Time("5400s"), Time("0ms"), Time("-1.5s"), Time("90m")]
+
+        assert Time.format_many(values) == [
+            "1 hours 30 minutes",
+            "1 hours 30 minutes",
+            "0 milliseconds",
+            "-1 seconds 500 milliseconds",
+            "1 hours 30 minutes",
+        ]
+        assert Time.format_many(values, style="short") == [
+            value.to_humanreadable(style="short") for value in values
+        ]
+        assert Time.format_many([]) == []
+
+    @pytest.mark.parametrize(["value"], [["90m"], [5400], [None]])
+    def test_exception(self, value):
+        with pytest.raises(TypeError):
+            Time.format_many([Time("1s"), value])
+
+
+class Test_Time_parse_many:
+    @pytest.mark.parametrize(
+        ["values", "unit", "expected"],
+        [
+            [["1s", "250ms", "1s", "1h 30m"], "ms", [1000, 250, 1000, 5400000]],
+            [["1s", "250ms"], Time.Unit.SECOND, [1, 0.25]],
+            [iter(["2m", "2m"]), "seconds", [120, 120]],
+            [[], "s", []],
+        ],
+    )
+    def test_normal(self, values, unit, expected):
+        assert list(Time.parse_many(values, unit)) == expected
+
+    def test_normal_default_unit(self):
+        assert list(Time.parse_many(["2", "3s"], "s", default_unit="minutes")) == [120, 3]
+
+    @pytest.mark.parametrize(
+        ["on_error", "expected"],
+        [
+            ["skip", [1, 2]],
+            ["nan", [1, math.nan, 2, math.nan, math.nan]],
+        ],
+    )
+    def test_normal_on_error(self, on_error, expected):
+        values = ["1s", "two secs", "2s", None, "two secs"]
+        results = Time.parse_many(values, "s", on_error=on_error)
+
+        assert len(results) == len(expected)
+        for result, expected_value in zip(results, expected):
+            if math.isnan(expected_value):
+                assert math.isnan(result)
+            else:
+                assert result == expected_value
+
+    @pytest.mark.parametrize(
+        ["values", "unit", "on_error", "expected"],
+        [
+            [["1s", "two secs"], "s", "raise", ParameterError],
+            [["1s", None], "s", "raise", TypeError],
+            [["1s"], "s", "ignore", ParameterError],
+            [["1s"], "parsec", "raise", ValueError],
+        ],
+    )
+    def test_exception(self, values, unit, on_error, expected):
+        with pytest.raises(expected):
+            Time.parse_many(values, unit, on_error=on_error)
+
+    @pytest.mark.parametrize(
+        ["workers", "chunksize"],
+        [
+            [2, None],
+            [2, 3],
+            [3, 100],
+        ],
+    )
+    def test_normal_workers(self, workers, chunksize):
+        values = [f"{i}ms" for i in range(50)] + ["1h 30m", "bad", "2"]
+        expected = Time.parse_many(values, "s", default_unit="s", on_error="nan")
+
+        results = Time.parse_many(
+            values, "s", default_unit="s", on_error="nan", workers=workers, chunksize=chunksize
+        )
+
+        assert results.tobytes() == expected.tobytes()
+
+    def test_normal_executor(self):
+        values = [f"{i}s" for i in range(10)] + ["bad"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = Time.parse_many(values, "ms", on_error="skip", executor=executor, chunksize=4)
+
+        assert list(results) == [i * 1000 for i in range(10)]
+
+    @pytest.mark.parametrize(
+        ["values", "unit", "kwargs", "expected"],
+        [
+            [["1s", "two secs"], "s", {"workers": 2}, ParameterError],
+            [["1s"], "parsec", {"workers": 2}, ValueError],
+            [["1s"], "s", {"workers": 0}, ParameterError],
+            [["1s"], "s", {"workers": 2, "chunksize": 0}, ParameterError],
+        ],
+    )
+    def test_exception_workers(self, values, unit, kwargs, expected):
+        with pytest.raises(expected):
+            Time.parse_many(values, unit, **kwargs)
+
+
+class Test_Time_iter_parse:
+    def test_normal(self):
+        lines = io.StringIO("250ms\n1s\n  1h 30m \n250ms\n")
+        results = Time.iter_parse(lines, "ms")
+
+        assert not isinstance(results, list)
+        assert list(results) == [250, 1000, 5400000, 250]
+
+    def test_normal_with_index(self):
+        results = Time.iter_parse(["1s", "bad", "2s"], "s", on_error="skip", with_index=True)
+        assert list(results) == [(0, 1), (2, 2)]
+
+    def test_normal_on_error_nan(self):
+        results = list(Time.iter_parse(["1s", "bad", None], "s", on_error="nan"))
+
+        assert results[0] == 1
+        assert math.isnan(results[1])
+        assert math.isnan(results[2])
+
+    def test_normal_on_error_callable(self):
+        errors = []
+        values = ["1s", "bad", "2s", "bad"]
+        results = Time.iter_parse(values, "s", on_error=lambda *args: errors.append(args))
+
+        assert list(results) == [1, 2]
+        assert [(index, value) for index, value, _ in errors] == [(1, "bad"), (3, "bad")]
+        assert all(isinstance(e, ParameterError) for _, _, e in errors)
+
+    def test_normal_lazy(self):
+        def lines():
+            yield "1s"
+            raise RuntimeError()
+
+        results = Time.iter_parse(lines(), "s")
+
+        assert next(results) == 1
+        with pytest.raises(RuntimeError):
+            next(results)
+
+    def test_normal_unbounded(self):
+        results = Time.iter_parse((f"{i}s" for i in range(5000)), "ms")
+        assert sum(results) == sum(range(5000)) * 1000
+
+    def test_exception(self):
+        results = Time.iter_parse(["1s", "bad"], "s")
+
+        assert next(results) == 1
+        with pytest.raises(ParameterError):
+            next(results)
+
+        with pytest.raises(ParameterError):
+            list(Time.iter_parse(["1s"], "s", on_error="ignore"))
+
+
+class Test_Time_memory:
+    @pytest.mark.skipif(
+        platform.python_implementation() != "CPython", reason="object sizes of CPython"
+    )
+    def test_normal_size(self):
+        value = Time("10s")
+
+        assert not hasattr(value, "__dict__")
+        size = sys.getsizeof(value)
+        assert size <= 64
+
+        # conversions and comparisons do not grow an instance
+        value.seconds
+        hash(value)
+        assert sys.getsizeof(value) == size
+
+    def test_normal_pickle(self):
+        value = Time("10s", default_unit=Time.Unit.SECOND)
+        restored = pickle.loads(pickle.dumps(value))
+
+        assert type(restored) is Time
+        assert str(restored) == str(value)
+        assert restored._default_unit == value._default_unit
+
+    @pytest.mark.parametrize(
+        ["value", "default_unit"],
+        [
+            ["1.50h", None],
+            ["-0.001us", Time.Unit.SECOND],
+            ["12345678901234567890123456789012.5s", None],
+            ["1h 30m", "ms"],
+        ],
+    )
+    def test_normal_pickle_exact(self, value, default_unit):
+        value = Time(value, default_unit=default_unit)
+        restored = pickle.loads(pickle.dumps(value))
+
+        assert repr(restored) == repr(value)
+        assert restored == value
+        assert restored._default_unit is value._default_unit
+
+    def test_normal_pickle_size(self):
+        value = Time("1.5h", default_unit="s")
+
+        # neither Decimal nor unit objects with regexes are pickled
+        assert len(pickle.dumps(value)) < 120
+        assert b"Decimal" not in pickle.dumps(value)
+        assert b"TimeUnit" not in pickle.dumps(value)
+
+
+class Test_Time_codec:
+    def test_normal(self):
+        values = [Time("1.5h"), Time("250ms"), Time("-3us"), Time("1h 30m"), Time("0s")]
+        data = Time.encode_many(values)
+        restored = Time.decode_many(data)
+
+        assert len(data) == 9 * len(values)
+        assert data[:9] == (5_400_000_000_000).to_bytes(8, "little", signed=True) + bytes([1])
+        assert restored == values
+        assert [repr(value) for value in restored] == [repr(value) for value in values]
+        assert Time.decode_many(memoryview(bytearray(data))) == values
+        assert Time.decode_many(Time.encode_many([])) == []
+
+    def test_normal_generator(self):
+        values = Time.decode_many(Time.encode_many(Time.from_ms(i) for i in range(1000)))
+
+        assert [value.milliseconds for value in values] == list(range(1000))
+
+    def test_normal_coarser_unit(self):
+        # a key that is not a multiple of the unit of the record
+        data = (90_000_000_000).to_bytes(8, "little", signed=True) + bytes([2])
+
+        assert repr(Time.decode_many(data)[0]) == "1.5 minutes"
+
+    @pytest.mark.parametrize(
+        ["values", "expected"],
+        [
+            [[Time("0.5ns")], ParameterError],
+            [[Time("300000d")], ParameterError],
+            [["1s"], TypeError],
+            [[BitsPerSecond("1bps")], TypeError],
+        ],
+    )
+    def test_exception_encode(self, values, expected):
+        with pytest.raises(expected):
+            Time.encode_many(values)
+
+    @pytest.mark.parametrize(["data"], [[b"\x00" * 8], [b"\x00" * 8 + b"\x07"]])
+    def test_exception_decode(self, data):
+        with pytest.raises(ParameterError):
+            Time.decode_many(data)